@@ -0,0 +1,169 @@
+"""
+Transactional bulk endpoints for the admin screens.
+
+    POST   /api/<resource>/bulk/     [{...}, ...]                  bulk_create
+    PATCH  /api/<resource>/bulk/     [{"id": 1, ...}, ...]         bulk_update
+    DELETE /api/<resource>/bulk/     {"ids": [1, 2, ...]}          DELETE ... IN
+    POST   /api/<resource>/reorder/  {"ids": [3, 1, 2]}            UPDATE ... CASE
+
+Every item is validated with the viewset's serializer first. If any item is
+invalid nothing is written and the response is a 400 whose body lists one
+error dict per item (empty for valid items), in request order. Otherwise the
+whole batch is written in one transaction. Cache generations, snapshots and
+the search index are invalidated once per batch (api/signals.py) rather than
+once per row.
+
+Bodies are JSON or MessagePack; file fields still go through the per-object
+endpoints.
+"""
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, Value, When
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import JSONParser
+from rest_framework.response import Response
+
+from core.slugs import MAX_ATTEMPTS, allocate_slugs
+from .parsers import MessagePackParser
+from .signals import batched_invalidation, record_changed, record_saved
+
+BULK_PARSERS = [JSONParser, MessagePackParser]
+
+
+def _auto_now_fields(model):
+    """bulk_update() and update() skip auto_now; callers set these so ETags move."""
+    return [f.name for f in model._meta.concrete_fields if getattr(f, 'auto_now', False)]
+
+
+def _ids(data, key='ids'):
+    ids = data.get(key) if isinstance(data, dict) else None
+    if not isinstance(ids, list) or not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids):
+        raise ValidationError({key: ['Expected a list of integer ids.']})
+    if len(ids) > settings.BULK_MAX_ITEMS:
+        raise ValidationError({key: [f'At most {settings.BULK_MAX_ITEMS} ids per request.']})
+    return ids
+
+
+class BulkMixin:
+    """Add /bulk/ create, update and delete actions to a ModelViewSet."""
+
+    def get_bulk_items(self):
+        items = self.request.data
+        if not isinstance(items, list) or not items:
+            raise ValidationError({'non_field_errors': ['Expected a non-empty list of items.']})
+        if len(items) > settings.BULK_MAX_ITEMS:
+            raise ValidationError({'non_field_errors': [f'At most {settings.BULK_MAX_ITEMS} items per request.']})
+        return items
+
+    @action(detail=False, methods=['post', 'patch', 'delete'], url_path='bulk', parser_classes=BULK_PARSERS)
+    def bulk(self, request):
+        if request.method == 'POST':
+            return self.bulk_create(request)
+        if request.method == 'PATCH':
+            return self.bulk_update(request)
+        return self.bulk_destroy(request)
+
+    def bulk_create(self, request):
+        serializer = self.get_serializer(data=self.get_bulk_items(), many=True)
+        serializer.is_valid(raise_exception=True)
+        model = self.get_queryset().model
+        objs = [model(**data) for data in serializer.validated_data]
+
+        needs_slug = [obj for obj in objs if hasattr(obj, 'slug_source') and not obj.slug]
+        for attempt in range(MAX_ATTEMPTS):
+            texts = [getattr(obj, obj.slug_source) for obj in needs_slug]
+            for obj, slug in zip(needs_slug, allocate_slugs(model, texts)):
+                obj.slug = slug
+            try:
+                with transaction.atomic(), batched_invalidation():
+                    model.objects.bulk_create(objs)
+                    record_saved(model, objs)
+                break
+            except IntegrityError as exc:
+                # A concurrent save can take an allocated slug; explicit
+                # duplicates will fail again and are reported below
+                if not needs_slug or attempt == MAX_ATTEMPTS - 1:
+                    raise ValidationError({'non_field_errors': [f'Could not save: {exc}']})
+        return Response(self.get_serializer(objs, many=True).data, status=status.HTTP_201_CREATED)
+
+    def bulk_update(self, request):
+        items = self.get_bulk_items()
+        if not all(isinstance(item, dict) for item in items):
+            raise ValidationError({'non_field_errors': ['Expected a list of objects.']})
+        instances = self.get_queryset().in_bulk([item.get('id') for item in items if isinstance(item.get('id'), int)])
+
+        errors, serializers = [], []
+        for item in items:
+            instance = instances.get(item.get('id'))
+            if instance is None:
+                errors.append({'id': ['Not found.']})
+                continue
+            serializer = self.get_serializer(instance, data=item, partial=True)
+            errors.append({} if serializer.is_valid() else serializer.errors)
+            serializers.append(serializer)
+        if any(errors):
+            raise ValidationError(errors)
+
+        model = self.get_queryset().model
+        fields = set()
+        objs = []
+        for serializer in serializers:
+            data = dict(serializer.validated_data)
+            # Keep the existing slug when the client sends a blank one
+            if 'slug' in data and not data['slug']:
+                del data['slug']
+            for name, value in data.items():
+                setattr(serializer.instance, name, value)
+            fields.update(data)
+            objs.append(serializer.instance)
+        now = timezone.now()
+        for name in _auto_now_fields(model):
+            for obj in objs:
+                setattr(obj, name, now)
+            fields.add(name)
+
+        try:
+            with transaction.atomic(), batched_invalidation():
+                model.objects.bulk_update(objs, sorted(fields))
+                record_saved(model, objs)
+        except IntegrityError as exc:
+            raise ValidationError({'non_field_errors': [f'Could not save: {exc}']})
+        return Response(self.get_serializer(objs, many=True).data)
+
+    def bulk_destroy(self, request):
+        ids = _ids(request.data)
+        with transaction.atomic(), batched_invalidation():
+            _, per_model = self.get_queryset().filter(pk__in=ids).delete()
+        label = self.get_queryset().model._meta.label
+        return Response({'deleted': per_model.get(label, 0)})
+
+
+class ReorderMixin:
+    """Add a /reorder/ action that rewrites `order_field` in one UPDATE."""
+    order_field = 'order'
+
+    @action(detail=False, methods=['post'], parser_classes=BULK_PARSERS)
+    def reorder(self, request):
+        ids = _ids(request.data)
+        if len(set(ids)) != len(ids):
+            raise ValidationError({'ids': ['Each id may appear only once.']})
+        queryset = self.get_queryset()
+        model = queryset.model
+        missing = set(ids) - set(queryset.filter(pk__in=ids).values_list('pk', flat=True))
+        if missing:
+            raise ValidationError({'ids': [f"Not found: {', '.join(map(str, sorted(missing)))}"]})
+
+        changes = {self.order_field: Case(
+            *[When(pk=pk, then=Value(position)) for position, pk in enumerate(ids)],
+            output_field=models.IntegerField(),
+        )}
+        now = timezone.now()
+        for name in _auto_now_fields(model):
+            changes[name] = now
+        with transaction.atomic(), batched_invalidation():
+            updated = queryset.filter(pk__in=ids).update(**changes)
+            record_changed(model)
+        return Response({'updated': updated})
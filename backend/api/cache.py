@@ -0,0 +1,200 @@
+"""
+Response cache for the public read endpoints.
+
+Every cached response is keyed on a per-model "generation" number. Saving or
+deleting a row bumps the generation for its model once the write commits (see
+api/signals.py), which makes every cached response for that model unreachable
+at once - no key scans or pattern deletes are needed.
+
+Response bodies may live in a per-worker cache, but the generations must be
+the same in every worker, so they are kept in the shared cache
+(API_SHARED_CACHE_ALIAS: Redis, or a database table without REDIS_URL).
+"""
+import functools
+import hashlib
+import threading
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.response import Response
+
+HITS_KEY = 'api:stats:hits'
+MISSES_KEY = 'api:stats:misses'
+
+# Process-local singleton rows: label -> (generation, instance)
+_singletons = {}
+_singletons_lock = threading.Lock()
+
+
+def get_cache():
+    """Return the cache backend used for API responses."""
+    return caches[getattr(settings, 'API_CACHE_ALIAS', 'default')]
+
+
+def get_shared_cache():
+    """Return the cache backend every worker sees (see module docstring)."""
+    alias = getattr(settings, 'API_SHARED_CACHE_ALIAS', None)
+    return caches[alias] if alias else get_cache()
+
+
+def _generation_key(label):
+    return f'api:gen:{label}'
+
+
+def get_generations(labels):
+    """Current generations for model labels, fetched in one cache round trip."""
+    cache = get_shared_cache()
+    keys = {_generation_key(label): label for label in labels}
+    found = cache.get_many(keys)
+    missing = [key for key in keys if key not in found]
+    if missing:
+        # Seed with a timestamp so an evicted generation never comes back at
+        # a value that older cached responses were stored under.
+        for key in missing:
+            cache.add(key, time.time_ns(), timeout=None)
+        found.update(cache.get_many(missing))
+    return {keys[key]: generation for key, generation in found.items()}
+
+
+def get_generation(label):
+    """Current generation for a model label, e.g. 'core.notice'."""
+    return get_generations([label])[label]
+
+
+def bump_generation(label):
+    """Invalidate every cached response built from the given model."""
+    # A fresh timestamp rather than incr(): the database cache increments
+    # with a read and a write, so two concurrent bumps could both land on
+    # the same next value.
+    get_shared_cache().set(_generation_key(label), time.time_ns(), timeout=None)
+
+
+def _incr(key):
+    cache = get_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+
+def get_stats():
+    """Hit/miss counters for the response cache."""
+    cache = get_cache()
+    hits = cache.get(HITS_KEY) or 0
+    misses = cache.get(MISSES_KEY) or 0
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else 0.0,
+    }
+
+
+def reset_stats():
+    get_cache().delete_many([HITS_KEY, MISSES_KEY])
+
+
+def build_cache_key(request, labels, *parts):
+    """
+    Build a response cache key.
+
+    The key covers the model generations, the host (serializers build absolute
+    media and pagination URLs from it) and every query param, so filters such
+    as ?category=, ?status=, ?is_featured=, ?page= and ?all= are all distinct.
+    """
+    generations = [f'{label}@{generation}' for label, generation in sorted(get_generations(labels).items())]
+    query = urlencode(sorted(
+        (k, v) for k, values in request.query_params.lists() for v in values
+    ))
+    raw = '|'.join([*generations, *map(str, parts), request.get_host(), query])
+    return f'api:resp:{hashlib.md5(raw.encode()).hexdigest()}'
+
+
+def cached_response(request, key, handler, timeout=None):
+    """Serve response data from cache, or call handler() and store its data."""
+    cache = get_cache()
+    data = cache.get(key)
+    if data is not None:
+        _incr(HITS_KEY)
+        return Response(data)
+
+    _incr(MISSES_KEY)
+    response = handler()
+    if response.status_code == 200:
+        if timeout is None:
+            timeout = getattr(settings, 'API_CACHE_TIMEOUT', 300)
+        cache.set(key, response.data, timeout)
+    return response
+
+
+def cached_action(func):
+    """Cache a GET viewset action (e.g. `featured`) like list/retrieve."""
+    @functools.wraps(func)
+    def wrapper(self, request, *args, **kwargs):
+        return self.get_cached_response(
+            request, lambda: func(self, request, *args, **kwargs)
+        )
+    return wrapper
+
+
+class CachedResponseMixin:
+    """
+    Cache list, retrieve and any @cached_action GET responses of a viewset.
+
+    Responses are invalidated when the viewset's model (or any model in
+    `cache_models`) is saved or deleted.
+    """
+    cache_models = ()
+    cache_timeout = None
+
+    def get_cache_labels(self):
+        models = (self.get_queryset().model, *self.cache_models)
+        return sorted({model._meta.label_lower for model in models})
+
+    def get_cached_response(self, request, handler):
+        if request.method != 'GET':
+            return handler()
+        key = build_cache_key(
+            request, self.get_cache_labels(),
+            self.basename, self.action, self.kwargs.get(self.lookup_url_kwarg or self.lookup_field, ''),
+        )
+        return cached_response(request, key, handler, self.cache_timeout)
+
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(
+            request, lambda: super(CachedResponseMixin, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(
+            request, lambda: super(CachedResponseMixin, self).retrieve(request, *args, **kwargs)
+        )
+
+
+def get_singleton(model):
+    """
+    Return the pk=1 row of a singleton model from a per-worker cache.
+
+    The cached instance is reused for as long as the model's generation stamp
+    is unchanged, so steady-state reads never load the row. The stamp lives in
+    the shared cache, so a save in any worker makes every worker reload on its
+    next read. Callers must treat the instance as read-only.
+    """
+    label = model._meta.label_lower
+    generation = get_generation(label)
+    entry = _singletons.get(label)
+    if entry and entry[0] == generation:
+        return entry[1]
+
+    with _singletons_lock:
+        entry = _singletons.get(label)
+        if entry and entry[0] == generation:
+            return entry[1]
+        obj = model.objects.filter(pk=1).first()
+        if obj is None:
+            obj, _ = model.objects.get_or_create(pk=1)
+        _singletons[label] = (generation, obj)
+        return obj
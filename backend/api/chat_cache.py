@@ -0,0 +1,296 @@
+"""
+Answer cache in front of the Gemini chatbot.
+
+Only first-turn questions (no conversation history) are cached, since a
+follow-up answer depends on earlier turns. A lookup tries an exact match on
+the normalized question first, then a TF-IDF cosine-similarity match against
+previously answered questions to catch paraphrases. Questions are compared
+after NFKC normalization and case folding, so Bengali and other non-Latin
+questions get their own entries.
+
+Entries live in the Django cache so every worker shares them (with
+REDIS_URL). The index of cached questions is capped at CHAT_CACHE_MAX_ENTRIES
+and only rewritten, under a cache.add() lock, when a question is added or
+evicted, so concurrent workers never drop each other's questions. A hit just
+stamps the entry's last-used time, and eviction drops the least recently
+used. Each worker keeps a NumPy TF-IDF matrix that it updates in place -
+adding and removing only the questions that changed - whenever the shared
+index version moves.
+"""
+import hashlib
+import re
+import threading
+import time
+import unicodedata
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+
+import numpy as np
+from django.conf import settings
+
+from .cache import get_cache
+
+INDEX_KEY = 'chat:index'
+INDEX_LOCK_KEY = 'chat:index:lock'
+# Seconds a crashed lock holder can block index updates
+INDEX_LOCK_TIMEOUT = 5
+# Seconds set() waits for the lock before giving up on caching an answer
+INDEX_LOCK_WAIT = 0.5
+STATS_KEYS = {
+    'exact_hits': 'chat:stats:exact_hits',
+    'similar_hits': 'chat:stats:similar_hits',
+    'misses': 'chat:stats:misses',
+    'saved_ms': 'chat:stats:saved_ms',
+}
+
+STOP_WORDS = frozenset(
+    'a an the is are was were be to of for in on at by and or i me my we our you your '
+    'it its do does did can could would should will please tell about what how any'.split()
+)
+# Runs of word characters and combining marks. Python's \w leaves out marks
+# such as Bengali vowel signs and the hasanta, which would split words apart.
+TOKEN_RE = re.compile('[\\w%s]+' % ''.join(
+    re.escape(chr(cp)) for cp in range(0x10000) if unicodedata.category(chr(cp)).startswith('M')
+))
+
+
+def _words(text):
+    return TOKEN_RE.findall(unicodedata.normalize('NFKC', text).casefold())
+
+
+def normalize(text):
+    """Case-fold, drop punctuation and collapse whitespace."""
+    return ' '.join(_words(text))
+
+
+def tokenize(text):
+    return [token for token in _words(text) if token not in STOP_WORDS]
+
+
+def _entry_key(normalized):
+    return f"chat:answer:{hashlib.sha256(normalized.encode()).hexdigest()}"
+
+
+def _used_key(normalized):
+    return f"chat:used:{hashlib.sha256(normalized.encode()).hexdigest()}"
+
+
+@contextmanager
+def _index_lock(cache, wait):
+    """Cross-worker mutex on the shared index; yields whether it was acquired."""
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + wait
+    while not cache.add(INDEX_LOCK_KEY, token, INDEX_LOCK_TIMEOUT):
+        if time.monotonic() >= deadline:
+            yield False
+            return
+        time.sleep(0.01)
+    try:
+        yield True
+    finally:
+        if cache.get(INDEX_LOCK_KEY) == token:
+            cache.delete(INDEX_LOCK_KEY)
+
+
+class TfidfIndex:
+    """
+    TF-IDF vectors for a changing set of questions.
+
+    Rows hold raw term counts and are added or cleared one question at a time;
+    IDF weighting and normalization are redone in one vectorized pass on the
+    first lookup after a change.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self.rows = {}
+        self.questions = []
+        self.free_rows = []
+        self.vocab = {}
+        self.counts = np.zeros((0, 0), dtype=np.float32)
+        self.df = np.zeros(0, dtype=np.float32)
+        self._weighted = None
+        self._idf = None
+
+    def sync(self, questions):
+        """Make the indexed questions equal to `questions`."""
+        wanted = set(questions)
+        for question in [q for q in self.rows if q not in wanted]:
+            self.remove(question)
+        # Tokens of removed questions keep their columns; compact once they dominate
+        dead = int((self.df[:len(self.vocab)] == 0).sum())
+        if dead > max(1024, len(self.vocab) - dead):
+            self._reset()
+        for question in questions:
+            if question not in self.rows:
+                self.add(question)
+
+    def add(self, question):
+        counts = Counter(tokenize(question))
+        for token in counts:
+            self.vocab.setdefault(token, len(self.vocab))
+        row = self.free_rows.pop() if self.free_rows else len(self.questions)
+        self._reserve(row + 1, len(self.vocab))
+        if row == len(self.questions):
+            self.questions.append(question)
+        else:
+            self.questions[row] = question
+        self.rows[question] = row
+        columns = [self.vocab[token] for token in counts]
+        self.counts[row, columns] = list(counts.values())
+        self.df[columns] += 1
+        self._weighted = None
+
+    def remove(self, question):
+        row = self.rows.pop(question)
+        self.df[self.counts[row] > 0] -= 1
+        self.counts[row] = 0
+        self.questions[row] = None
+        self.free_rows.append(row)
+        self._weighted = None
+
+    def _reserve(self, n_rows, n_columns):
+        rows, columns = self.counts.shape
+        if n_rows <= rows and n_columns <= columns:
+            return
+        if n_columns > columns:
+            columns = max(n_columns, columns * 2, 64)
+            df = np.zeros(columns, dtype=np.float32)
+            df[:len(self.df)] = self.df
+            self.df = df
+        rows = max(n_rows, rows * 2 if n_rows > rows else rows, 16)
+        counts = np.zeros((rows, columns), dtype=np.float32)
+        counts[:self.counts.shape[0], :self.counts.shape[1]] = self.counts
+        self.counts = counts
+
+    def _weights(self):
+        if self._weighted is None:
+            self._idf = np.log((1 + len(self.rows)) / (1 + self.df)) + 1
+            weighted = self.counts * self._idf
+            norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+            self._weighted = np.divide(weighted, norms, out=np.zeros_like(weighted), where=norms > 0)
+        return self._weighted
+
+    def best_match(self, text):
+        """Return (question, cosine similarity) of the closest indexed question."""
+        if not self.rows:
+            return None, 0.0
+        weighted = self._weights()
+        query = np.zeros(weighted.shape[1], dtype=np.float32)
+        for token, count in Counter(tokenize(text)).items():
+            i = self.vocab.get(token)
+            if i is not None:
+                query[i] = count * self._idf[i]
+        norm = np.linalg.norm(query)
+        if not norm:
+            return None, 0.0
+        scores = weighted @ (query / norm)
+        best = int(scores.argmax())
+        if self.questions[best] is None:
+            return None, 0.0
+        return self.questions[best], float(scores[best])
+
+
+class AnswerCache:
+    """Exact and near-duplicate answer cache shared through the Django cache."""
+
+    def __init__(self):
+        self._tfidf = TfidfIndex()
+        self._local_version = None
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return get_cache()
+
+    def _get_index(self):
+        """Shared index: {'version': int, 'questions': [normalized, ...]} in insertion order."""
+        return self.cache.get(INDEX_KEY) or {'version': 0, 'questions': []}
+
+    def _best_match(self, index, text):
+        with self._lock:
+            if self._local_version != index['version']:
+                self._tfidf.sync(index['questions'])
+                self._local_version = index['version']
+            return self._tfidf.best_match(text)
+
+    def _incr(self, name, amount=1):
+        key = STATS_KEYS[name]
+        try:
+            self.cache.incr(key, amount)
+        except ValueError:
+            self.cache.add(key, 0, timeout=None)
+            self.cache.incr(key, amount)
+
+    def get(self, message):
+        """Return a cached answer dict ({'response', 'match'}) or None."""
+        normalized = normalize(message)
+        if not normalized:
+            return None
+
+        entry = self.cache.get(_entry_key(normalized))
+        match = 'exact'
+        if entry is None:
+            index = self._get_index()
+            question, score = self._best_match(index, normalized)
+            if question and score >= settings.CHAT_CACHE_SIMILARITY:
+                entry = self.cache.get(_entry_key(question))
+                normalized = question
+                match = 'similar'
+
+        if entry is None:
+            self._incr('misses')
+            return None
+
+        self._incr('exact_hits' if match == 'exact' else 'similar_hits')
+        self._incr('saved_ms', int(entry['latency_ms']))
+        self.cache.set(_used_key(normalized), time.time_ns(), settings.CHAT_CACHE_TTL)
+        return {'response': entry['response'], 'match': match}
+
+    def set(self, message, response, latency_ms):
+        normalized = normalize(message)
+        if not normalized or not response:
+            return
+        # The entry is only stored together with its index slot, so every
+        # cached answer stays subject to LRU and size-cap eviction
+        with _index_lock(self.cache, wait=INDEX_LOCK_WAIT) as locked:
+            if not locked:
+                return
+            self.cache.set(
+                _entry_key(normalized),
+                {'response': response, 'latency_ms': latency_ms},
+                settings.CHAT_CACHE_TTL,
+            )
+            self.cache.set(_used_key(normalized), time.time_ns(), settings.CHAT_CACHE_TTL)
+            self._add_to_index(normalized)
+
+    def _add_to_index(self, normalized):
+        """Index a new question, evicting the least recently used past the cap. Hold the index lock."""
+        index = self._get_index()
+        if normalized in index['questions']:
+            return
+        questions = index['questions'] + [normalized]
+        overflow = len(questions) - settings.CHAT_CACHE_MAX_ENTRIES
+        if overflow > 0:
+            used = self.cache.get_many([_used_key(q) for q in questions])
+            # Stable sort: ties and missing stamps go oldest-inserted first
+            evicted = set(sorted(questions, key=lambda q: used.get(_used_key(q), 0))[:overflow])
+            self.cache.delete_many(
+                [_entry_key(q) for q in evicted] + [_used_key(q) for q in evicted]
+            )
+            questions = [q for q in questions if q not in evicted]
+        self.cache.set(INDEX_KEY, {'version': time.time_ns(), 'questions': questions}, settings.CHAT_CACHE_TTL)
+
+    def stats(self):
+        values = {name: self.cache.get(key) or 0 for name, key in STATS_KEYS.items()}
+        hits = values['exact_hits'] + values['similar_hits']
+        total = hits + values['misses']
+        values['hit_rate'] = round(hits / total, 4) if total else 0.0
+        values['size'] = len(self._get_index()['questions'])
+        return values
+
+
+answer_cache = AnswerCache()
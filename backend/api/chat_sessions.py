@@ -0,0 +1,93 @@
+"""
+Server-side chatbot conversations.
+
+The widget sends only the new message plus a session_id; the turns so far live
+in the shared cache (Redis, or the database cache table without REDIS_URL) for
+CHAT_SESSION_TTL seconds, so a follow-up can land on any worker. After every exchange the history is compacted to
+CHAT_HISTORY_TOKEN_BUDGET: the oldest turns are dropped and each dropped
+question is folded into a one-line running summary, itself capped at
+CHAT_SUMMARY_TOKEN_BUDGET. The prompt sent upstream is therefore bounded no
+matter how long the conversation runs.
+"""
+import re
+import uuid
+
+from django.conf import settings
+
+from .cache import get_shared_cache
+
+SESSION_ID_RE = re.compile(r'^[0-9a-f]{32}$')
+SUMMARY_PREFIX = 'The visitor earlier asked about: '
+SUMMARY_ITEM_CHARS = 80
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token for English text)"""
+    return len(text) // 4 + 1
+
+
+def _session_key(session_id):
+    return f'chat:session:{session_id}'
+
+
+def _empty():
+    return {'summary': [], 'turns': []}
+
+
+def load_session(session_id):
+    """Return (session_id, session), starting a new session for unknown or missing IDs"""
+    if session_id and SESSION_ID_RE.match(str(session_id)):
+        session = get_shared_cache().get(_session_key(session_id))
+        if session is not None:
+            return session_id, session
+    return uuid.uuid4().hex, _empty()
+
+
+def session_from_history(history):
+    """Compacted session built from client-sent history (widgets predating sessions)"""
+    session = _empty()
+    for msg in history if isinstance(history, list) else []:
+        if isinstance(msg, dict) and msg.get('content'):
+            role = 'user' if msg.get('role') == 'user' else 'model'
+            session['turns'].append({'role': role, 'content': str(msg['content'])})
+    _compact(session)
+    return session
+
+
+def summary_text(session):
+    if not session['summary']:
+        return ''
+    return SUMMARY_PREFIX + '; '.join(session['summary']) + '.'
+
+
+def is_first_turn(session):
+    return not session['turns'] and not session['summary']
+
+
+def record_exchange(session_id, session, message, reply):
+    """Append a question/answer pair, compact to the token budget and save"""
+    session['turns'].append({'role': 'user', 'content': message})
+    session['turns'].append({'role': 'model', 'content': reply})
+    _compact(session)
+    get_shared_cache().set(_session_key(session_id), session, settings.CHAT_SESSION_TTL)
+
+
+def _compact(session):
+    turns = session['turns']
+    budget = settings.CHAT_HISTORY_TOKEN_BUDGET
+    used = sum(estimate_tokens(turn['content']) for turn in turns)
+    while turns and used > budget:
+        turn = turns.pop(0)
+        used -= estimate_tokens(turn['content'])
+        if turn['role'] == 'user':
+            topic = ' '.join(turn['content'].split()).rstrip('?.!')
+            if len(topic) > SUMMARY_ITEM_CHARS:
+                topic = topic[:SUMMARY_ITEM_CHARS].rsplit(' ', 1)[0] + '…'
+            session['summary'].append(topic)
+    # Gemini expects the history to start with a user turn
+    while turns and turns[0]['role'] != 'user':
+        turns.pop(0)
+
+    summary_budget = settings.CHAT_SUMMARY_TOKEN_BUDGET
+    while session['summary'] and estimate_tokens(summary_text(session)) > summary_budget:
+        session['summary'].pop(0)
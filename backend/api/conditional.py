@@ -0,0 +1,103 @@
+"""
+Conditional GET (ETag / Last-Modified) for the content API.
+
+Validators are computed from a single aggregate query - COUNT(*) and
+MAX(updated_at) over the rows a response would contain - so a revalidation
+that matches is answered with 304 without serializing anything. The result is
+cached under the same model generations as the response cache (api/cache.py),
+so while nothing has changed neither a 304 nor a cache hit touches the
+database.
+"""
+import hashlib
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+from .cache import build_cache_key, get_cache
+
+
+class ConditionalGetMixin:
+    """
+    Answer If-None-Match / If-Modified-Since on list, retrieve and
+    @cached_action endpoints. Must come before CachedResponseMixin.
+    """
+    last_modified_field = 'updated_at'
+
+    def get_validator_queryset(self):
+        queryset = self.get_queryset()
+        if self.action == 'list':
+            return self.filter_queryset(queryset)
+        if self.action == 'retrieve':
+            lookup_value = self.kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+            if hasattr(self, 'get_lookup_filter'):
+                return queryset.filter(self.get_lookup_filter(str(lookup_value)))
+            field_names = {f.name for f in queryset.model._meta.get_fields()}
+            if 'slug' in field_names:
+                return queryset.filter(slug=lookup_value)
+            if not str(lookup_value).isdigit():
+                return None
+            return queryset.filter(pk=lookup_value)
+        return queryset
+
+    def get_validators(self, request):
+        """Return (etag, last_modified timestamp) for the current request."""
+        queryset = self.get_validator_queryset()
+        if queryset is None:
+            return None, None
+        stats = queryset.order_by().aggregate(
+            count=Count('pk'), last_modified=Max(self.last_modified_field)
+        )
+        if self.action == 'retrieve' and not stats['count']:
+            return None, None
+        last_modified = stats['last_modified']
+        parts = [
+            self.basename, self.action, str(stats['count']),
+            last_modified.isoformat() if last_modified else '',
+            request.get_full_path(),
+        ]
+        # JSON and MessagePack bodies of the same data need distinct tags
+        renderer = getattr(request, 'accepted_renderer', None)
+        if renderer is not None and renderer.format != 'json':
+            parts.append(request.accepted_media_type)
+        raw = '|'.join(parts)
+        etag = quote_etag(hashlib.md5(raw.encode()).hexdigest())
+        return etag, int(last_modified.timestamp()) if last_modified else None
+
+    def get_cached_validators(self, request):
+        """get_validators(), cached until one of the viewset's models changes."""
+        renderer = getattr(request, 'accepted_renderer', None)
+        key = build_cache_key(
+            request, self.get_cache_labels(), 'validators',
+            self.basename, self.action, self.kwargs.get(self.lookup_url_kwarg or self.lookup_field, ''),
+            request.path, getattr(renderer, 'media_type', ''),
+        )
+        cache = get_cache()
+        validators = cache.get(key)
+        if validators is None:
+            validators = self.get_validators(request)
+            cache.set(key, validators, getattr(settings, 'API_CACHE_TIMEOUT', 300))
+        return validators
+
+    def get_cached_response(self, request, handler):
+        if request.method not in ('GET', 'HEAD'):
+            return super().get_cached_response(request, handler)
+
+        etag, last_modified = self.get_cached_validators(request)
+        if etag:
+            not_modified = get_conditional_response(
+                request, etag=etag, last_modified=last_modified
+            )
+            if not_modified is not None:
+                return not_modified
+
+        response = super().get_cached_response(request, handler)
+        if etag and response.status_code == 200:
+            response['ETag'] = etag
+            if last_modified:
+                response['Last-Modified'] = http_date(last_modified)
+            # Let browsers keep the body but revalidate on every use
+            patch_cache_control(response, no_cache=True)
+            patch_vary_headers(response, ['Accept'])
+        return response
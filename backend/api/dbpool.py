@@ -0,0 +1,50 @@
+"""
+Connection pool metrics for the stats endpoint.
+
+With DB_POOL on, every PostgreSQL alias is served from a psycopg_pool
+ConnectionPool owned by the worker process, so the numbers describe this
+worker only. `saturation` is the share of max_size checked out right now. A
+sustained 1.0 with `waiting` above zero, a growing `checkout_wait_ms` or any
+`checkout_timeouts` means requests are queueing for connections: raise
+DB_POOL_MAX_SIZE if the server has room, or add PgBouncer in front of it.
+"""
+from django.db import connections
+
+
+def _pool_status(pool):
+    stats = pool.get_stats()
+    size, available, max_size = stats['pool_size'], stats['pool_available'], stats['pool_max']
+    checkouts = stats.get('requests_num', 0)
+    wait_ms = stats.get('requests_wait_ms', 0)
+    return {
+        'pooled': True,
+        'min_size': stats['pool_min'],
+        'max_size': max_size,
+        'size': size,
+        'in_use': size - available,
+        'available': available,
+        'waiting': stats.get('requests_waiting', 0),
+        'saturation': round((size - available) / max_size, 4) if max_size else 0.0,
+        'checkouts': checkouts,
+        'checkouts_queued': stats.get('requests_queued', 0),
+        'checkout_wait_ms': wait_ms,
+        'avg_checkout_wait_ms': round(wait_ms / checkouts, 2) if checkouts else 0.0,
+        'checkout_timeouts': stats.get('requests_errors', 0),
+        'connections_opened': stats.get('connections_num', 0),
+        'connection_errors': stats.get('connections_errors', 0),
+        'connections_lost': stats.get('connections_lost', 0),
+    }
+
+
+def get_pool_status():
+    """Per-alias pool state; aliases without a pool report only their vendor."""
+    status = {}
+    for alias in connections:
+        connection = connections[alias]
+        # Only the PostgreSQL backend has .pool; it is None unless OPTIONS['pool'] is set
+        pool = getattr(connection, 'pool', None)
+        if pool is None:
+            status[alias] = {'pooled': False, 'vendor': connection.vendor}
+        else:
+            status[alias] = {'vendor': connection.vendor, **_pool_status(pool)}
+    return status
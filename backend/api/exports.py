@@ -0,0 +1,231 @@
+"""
+Streaming CSV / NDJSON exports of job applications and contact inquiries.
+
+    GET /api/exports/applications.csv?from=2026-01-01&to=2026-03-31&status=shortlisted
+    GET /api/exports/inquiries.ndjson?category=media,technical&resolved=false
+
+`from` and `to` are inclusive dates (or ISO datetimes) on submitted_at; the
+other filters take one value or a comma-separated list. All of them become
+WHERE clauses, and rows come out in (submitted_at, id) order straight off the
+export indexes. Rows are read as tuples with .values_list() (the career title
+joined in the same query) through .iterator(chunk_size=EXPORT_CHUNK_SIZE),
+which is a server-side cursor on PostgreSQL, and written through a
+StreamingHttpResponse, so memory stays flat however many rows match.
+
+The endpoint is for staff only; the same exports are available as admin
+actions on the selected rows. CSV starts with a UTF-8 byte order mark so Excel
+reads non-ASCII names correctly, and text cells that a spreadsheet would run
+as a formula (=, +, -, @, tab or carriage return first) are prefixed with an
+apostrophe.
+"""
+import csv
+import datetime
+import io
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.files.storage import FileSystemStorage
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.encoding import filepath_to_uri
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+
+from core.models import ContactInquiry, JobApplication
+from .renderers import HAS_ORJSON
+
+if HAS_ORJSON:
+    import orjson
+
+# resource -> (model, [(header, column)], {query param: model field})
+EXPORT_RESOURCES = {
+    'applications': (JobApplication, [
+        ('id', 'id'),
+        ('career_id', 'career_id'),
+        ('career', 'career__title'),
+        ('full_name', 'full_name'),
+        ('email', 'email'),
+        ('phone', 'phone'),
+        ('linkedin_url', 'linkedin_url'),
+        ('resume', 'resume'),
+        ('cover_letter', 'cover_letter'),
+        ('status', 'status'),
+        ('submitted_at', 'submitted_at'),
+    ], {'status': 'status', 'career': 'career'}),
+    'inquiries': (ContactInquiry, [
+        ('id', 'id'),
+        ('full_name', 'full_name'),
+        ('organization', 'organization'),
+        ('email', 'email'),
+        ('category', 'category'),
+        ('message', 'message'),
+        ('is_resolved', 'is_resolved'),
+        ('submitted_at', 'submitted_at'),
+    ], {'category': 'category', 'resolved': 'is_resolved'}),
+}
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+# Rows written per chunk of the response body
+ROWS_PER_WRITE = 500
+
+# Leading characters that make a spreadsheet treat a CSV cell as a formula
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _bound(value, param, end=False):
+    """Filter kwargs for a `from`/`to` value; a bare `to` date covers the whole day."""
+    try:
+        day = parse_date(value)
+        moment = None if day else parse_datetime(value)
+    except ValueError:
+        day = moment = None
+    if day is not None:
+        if end:
+            day += datetime.timedelta(days=1)
+        moment = timezone.make_aware(datetime.datetime.combine(day, datetime.time()))
+        return {'submitted_at__lt' if end else 'submitted_at__gte': moment}
+    if moment is None:
+        raise ValidationError({param: ['Expected a date (YYYY-MM-DD) or an ISO 8601 datetime.']})
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return {'submitted_at__lte' if end else 'submitted_at__gte': moment}
+
+
+def filter_export_queryset(resource, params):
+    """The resource's rows narrowed by query parameters, in submission order."""
+    model, _, filters = EXPORT_RESOURCES[resource]
+    queryset = model.objects.order_by('submitted_at', 'id')
+    if params.get('from'):
+        queryset = queryset.filter(**_bound(params['from'], 'from'))
+    if params.get('to'):
+        queryset = queryset.filter(**_bound(params['to'], 'to', end=True))
+
+    for param, name in filters.items():
+        raw = params.get(param)
+        if not raw:
+            continue
+        field = model._meta.get_field(name)
+        values = []
+        for value in raw.split(','):
+            try:
+                value = field.to_python(value.strip())
+            except DjangoValidationError as exc:
+                raise ValidationError({param: exc.messages})
+            if field.choices and value not in dict(field.flatchoices):
+                raise ValidationError({param: [f"'{value}' is not a valid choice."]})
+            values.append(value)
+        queryset = queryset.filter(**{f'{name}__in': values})
+    return queryset
+
+
+def _file_url(storage):
+    if isinstance(storage, FileSystemStorage):
+        # storage.url() re-parses base_url on every call; join onto it directly
+        base_url = storage.base_url
+        return lambda name: base_url + filepath_to_uri(name).lstrip('/') if name else ''
+    return lambda name: storage.url(name) if name else ''
+
+
+def _converters(model, columns):
+    """Per-column functions turning stored values into export text."""
+    tz = timezone.get_current_timezone()
+
+    def moment(value):
+        return value.astimezone(tz).isoformat() if value is not None else None
+
+    converters = []
+    for _, column in columns:
+        field = model._meta.get_field(column) if '__' not in column else None
+        if field is not None and field.get_internal_type() == 'DateTimeField':
+            converters.append(moment)
+        elif field is not None and field.get_internal_type() == 'FileField':
+            converters.append(_file_url(field.storage))
+        else:
+            converters.append(None)
+    return converters
+
+
+def iter_rows(resource, queryset):
+    model, columns, _ = EXPORT_RESOURCES[resource]
+    converters = _converters(model, columns)
+    rows = queryset.values_list(*[column for _, column in columns])
+    for row in rows.iterator(chunk_size=settings.EXPORT_CHUNK_SIZE):
+        yield [convert(value) if convert else value for convert, value in zip(converters, row)]
+
+
+def _csv_cell(value):
+    """Neutralise user-submitted text that a spreadsheet would evaluate."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def csv_chunks(resource, queryset):
+    headers = [header for header, _ in EXPORT_RESOURCES[resource][1]]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write('\ufeff')
+    writer.writerow(headers)
+    for count, row in enumerate(iter_rows(resource, queryset), start=1):
+        writer.writerow([_csv_cell(value) for value in row])
+        if count % ROWS_PER_WRITE == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def ndjson_chunks(resource, queryset):
+    headers = [header for header, _ in EXPORT_RESOURCES[resource][1]]
+    if HAS_ORJSON:
+        def dumps(row):
+            return orjson.dumps(dict(zip(headers, row)))
+    else:
+        def dumps(row):
+            return json.dumps(dict(zip(headers, row)), ensure_ascii=False).encode()
+    lines = []
+    for row in iter_rows(resource, queryset):
+        lines.append(dumps(row))
+        if len(lines) == ROWS_PER_WRITE:
+            yield b'\n'.join(lines) + b'\n'
+            lines = []
+    if lines:
+        yield b'\n'.join(lines) + b'\n'
+
+
+def export_response(resource, queryset, fmt):
+    chunks = csv_chunks if fmt == 'csv' else ndjson_chunks
+    response = StreamingHttpResponse(chunks(resource, queryset), content_type=EXPORT_FORMATS[fmt])
+    filename = f'{resource}-{timezone.localdate():%Y%m%d}.{fmt}'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+class ExportView(APIView):
+    """Stream filtered applications or inquiries as CSV or NDJSON (staff only)"""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, resource, fmt):
+        if resource not in EXPORT_RESOURCES or fmt not in EXPORT_FORMATS:
+            raise NotFound('Unknown export')
+        return export_response(resource, filter_export_queryset(resource, request.query_params), fmt)
+
+
+def export_actions(resource):
+    """Admin actions exporting the selected rows (respecting changelist filters)."""
+
+    def action(fmt):
+        def export(modeladmin, request, queryset):
+            return export_response(resource, queryset.order_by('submitted_at', 'id'), fmt)
+        export.short_description = f'Export selected as {fmt.upper()}'
+        export.__name__ = f'export_{fmt}'
+        return export
+
+    return [action(fmt) for fmt in EXPORT_FORMATS]
@@ -0,0 +1,370 @@
+"""
+Helpers for calling the Google Gemini generateContent API.
+
+GEMINI_API_BASE can point at a local stand-in (see the gemini_stub management
+command) to exercise the chat endpoints without the real upstream.
+
+Every outbound call goes through upstream_call(), which
+- reuses keep-alive connections from one pooled requests.Session,
+- enforces GEMINI_MAX_CONCURRENCY in-flight calls per process so chat traffic
+  cannot tie up every worker thread the content API needs, and
+- feeds a circuit breaker that opens after GEMINI_BREAKER_FAILURES consecutive
+  failures or slow calls, rejects calls instantly while open, and lets a
+  single probe through once GEMINI_BREAKER_RESET_SECONDS have passed.
+Rejected calls raise UpstreamUnavailable so the caller can fall back at once.
+
+The a-prefixed functions are the non-blocking equivalents used by the async
+chat view under ASGI; they share the circuit breaker but have their own,
+much larger, concurrency budget since a waiting coroutine holds no thread.
+Their httpx client is kept per event loop only under ASGI (CHAT_ASYNC).
+"""
+import asyncio
+import json
+import logging
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+
+import httpx
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+GENERATION_CONFIG = {
+    "temperature": 0.7,
+    "topK": 40,
+    "topP": 0.95,
+    "maxOutputTokens": 1024,
+}
+
+SAFETY_SETTINGS = [
+    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+]
+
+
+class UpstreamUnavailable(Exception):
+    """Raised without contacting Gemini when the breaker is open or the budget is spent"""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing"""
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+    def __init__(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.lock = threading.Lock()
+
+    def before_call(self):
+        with self.lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < settings.GEMINI_BREAKER_RESET_SECONDS:
+                    raise UpstreamUnavailable("Circuit breaker is open")
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN:
+                if self.probing:
+                    raise UpstreamUnavailable("Circuit breaker probe in flight")
+                self.probing = True
+
+    def record(self, success, elapsed_ms):
+        with self.lock:
+            self.probing = False
+            if success and elapsed_ms <= settings.GEMINI_SLOW_CALL_MS:
+                self.failures = 0
+                self.state = self.CLOSED
+                return
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= settings.GEMINI_BREAKER_FAILURES:
+                if self.state != self.OPEN:
+                    logger.warning(f"Gemini circuit breaker opened after {self.failures} failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+breaker = CircuitBreaker()
+_session = None
+_budget = None
+_init_lock = threading.Lock()
+
+
+def get_session():
+    """Shared keep-alive session sized to the concurrency budget"""
+    global _session
+    if _session is None:
+        with _init_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.GEMINI_MAX_CONCURRENCY)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+def _get_budget():
+    global _budget
+    if _budget is None:
+        with _init_lock:
+            if _budget is None:
+                _budget = threading.BoundedSemaphore(settings.GEMINI_MAX_CONCURRENCY)
+    return _budget
+
+
+class _Call:
+    def __init__(self):
+        self.started = time.monotonic()
+        self.recorded = False
+
+    def elapsed_ms(self):
+        return (time.monotonic() - self.started) * 1000
+
+    def succeeded(self):
+        """Record success early, e.g. at the first streamed chunk"""
+        if not self.recorded:
+            self.recorded = True
+            breaker.record(True, self.elapsed_ms())
+
+
+@contextmanager
+def upstream_call():
+    """Guard one outbound Gemini request with the budget and circuit breaker"""
+    budget = _get_budget()
+    if not budget.acquire(timeout=settings.GEMINI_QUEUE_TIMEOUT):
+        raise UpstreamUnavailable("Gemini concurrency budget exhausted")
+    try:
+        breaker.before_call()
+        call = _Call()
+        try:
+            yield call
+        except GeneratorExit:
+            # Client went away mid-stream; not an upstream failure
+            call.succeeded()
+            raise
+        except Exception:
+            if not call.recorded:
+                call.recorded = True
+                breaker.record(False, call.elapsed_ms())
+            raise
+        call.succeeded()
+    finally:
+        budget.release()
+
+
+# Async clients and budgets are bound to an event loop
+_async_clients = weakref.WeakKeyDictionary()
+_async_budgets = weakref.WeakKeyDictionary()
+
+
+def _new_async_client():
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=settings.GEMINI_ASYNC_MAX_CONCURRENCY),
+        timeout=httpx.Timeout(settings.GEMINI_READ_TIMEOUT, connect=settings.GEMINI_CONNECT_TIMEOUT),
+    )
+
+
+def get_async_client():
+    """Shared keep-alive httpx client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = _new_async_client()
+    return client
+
+
+@asynccontextmanager
+async def async_client():
+    """
+    httpx client for one async upstream call. Under ASGI (CHAT_ASYNC) the
+    event loop lives as long as the worker, so its keep-alive client is
+    shared. Otherwise the async view runs in a throwaway loop per request
+    (async_to_sync under WSGI), and a shared client would leak its sockets
+    when that loop is discarded, so the client is closed after the call.
+    """
+    if settings.CHAT_ASYNC:
+        yield get_async_client()
+        return
+    async with _new_async_client() as client:
+        yield client
+
+
+def _get_async_budget():
+    loop = asyncio.get_running_loop()
+    budget = _async_budgets.get(loop)
+    if budget is None:
+        budget = _async_budgets[loop] = asyncio.Semaphore(settings.GEMINI_ASYNC_MAX_CONCURRENCY)
+    return budget
+
+
+@asynccontextmanager
+async def async_upstream_call():
+    """upstream_call() for coroutines"""
+    budget = _get_async_budget()
+    if settings.GEMINI_QUEUE_TIMEOUT:
+        try:
+            await asyncio.wait_for(budget.acquire(), timeout=settings.GEMINI_QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise UpstreamUnavailable("Gemini concurrency budget exhausted")
+    elif budget.locked():
+        raise UpstreamUnavailable("Gemini concurrency budget exhausted")
+    else:
+        await budget.acquire()
+    try:
+        breaker.before_call()
+        call = _Call()
+        try:
+            yield call
+        except (GeneratorExit, asyncio.CancelledError):
+            call.succeeded()
+            raise
+        except Exception:
+            if not call.recorded:
+                call.recorded = True
+                breaker.record(False, call.elapsed_ms())
+            raise
+        call.succeeded()
+    finally:
+        budget.release()
+
+
+def get_status():
+    """Breaker and budget state for the stats endpoint"""
+    return {
+        'breaker': breaker.state,
+        'consecutive_failures': breaker.failures,
+        'max_concurrency': settings.GEMINI_MAX_CONCURRENCY,
+        'async_max_concurrency': settings.GEMINI_ASYNC_MAX_CONCURRENCY,
+    }
+
+
+def timeouts():
+    return (settings.GEMINI_CONNECT_TIMEOUT, settings.GEMINI_READ_TIMEOUT)
+
+
+def model_url(api_key, stream=False):
+    """URL of the generate (or streaming generate) method for the configured model."""
+    base = f"{settings.GEMINI_API_BASE.rstrip('/')}/models/{settings.GEMINI_MODEL}"
+    if stream:
+        return f"{base}:streamGenerateContent?alt=sse&key={api_key}"
+    return f"{base}:generateContent?key={api_key}"
+
+
+def build_payload(system_prompt, message, history, summary=''):
+    """
+    Build the generateContent request body.
+
+    The static system prompt goes in systemInstruction rather than as a fake
+    first conversation turn, and stays the leading part so the upstream can
+    reuse it as a cached prefix; the running summary of older turns follows it.
+    """
+    instruction = [{"text": system_prompt}]
+    if summary:
+        instruction.append({"text": summary})
+
+    contents = [
+        {"role": msg['role'], "parts": [{"text": msg['content']}]}
+        for msg in history
+    ]
+    contents.append({"role": "user", "parts": [{"text": message}]})
+
+    return {
+        "systemInstruction": {"parts": instruction},
+        "contents": contents,
+        "generationConfig": GENERATION_CONFIG,
+        "safetySettings": SAFETY_SETTINGS,
+    }
+
+
+def extract_text(data):
+    """Text of the first candidate in a generateContent response (or stream chunk)"""
+    if 'candidates' in data and len(data['candidates']) > 0:
+        candidate = data['candidates'][0]
+        if 'content' in candidate and 'parts' in candidate['content']:
+            return ''.join(part.get('text', '') for part in candidate['content']['parts'])
+    return None
+
+
+def generate(api_key, payload):
+    """Blocking call; returns the full reply text"""
+    with upstream_call():
+        response = get_session().post(
+            model_url(api_key),
+            headers={"Content-Type": "application/json"},
+            json=payload,
+            timeout=timeouts()
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Gemini API error: {response.status_code} - {response.text}")
+            raise Exception(f"API returned {response.status_code}")
+
+        text = extract_text(response.json())
+        if text is None:
+            raise Exception("No valid response from API")
+        return text
+
+
+def stream_generate(api_key, payload):
+    """Yield reply text chunks as Gemini streams them (server-sent events)"""
+    with upstream_call() as call, get_session().post(
+        model_url(api_key, stream=True),
+        headers={"Content-Type": "application/json"},
+        json=payload,
+        stream=True,
+        timeout=timeouts()
+    ) as response:
+        if response.status_code != 200:
+            logger.error(f"Gemini API error: {response.status_code} - {response.text}")
+            raise Exception(f"API returned {response.status_code}")
+
+        # chunk_size=None hands over each chunk as soon as it arrives
+        for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+            if not line or not line.startswith('data:'):
+                continue
+            text = extract_text(json.loads(line[len('data:'):]))
+            if text:
+                # Time to first token is what the breaker judges for streams
+                call.succeeded()
+                yield text
+
+
+async def agenerate(api_key, payload):
+    """Non-blocking generate(); returns the full reply text"""
+    async with async_upstream_call():
+        async with async_client() as client:
+            response = await client.post(model_url(api_key), json=payload)
+
+        if response.status_code != 200:
+            logger.error(f"Gemini API error: {response.status_code} - {response.text}")
+            raise Exception(f"API returned {response.status_code}")
+
+        text = extract_text(response.json())
+        if text is None:
+            raise Exception("No valid response from API")
+        return text
+
+
+async def astream_generate(api_key, payload):
+    """Non-blocking stream_generate(); async-yields reply text chunks"""
+    async with async_upstream_call() as call:
+        async with async_client() as client, \
+                client.stream('POST', model_url(api_key, stream=True), json=payload) as response:
+            if response.status_code != 200:
+                await response.aread()
+                logger.error(f"Gemini API error: {response.status_code} - {response.text}")
+                raise Exception(f"API returned {response.status_code}")
+
+            async for line in response.aiter_lines():
+                if not line.startswith('data:'):
+                    continue
+                text = extract_text(json.loads(line[len('data:'):]))
+                if text:
+                    call.succeeded()
+                    yield text
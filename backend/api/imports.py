@@ -0,0 +1,280 @@
+"""
+Streaming bulk import for tenders, notices and careers.
+
+Rows are read lazily from CSV, NDJSON or XLSX (openpyxl, read-only mode) and
+processed in chunks of `batch_size`, so memory stays flat however long the
+file is. Each row is validated by the resource's existing serializer. Valid
+rows are then upserted a chunk at a time with
+bulk_create(update_conflicts=True), keyed by:
+
+    tenders   tender_id
+    notices   slug (rows without a slug are always inserted, under the next
+              free slug for their title, as when a notice is created)
+    careers   id (rows with an id update that career and unknown ids are
+              rejected; rows without an id are inserted)
+
+Rows must pass the same required-field checks as a create. Only the columns
+present in a row are updated on conflict, so a file that omits an optional
+column (e.g. a notice's `content`) keeps the stored value. Empty cells count
+as absent. Within
+the file a later row with the same key replaces an earlier one. Invalid rows
+are skipped and reported with their line number. Each chunk commits in its
+own transaction, with cache, snapshot and search invalidation batched per
+chunk. File columns (e.g. a tender's document) cannot be imported; attach
+files through the per-object endpoints.
+
+Run it with `python manage.py import_records <resource> <file>` or POST the
+file to /api/<resource>/import/.
+"""
+import codecs
+import csv
+import datetime
+import io
+import json
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.validators import UniqueTogetherValidator, UniqueValidator
+
+from core.models import Career, Notice, Tender
+from core.slugs import bulk_create_with_unique_slugs
+from .serializers import CareerDetailSerializer, NoticeDetailSerializer, TenderSerializer
+from .signals import batched_invalidation, record_saved
+
+try:
+    import openpyxl
+    HAS_OPENPYXL = True
+except ImportError:
+    HAS_OPENPYXL = False
+
+# resource -> (model, serializer, upsert key)
+IMPORT_RESOURCES = {
+    'tenders': (Tender, TenderSerializer, 'tender_id'),
+    'notices': (Notice, NoticeDetailSerializer, 'slug'),
+    'careers': (Career, CareerDetailSerializer, 'id'),
+}
+FORMATS = ('csv', 'ndjson', 'xlsx')
+
+
+class ImportFormatError(Exception):
+    pass
+
+
+def detect_format(filename, fmt=None):
+    if fmt:
+        fmt = fmt.lower()
+    else:
+        fmt = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+        fmt = {'jsonl': 'ndjson', 'json': 'ndjson'}.get(fmt, fmt)
+    if fmt not in FORMATS:
+        raise ImportFormatError(f"Unsupported format '{fmt}'; use one of {', '.join(FORMATS)}")
+    if fmt == 'xlsx' and not HAS_OPENPYXL:
+        raise ImportFormatError('XLSX import requires openpyxl')
+    return fmt
+
+
+def _text(fileobj):
+    """Decode a binary file lazily, dropping a UTF-8 byte order mark."""
+    if isinstance(fileobj, io.TextIOBase):
+        return fileobj
+    return codecs.getreader('utf-8-sig')(fileobj)
+
+
+def _cell(value):
+    # Spreadsheets store dates as midnight datetimes; DateField wants a date
+    if isinstance(value, datetime.datetime) and value.time() == datetime.time():
+        return value.date()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def read_rows(fileobj, fmt):
+    """Yield (line number, dict or error message) for every data row."""
+    if fmt == 'csv':
+        reader = csv.DictReader(_text(fileobj))
+        for row in reader:
+            yield reader.line_num, row
+    elif fmt == 'ndjson':
+        for line_no, line in enumerate(_text(fileobj), start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield line_no, f'Invalid JSON: {exc}'
+                continue
+            yield line_no, row if isinstance(row, dict) else 'Expected a JSON object'
+    else:
+        workbook = openpyxl.load_workbook(fileobj, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = [str(name).strip() if name is not None else '' for name in next(rows, ())]
+            for line_no, values in enumerate(rows, start=2):
+                yield line_no, {name: _cell(value) for name, value in zip(header, values) if name}
+        finally:
+            workbook.close()
+
+
+def _clean(row):
+    """Drop empty cells so serializer defaults apply and stored values are kept."""
+    cleaned = {}
+    for name, value in row.items():
+        if name is None or value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        cleaned[str(name).strip()] = value
+    return cleaned
+
+
+class RowImporter:
+    """Validate and upsert rows for one resource in bounded chunks."""
+
+    def __init__(self, resource, batch_size=None, dry_run=False, max_errors=None):
+        self.model, serializer_class, self.key = IMPORT_RESOURCES[resource]
+        self.batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+        self.dry_run = dry_run
+        self.max_errors = max_errors or settings.IMPORT_MAX_REPORTED_ERRORS
+        self.serializer = self._build_serializer(serializer_class)
+        self.summary = {'rows': 0, 'imported': 0, 'invalid': 0, 'errors': []}
+
+    def _build_serializer(self, serializer_class):
+        # The upsert resolves key conflicts, so the unique checks (one query
+        # per row, and failing for rows that already exist) are dropped
+        serializer = serializer_class(context={'request': None})
+        for field in serializer.fields.values():
+            field.validators = [v for v in field.validators if not isinstance(v, UniqueValidator)]
+        serializer.validators = [v for v in serializer.validators if not isinstance(v, UniqueTogetherValidator)]
+        return serializer
+
+    def error(self, line_no, errors):
+        self.summary['invalid'] += 1
+        if len(self.summary['errors']) < self.max_errors:
+            self.summary['errors'].append({'line': line_no, 'errors': errors})
+
+    def validate(self, line_no, row):
+        """Model instance and the set of columns it carries, or None if invalid."""
+        if isinstance(row, str):
+            return self.error(line_no, {'non_field_errors': [row]})
+        row = _clean(row)
+        try:
+            data = self.serializer.run_validation(row)
+        except ValidationError as exc:
+            return self.error(line_no, exc.detail)
+
+        obj = self.model(**data)
+        if self.key == 'id':
+            if 'id' in row:
+                try:
+                    obj.pk = int(row['id'])
+                except (TypeError, ValueError):
+                    return self.error(line_no, {'id': ['A valid integer is required.']})
+        return obj, frozenset(data)
+
+    def run(self, rows):
+        chunk = []
+        for line_no, row in rows:
+            self.summary['rows'] += 1
+            validated = self.validate(line_no, row)
+            if validated is not None:
+                chunk.append((line_no, *validated))
+            if len(chunk) >= self.batch_size:
+                self.flush(chunk)
+                chunk = []
+        if chunk:
+            self.flush(chunk)
+        return self.summary
+
+    def existing_ids_only(self, chunk):
+        """
+        Drop rows whose explicit id matches no stored row. Inserting them with
+        that id would leave the table's id sequence behind on PostgreSQL.
+        """
+        ids = {obj.pk for _, obj, _ in chunk if obj.pk is not None}
+        existing = set(self.model.objects.filter(pk__in=ids).values_list('pk', flat=True)) if ids else set()
+        kept = []
+        for line_no, obj, columns in chunk:
+            if obj.pk is not None and obj.pk not in existing:
+                self.error(line_no, {'id': [f'No {self.model._meta.verbose_name} with id {obj.pk}; omit the id to add a new one.']})
+            else:
+                kept.append((line_no, obj, columns))
+        return kept
+
+    def flush(self, chunk):
+        if self.key == 'id':
+            chunk = self.existing_ids_only(chunk)
+
+        # Later rows win; objects without a key (new careers and notices) are all kept
+        by_key = {}
+        for _, obj, columns in chunk:
+            key = obj.pk if self.key == 'id' else getattr(obj, self.key)
+            by_key[key if key not in (None, '') else object()] = (obj, columns)
+
+        # One upsert per distinct column set, so absent columns are never overwritten
+        groups = {}
+        for obj, columns in by_key.values():
+            groups.setdefault(columns, []).append(obj)
+        if self.dry_run:
+            self.summary['imported'] += len(by_key)
+            return
+
+        auto_now = {f.name for f in self.model._meta.concrete_fields if getattr(f, 'auto_now', False)}
+        now = timezone.now()
+        with transaction.atomic(), batched_invalidation():
+            saved = []
+            for columns, objs in groups.items():
+                update_fields = sorted((columns | auto_now) - {self.key, 'id'})
+                if self.key == 'id':
+                    # Rows with an id update in place; the rest are inserted
+                    existing = [obj for obj in objs if obj.pk is not None]
+                    for obj in existing:
+                        for name in auto_now:
+                            setattr(obj, name, now)
+                    if existing:
+                        self.model.objects.bulk_update(existing, update_fields)
+                    self.model.objects.bulk_create([obj for obj in objs if obj.pk is None])
+                else:
+                    # Rows with a key upsert on it; notices without a slug
+                    # are inserted under a freshly allocated one
+                    keyed = [obj for obj in objs if getattr(obj, self.key)]
+                    if keyed:
+                        self.model.objects.bulk_create(
+                            keyed, update_conflicts=True,
+                            unique_fields=[self.key], update_fields=update_fields,
+                        )
+                    new = [obj for obj in objs if not getattr(obj, self.key)]
+                    if new:
+                        bulk_create_with_unique_slugs(
+                            self.model, new, [getattr(obj, obj.slug_source) for obj in new], self.key,
+                        )
+                saved += objs
+            # Re-read so the search index sees stored values for columns the file omitted
+            record_saved(self.model, self.model.objects.filter(pk__in=[obj.pk for obj in saved]))
+        self.summary['imported'] += len(by_key)
+
+
+class ImportMixin:
+    """Add admin-only POST /<resource>/import/ taking a multipart `file` (and optional `format`)."""
+    import_resource = None
+
+    @action(detail=False, methods=['post'], url_path='import', parser_classes=[MultiPartParser],
+            permission_classes=[IsAdminUser])
+    def import_file(self, request):
+        upload = request.FILES.get('file')
+        if upload is None:
+            raise ValidationError({'file': ['No file was submitted.']})
+        try:
+            fmt = detect_format(upload.name, request.data.get('format'))
+        except ImportFormatError as exc:
+            raise ValidationError({'format': [str(exc)]})
+        importer = RowImporter(self.import_resource, dry_run=request.data.get('dry_run') in ('1', 'true'))
+        return Response(importer.run(read_rows(upload, fmt)))
@@ -0,0 +1,98 @@
+"""
+Slug-or-pk detail lookups for the content viewsets.
+
+Detail URLs accept either a slug (what the public site links to) or a numeric
+pk (what the admin sends on update/delete). The lookup is resolved in one
+query - `slug = value OR pk = value` - and the match is picked in Python:
+update/partial_update/destroy prefer the pk, everything else prefers the
+slug.
+
+Resolved slugs are remembered in a process-local slug -> pk map per model, so
+a repeat retrieve becomes a primary-key fetch. Each map is stamped with the
+model's cache generation (api/cache.py), which api/signals.py bumps on every
+save and delete, so a renamed or deleted row never resolves to a stale pk.
+"""
+import threading
+
+from django.db.models import Q
+from django.utils.text import capfirst
+from rest_framework.exceptions import NotFound
+
+from .cache import get_generation
+
+# Slugs remembered per model before the map is reset
+MAX_SLUGS_PER_MODEL = 2048
+
+_slug_maps = {}
+_lock = threading.Lock()
+
+
+def _slug_map(model):
+    """The slug -> pk map for a model, emptied whenever its generation moves."""
+    label = model._meta.label_lower
+    generation = get_generation(label)
+    with _lock:
+        entry = _slug_maps.get(label)
+        if entry is None or entry[0] != generation or len(entry[1]) >= MAX_SLUGS_PER_MODEL:
+            entry = _slug_maps[label] = (generation, {})
+        return entry[1]
+
+
+def clear_slug_maps():
+    with _lock:
+        _slug_maps.clear()
+
+
+class SlugOrPkLookupMixin:
+    """Resolve detail lookups by slug or pk, preferring pk for writes."""
+    slug_field = 'slug'
+    pk_preferred_actions = ('update', 'partial_update', 'destroy')
+
+    def get_lookup_queryset(self):
+        return self.get_queryset()
+
+    def get_lookup_value(self):
+        return str(self.kwargs.get(self.lookup_url_kwarg or self.lookup_field, ''))
+
+    def get_lookup_filter(self, value):
+        """Q matching every row the lookup value could refer to."""
+        pk = _slug_map(self.get_lookup_queryset().model).get(value)
+        if pk is not None and self.action not in self.pk_preferred_actions:
+            return Q(pk=pk)
+        condition = Q(**{self.slug_field: value})
+        if value.isdigit():
+            condition |= Q(pk=int(value))
+        return condition
+
+    def lookup_object(self, queryset, value):
+        slugs = _slug_map(queryset.model)
+        prefer_pk = self.action in self.pk_preferred_actions and value.isdigit()
+
+        if not prefer_pk and value in slugs:
+            obj = queryset.filter(pk=slugs[value]).first()
+            if obj is not None and getattr(obj, self.slug_field) == value:
+                return obj
+
+        condition = Q(**{self.slug_field: value})
+        if value.isdigit():
+            condition |= Q(pk=int(value))
+        matches = list(queryset.filter(condition).order_by()[:2])
+        if not matches:
+            return None
+
+        def is_pk_match(obj):
+            return value.isdigit() and obj.pk == int(value)
+
+        # A numeric slug can belong to a different row than the same-numbered pk
+        matches.sort(key=lambda obj: is_pk_match(obj) != prefer_pk)
+        obj = matches[0]
+        slugs[getattr(obj, self.slug_field)] = obj.pk
+        return obj
+
+    def get_object(self):
+        queryset = self.get_lookup_queryset()
+        obj = self.lookup_object(queryset, self.get_lookup_value())
+        if obj is None:
+            raise NotFound(f"{capfirst(queryset.model._meta.verbose_name)} not found")
+        self.check_object_permissions(self.request, obj)
+        return obj
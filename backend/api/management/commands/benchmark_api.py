@@ -0,0 +1,61 @@
+"""
+Django management command to measure per-request cost of API endpoints.
+Run with: python manage.py benchmark_api
+Use --url (repeatable) to benchmark specific paths, --requests to set the count.
+
+For each URL the first (cold) request is reported separately from the
+steady-state requests that follow it.
+"""
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+DEFAULT_URLS = [
+    '/api/home/',
+    '/api/company/',
+    '/api/settings/',
+    '/api/projects/',
+    '/api/news/featured/',
+    '/api/notices/featured/',
+    '/api/notices/?category=tender',
+    '/api/tenders/?status=open',
+    '/api/gallery/featured/',
+    '/api/csr/',
+]
+
+
+class Command(BaseCommand):
+    help = 'Reports query count and latency per request for API endpoints'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', action='append', dest='urls', help='Path to benchmark (repeatable)')
+        parser.add_argument('--requests', type=int, default=50, help='Requests per URL')
+        parser.add_argument('--host', default='localhost', help='Host header to send')
+        parser.add_argument('--header', action='append', default=[], help='Extra header, e.g. Accept=application/json')
+
+    def handle(self, *args, **options):
+        headers = dict(h.split('=', 1) for h in options['header'])
+        client = Client(HTTP_HOST=options['host'], headers=headers)
+        count = max(options['requests'], 2)
+
+        self.stdout.write(f"{'URL':<40} {'cold q':>6} {'steady q':>8} {'p50 ms':>8} {'p95 ms':>8} {'bytes':>8}")
+        for url in options['urls'] or DEFAULT_URLS:
+            queries, timings, size = [], [], 0
+            for _ in range(count):
+                with CaptureQueriesContext(connection) as ctx:
+                    start = time.perf_counter()
+                    response = client.get(url)
+                    timings.append((time.perf_counter() - start) * 1000)
+                queries.append(len(ctx.captured_queries))
+                size = len(response.content)
+
+            steady = timings[1:]
+            p95 = statistics.quantiles(steady, n=20)[-1] if len(steady) > 1 else steady[0]
+            self.stdout.write(
+                f'{url:<40} {queries[0]:>6} {statistics.mean(queries[1:]):>8.1f} '
+                f'{statistics.median(steady):>8.2f} {p95:>8.2f} {size:>8}'
+            )
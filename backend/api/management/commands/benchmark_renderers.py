@@ -0,0 +1,100 @@
+"""
+Django management command to compare the API response renderers.
+Run with: python manage.py benchmark_renderers
+Use --url (repeatable) to pick endpoints, --rows to seed extra rows per table
+(inside a transaction that is rolled back), --repeat for timing runs.
+
+Fetches each endpoint's response data through the full API stack, then times
+DRF's stock JSONRenderer, FastJSONRenderer and MessagePackRenderer on it and
+prints body sizes. Fails if FastJSONRenderer's bytes differ from the stock
+renderer's, since plain JSON clients must not see any change.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections, transaction
+from django.test import Client
+from rest_framework.renderers import JSONRenderer
+
+from api.cache import bump_generation
+from api.renderers import HAS_MSGPACK, HAS_ORJSON, FastJSONRenderer, MessagePackRenderer
+from .benchmark_serializers import best_of
+from .check_query_plans import DEFAULT_URLS, SEEDED_MODELS, Rollback, seed
+
+EXTRA_URLS = [
+    '/api/home/',
+    '/api/projects/',
+    '/api/directors/',
+    '/api/csr/',
+    '/api/company/',
+]
+
+
+class Command(BaseCommand):
+    help = 'Times the JSON and MessagePack renderers on real endpoint data and checks JSON output is unchanged'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', action='append', dest='urls', help='Path to benchmark (repeatable)')
+        parser.add_argument('--rows', type=int, default=0, help='Rows seeded per table before fetching')
+        parser.add_argument('--repeat', type=int, default=200, help='Timing runs per renderer')
+        parser.add_argument('--host', default='localhost', help='Host header to send')
+
+    def handle(self, *args, **options):
+        if not HAS_ORJSON:
+            self.stdout.write(self.style.WARNING('orjson is not installed; FastJSONRenderer uses the stock encoder'))
+        client = Client(HTTP_HOST=options['host'], HTTP_ACCEPT='application/json')
+
+        request_started.disconnect(close_old_connections)
+        request_finished.disconnect(close_old_connections)
+        try:
+            with transaction.atomic():
+                if options['rows']:
+                    seed(options['rows'])
+                for model in SEEDED_MODELS:
+                    bump_generation(model._meta.label_lower)
+                payloads = [(url, self.fetch(client, url)) for url in options['urls'] or DEFAULT_URLS + EXTRA_URLS]
+                raise Rollback
+        except Rollback:
+            pass
+        finally:
+            request_started.connect(close_old_connections)
+            request_finished.connect(close_old_connections)
+            for model in SEEDED_MODELS:
+                bump_generation(model._meta.label_lower)
+
+        renderers = [('json', JSONRenderer()), ('fast-json', FastJSONRenderer())]
+        if HAS_MSGPACK:
+            renderers.append(('msgpack', MessagePackRenderer()))
+
+        header = f"{'endpoint':<36}" + ''.join(f'{name + " us":>14}{"bytes":>8}' for name, _ in renderers)
+        self.stdout.write(header)
+        mismatches = []
+        totals = {name: [0.0, 0] for name, _ in renderers}
+        for url, data in payloads:
+            line = f'{url:<36}'
+            bodies = {}
+            for name, renderer in renderers:
+                ms, body = best_of(options['repeat'], lambda: renderer.render(data, renderer.media_type))
+                bodies[name] = body
+                totals[name][0] += ms
+                totals[name][1] += len(body)
+                line += f'{ms * 1000:>14.1f}{len(body):>8}'
+            if bodies['fast-json'] != bodies['json']:
+                mismatches.append(url)
+                line += '  MISMATCH'
+            self.stdout.write(line)
+
+        stock_ms, stock_bytes = totals['json']
+        for name, (ms, size) in totals.items():
+            self.stdout.write(
+                f'{name:<10} total {ms * 1000:>9.1f} us ({stock_ms / ms:.1f}x), '
+                f'{size} bytes ({size / stock_bytes:.0%} of JSON)'
+            )
+        if mismatches:
+            raise CommandError(f"FastJSONRenderer output differs for: {', '.join(mismatches)}")
+        self.stdout.write(self.style.SUCCESS('FastJSONRenderer output is identical to the stock renderer'))
+
+    def fetch(self, client, url):
+        response = client.get(url)
+        if response.status_code != 200:
+            raise CommandError(f'{url} returned {response.status_code}')
+        return response.data
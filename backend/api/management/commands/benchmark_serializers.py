@@ -0,0 +1,91 @@
+"""
+Django management command to benchmark the compiled list serializers.
+Run with: python manage.py benchmark_serializers
+Use --rows (repeatable) to set the list sizes, --repeat for timing runs.
+
+Seeds rows inside a transaction that is rolled back, then for every list
+serializer renders the same rows to JSON through DRF and through the compiled
+read path (api/readpath.py). Fails if the two outputs differ by a single byte;
+otherwise prints the best-of-N timings (query + serialization + rendering).
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.readpath import compile_plan, serialize_rows
+from api.serializers import (
+    CareerListSerializer, GalleryImageListSerializer, NewsListSerializer,
+    NoticeListSerializer, ProjectListSerializer, TenderSerializer,
+)
+from .check_query_plans import Rollback, seed
+
+LIST_SERIALIZERS = (
+    NoticeListSerializer, NewsListSerializer, TenderSerializer,
+    CareerListSerializer, GalleryImageListSerializer, ProjectListSerializer,
+)
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000, result
+
+
+class Command(BaseCommand):
+    help = 'Checks the compiled list serializers match DRF byte for byte and times both'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, action='append', help='List size to benchmark (repeatable)')
+        parser.add_argument('--repeat', type=int, default=5, help='Timing runs per measurement')
+        parser.add_argument('--host', default='localhost', help='Host used for absolute media URLs')
+
+    def handle(self, *args, **options):
+        sizes = sorted(options['rows'] or [1000, 10000])
+        request = Request(APIRequestFactory().get('/api/', HTTP_HOST=options['host']))
+        context = {'request': request}
+        renderer = JSONRenderer()
+        mismatches = []
+
+        self.stdout.write(f"{'serializer':<28}{'rows':>7}{'drf ms':>10}{'compiled ms':>13}{'speedup':>9}")
+        try:
+            with transaction.atomic():
+                seed(max(sizes))
+                for serializer_class in LIST_SERIALIZERS:
+                    plan = compile_plan(serializer_class)
+                    if plan is None:
+                        self.stdout.write(f'{serializer_class.__name__:<28} not compilable, uses DRF')
+                        continue
+                    model = serializer_class.Meta.model
+                    columns = {model._meta.pk.name, *(column for _, column, _, _ in plan)}
+                    for size in sizes:
+                        queryset = model.objects.order_by('pk')[:size]
+
+                        def drf():
+                            return renderer.render(serializer_class(queryset, many=True, context=context).data)
+
+                        def compiled():
+                            return renderer.render(serialize_rows(plan, queryset.values(*columns), context))
+
+                        drf_ms, expected = best_of(options['repeat'], drf)
+                        compiled_ms, actual = best_of(options['repeat'], compiled)
+                        if actual != expected:
+                            mismatches.append(f'{serializer_class.__name__} ({size} rows)')
+                        rows = queryset.count()
+                        self.stdout.write(
+                            f'{serializer_class.__name__:<28}{rows:>7}{drf_ms:>10.1f}{compiled_ms:>13.1f}'
+                            f'{drf_ms / compiled_ms:>8.1f}x'
+                        )
+                raise Rollback
+        except Rollback:
+            pass
+
+        if mismatches:
+            raise CommandError(f"Compiled output differs from DRF for: {', '.join(mismatches)}")
+        self.stdout.write(self.style.SUCCESS('Compiled output is byte-for-byte identical to DRF'))
@@ -0,0 +1,190 @@
+"""
+Django management command to check that list endpoints stay index-backed.
+Run with: python manage.py check_query_plans
+Use --rows to set how many rows are seeded per table, --url (repeatable) to
+check specific paths.
+
+Seeds realistic row counts inside a transaction that is rolled back, requests
+each list URL through the full API stack, and EXPLAINs every paged SELECT it
+issued. The command fails if any plan falls back to a full table scan or
+sorts rows for ORDER BY (a filesort) instead of reading them in index order.
+Works on SQLite and PostgreSQL.
+"""
+import random
+import re
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections, connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from core.models import Career, GalleryImage, NewsArticle, Notice, Tender
+from api.cache import bump_generation
+
+DEFAULT_URLS = [
+    '/api/notices/',
+    '/api/notices/?category=tender',
+    '/api/notices/featured/',
+    '/api/news/',
+    '/api/news/?category=press',
+    '/api/news/featured/',
+    '/api/tenders/',
+    '/api/tenders/?status=open',
+    '/api/tenders/?category=electrical',
+    '/api/careers/',
+    '/api/gallery/',
+    '/api/gallery/?category=project',
+    '/api/gallery/featured/',
+]
+SEEDED_MODELS = (Notice, NewsArticle, Tender, Career, GalleryImage)
+
+# Plan lines that mean "read the whole table" or "sort in memory"
+SQLITE_FULL_SCAN = re.compile(r'\bSCAN (\w+)$')
+SQLITE_FILESORT = 'USE TEMP B-TREE FOR ORDER BY'
+POSTGRES_FULL_SCAN = 'Seq Scan'
+POSTGRES_FILESORT = re.compile(r'(^|->\s*)Sort\b')
+
+
+class Rollback(Exception):
+    pass
+
+
+def seed(rows):
+    """Bulk insert `rows` rows per model with a realistic value spread."""
+    today = date.today()
+
+    def day(i):
+        return today - timedelta(days=i % 3650)
+
+    def pick(choices, i):
+        return choices[i % len(choices)][0]
+
+    Notice.objects.bulk_create([
+        Notice(
+            title=f'Plan check notice {i}', slug=f'plan-check-notice-{i}',
+            category=pick(Notice.CATEGORY_CHOICES, i), published_date=day(i),
+            is_active=i % 10 != 0, is_featured=i % 50 == 0, order=i % 5,
+        ) for i in range(rows)
+    ], batch_size=500)
+    NewsArticle.objects.bulk_create([
+        NewsArticle(
+            title=f'Plan check article {i}', slug=f'plan-check-article-{i}',
+            category=pick(NewsArticle.CATEGORY_CHOICES, i), excerpt='', content='',
+            published_date=day(i), is_featured=i % 50 == 0,
+        ) for i in range(rows)
+    ], batch_size=500)
+    Tender.objects.bulk_create([
+        Tender(
+            tender_id=f'PLAN-CHECK-{i}', title=f'Plan check tender {i}',
+            category=pick(Tender.CATEGORY_CHOICES, i), description='',
+            status=pick(Tender.STATUS_CHOICES, random.randrange(4) if i % 20 else 0),
+            publication_date=day(i), deadline=day(i) + timedelta(days=30),
+        ) for i in range(rows)
+    ], batch_size=500)
+    Career.objects.bulk_create([
+        Career(
+            title=f'Plan check job {i}', department='Operations', location='Rampal',
+            description='', requirements='', deadline=day(i), is_active=i % 20 == 0,
+        ) for i in range(rows)
+    ], batch_size=500)
+    GalleryImage.objects.bulk_create([
+        GalleryImage(
+            title=f'Plan check image {i}', slug=f'plan-check-image-{i}',
+            category=pick(GalleryImage.CATEGORY_CHOICES, i), image='gallery/plan-check.jpg',
+            is_featured=i % 50 == 0, order=i % 5,
+        ) for i in range(rows)
+    ], batch_size=500)
+
+    with connection.cursor() as cursor:
+        for model in SEEDED_MODELS:
+            cursor.execute(f'ANALYZE {connection.ops.quote_name(model._meta.db_table)}')
+
+
+def explain(sql):
+    """Return the plan of an already-interpolated SELECT as a list of lines."""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()]
+        cursor.execute(f'EXPLAIN {sql}')
+        return [row[0] for row in cursor.fetchall()]
+
+
+def find_problems(plan):
+    problems = []
+    for line in plan:
+        text = line.strip()
+        if connection.vendor == 'sqlite':
+            if SQLITE_FULL_SCAN.search(text):
+                problems.append(f'full scan: {text}')
+            if SQLITE_FILESORT in text:
+                problems.append(f'filesort: {text}')
+        else:
+            if POSTGRES_FULL_SCAN in text:
+                problems.append(f'full scan: {text}')
+            if POSTGRES_FILESORT.search(text):
+                problems.append(f'filesort: {text}')
+    return problems
+
+
+class Command(BaseCommand):
+    help = 'EXPLAINs the paged list queries behind each list endpoint and fails on full scans or filesorts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', action='append', dest='urls', help='Path to check (repeatable)')
+        parser.add_argument('--rows', type=int, default=20000, help='Rows seeded per table')
+        parser.add_argument('--host', default='localhost', help='Host header to send')
+        parser.add_argument('--verbose-plans', action='store_true', help='Print every plan')
+
+    def handle(self, *args, **options):
+        client = Client(HTTP_HOST=options['host'])
+        failures = []
+
+        # Keep the connection (and its transaction) open across requests
+        request_started.disconnect(close_old_connections)
+        request_finished.disconnect(close_old_connections)
+        try:
+            with transaction.atomic():
+                seed(options['rows'])
+                for url in options['urls'] or DEFAULT_URLS:
+                    failures += self.check_url(client, url, options['verbose_plans'])
+                raise Rollback
+        except Rollback:
+            pass
+        finally:
+            request_started.connect(close_old_connections)
+            request_finished.connect(close_old_connections)
+            # Responses rendered from the seeded rows must not outlive them
+            for model in SEEDED_MODELS:
+                bump_generation(model._meta.label_lower)
+
+        if failures:
+            raise CommandError(f'{len(failures)} list queries are not index-backed')
+        self.stdout.write(self.style.SUCCESS('All list queries are index-backed'))
+
+    def check_url(self, client, url, verbose):
+        for model in SEEDED_MODELS:
+            bump_generation(model._meta.label_lower)
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+        if response.status_code != 200:
+            raise CommandError(f'{url} returned {response.status_code}')
+
+        failures = []
+        paged = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('SELECT') and ' LIMIT ' in q['sql']]
+        for sql in paged:
+            plan = explain(sql)
+            problems = find_problems(plan)
+            status = self.style.ERROR('FAIL') if problems else self.style.SUCCESS('ok')
+            self.stdout.write(f'{status:<4} {url}')
+            for problem in problems:
+                self.stdout.write(f'       {problem}')
+            if verbose or problems:
+                self.stdout.write('       ' + '\n       '.join(plan))
+                self.stdout.write(f'       {sql}')
+            failures += problems
+        if not paged:
+            self.stdout.write(f'--   {url} (no paged query)')
+        return failures
@@ -0,0 +1,98 @@
+"""
+Django management command that runs a local stand-in for the Gemini API.
+Run with: python manage.py gemini_stub --port 8765
+Then start the API with GEMINI_API_BASE=http://127.0.0.1:8765/v1beta and any
+GEMINI_API_KEY to exercise the chatbot without calling Google.
+
+Both generateContent and streamGenerateContent (?alt=sse) are served, with
+configurable latency so streaming and timeout behaviour can be measured.
+"""
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+DEFAULT_REPLY = (
+    "BIFPCL is a 50:50 joint venture between NTPC Ltd. of India and BPDB of Bangladesh, "
+    "operating the 1320 MW Maitree Super Thermal Power Project in Rampal, Bagerhat."
+)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Deep enough for loadtest_chat's concurrency without refused connections
+    request_queue_size = 512
+
+
+def make_handler(options):
+    words = options['reply'].split(' ')
+    chunk_size = max(1, len(words) // options['chunks'])
+    chunks = [' '.join(words[i:i + chunk_size]) + ' ' for i in range(0, len(words), chunk_size)]
+
+    def body(text):
+        return {'candidates': [{'content': {'role': 'model', 'parts': [{'text': text}]}}]}
+
+    class GeminiStubHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            if options['verbosity'] > 1:
+                super().log_message(format, *args)
+
+        def write_chunk(self, data):
+            self.wfile.write(f'{len(data):X}\r\n'.encode() + data + b'\r\n')
+            self.wfile.flush()
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            if options['fail']:
+                self.send_response(503)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+            time.sleep(options['first_token_ms'] / 1000)
+            if ':streamGenerateContent' in self.path:
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                for i, chunk in enumerate(chunks):
+                    if i:
+                        time.sleep(options['chunk_delay_ms'] / 1000)
+                    self.write_chunk(f"data: {json.dumps(body(chunk))}\r\n\r\n".encode())
+                self.write_chunk(b'')
+                return
+
+            time.sleep(options['chunk_delay_ms'] * (len(chunks) - 1) / 1000)
+            content = json.dumps(body(options['reply'])).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+    return GeminiStubHandler
+
+
+class Command(BaseCommand):
+    help = 'Runs a local Gemini API stand-in that replies with controlled delays'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--reply', default=DEFAULT_REPLY, help='Reply text')
+        parser.add_argument('--chunks', type=int, default=8, help='Number of streamed chunks')
+        parser.add_argument('--first-token-ms', type=float, default=300, help='Delay before the first chunk')
+        parser.add_argument('--chunk-delay-ms', type=float, default=100, help='Delay between chunks')
+        parser.add_argument('--fail', action='store_true', help='Answer every request with HTTP 503')
+
+    def handle(self, *args, **options):
+        server = StubServer(('127.0.0.1', options['port']), make_handler(options))
+        self.stdout.write(f"Gemini stub listening on http://127.0.0.1:{options['port']}/v1beta")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,51 @@
+"""
+Django management command to bulk import tenders, notices or careers.
+Run with: python manage.py import_records tenders backlog.csv
+Accepts CSV, NDJSON (.ndjson/.jsonl) or XLSX; use --format to override the
+extension, --batch-size for rows per transaction and --dry-run to validate
+without writing. See api/imports.py for keys and upsert rules.
+"""
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.imports import IMPORT_RESOURCES, ImportFormatError, RowImporter, detect_format, read_rows
+
+
+class Command(BaseCommand):
+    help = 'Streams a CSV/NDJSON/XLSX file into tenders, notices or careers, upserting in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('resource', choices=sorted(IMPORT_RESOURCES))
+        parser.add_argument('path', help='File to import')
+        parser.add_argument('--format', help='csv, ndjson or xlsx (default: from the extension)')
+        parser.add_argument('--batch-size', type=int, help='Rows upserted per transaction')
+        parser.add_argument('--max-errors', type=int, default=50, help='Row errors to print')
+        parser.add_argument('--dry-run', action='store_true', help='Validate only')
+
+    def handle(self, *args, **options):
+        try:
+            fmt = detect_format(options['path'], options['format'])
+        except ImportFormatError as exc:
+            raise CommandError(str(exc))
+
+        importer = RowImporter(
+            options['resource'], batch_size=options['batch_size'],
+            dry_run=options['dry_run'], max_errors=options['max_errors'],
+        )
+        start = time.perf_counter()
+        with open(options['path'], 'rb') as fh:
+            summary = importer.run(read_rows(fh, fmt))
+        elapsed = time.perf_counter() - start
+
+        for error in summary['errors']:
+            self.stdout.write(self.style.ERROR(f"line {error['line']}: {json.dumps(error['errors'])}"))
+        if summary['invalid'] > len(summary['errors']):
+            self.stdout.write(f"... and {summary['invalid'] - len(summary['errors'])} more invalid rows")
+        verb = 'Validated' if options['dry_run'] else 'Imported'
+        style = self.style.WARNING if summary['invalid'] else self.style.SUCCESS
+        self.stdout.write(style(
+            f"{verb} {summary['imported']} of {summary['rows']} rows "
+            f"({summary['invalid']} invalid) in {elapsed:.1f}s"
+        ))
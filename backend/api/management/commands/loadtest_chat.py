@@ -0,0 +1,72 @@
+"""
+Django management command to load test the chatbot endpoint over HTTP.
+Run with: python manage.py loadtest_chat --url http://127.0.0.1:8000/api/chat/
+
+Point GEMINI_API_BASE at `python manage.py gemini_stub` so the upstream is a
+local stand-in with a fixed latency, then run the server once with sync
+workers (gunicorn config.wsgi) and once under ASGI with CHAT_ASYNC=True
+(gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker) and
+compare throughput and p99 at the same --concurrency.
+
+Each request carries a unique question plus history, so neither the local
+retriever nor the answer cache can short-circuit the Gemini call.
+"""
+import asyncio
+import logging
+import statistics
+import time
+
+import httpx
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Fires concurrent chatbot requests and reports throughput and latency percentiles'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000/api/chat/', help='Chat endpoint URL')
+        parser.add_argument('--requests', type=int, default=200, help='Total requests to send')
+        parser.add_argument('--concurrency', type=int, default=50, help='Requests in flight at once')
+        parser.add_argument('--timeout', type=float, default=60.0, help='Per-request timeout in seconds')
+
+    def handle(self, *args, **options):
+        for name in ('httpx', 'httpcore', 'asyncio'):
+            logging.getLogger(name).setLevel(logging.WARNING)
+        results, elapsed = asyncio.run(self.run(options))
+        timings = sorted(ms for ok, fallback, ms in results if ok)
+        errors = sum(1 for ok, _, _ in results if not ok)
+        fallbacks = sum(1 for ok, fallback, _ in results if ok and fallback)
+
+        self.stdout.write(f"Requests:    {len(results)} (concurrency {options['concurrency']})")
+        self.stdout.write(f"Throughput:  {len(results) / elapsed:.1f} req/s over {elapsed:.2f}s")
+        self.stdout.write(f"Errors:      {errors}")
+        self.stdout.write(f"Fallbacks:   {fallbacks}")
+        if timings:
+            p99 = statistics.quantiles(timings, n=100)[-1] if len(timings) > 1 else timings[0]
+            self.stdout.write(f"p50 ms:      {statistics.median(timings):.1f}")
+            self.stdout.write(f"p99 ms:      {p99:.1f}")
+            self.stdout.write(f"max ms:      {timings[-1]:.1f}")
+
+    async def run(self, options):
+        semaphore = asyncio.Semaphore(options['concurrency'])
+        limits = httpx.Limits(max_connections=options['concurrency'])
+        history = [{'role': 'user', 'content': 'Hello'}, {'role': 'assistant', 'content': 'Hi!'}]
+
+        async with httpx.AsyncClient(timeout=options['timeout'], limits=limits) as client:
+            async def one(i):
+                async with semaphore:
+                    start = time.perf_counter()
+                    try:
+                        response = await client.post(options['url'], json={
+                            'message': f'Explain quantum chromodynamics in simple terms #{i}',
+                            'history': history,
+                        })
+                        ms = (time.perf_counter() - start) * 1000
+                        ok = response.status_code == 200
+                        return ok, ok and bool(response.json().get('fallback')), ms
+                    except httpx.HTTPError:
+                        return False, False, (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            results = await asyncio.gather(*(one(i) for i in range(options['requests'])))
+            return results, time.perf_counter() - start
@@ -0,0 +1,25 @@
+"""
+Django management command to publish static JSON snapshots of the API.
+Run with: python manage.py publish_snapshots
+Use --force to publish a new version even if nothing changed.
+"""
+from django.core.management.base import BaseCommand
+
+from api.snapshots import publish_snapshots
+
+
+class Command(BaseCommand):
+    help = 'Renders read-only API responses into versioned, precompressed JSON files'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Publish a new version even if the content is unchanged',
+        )
+
+    def handle(self, *args, **options):
+        pointer = publish_snapshots(force=options['force'])
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Snapshot {pointer['version']} is live at {pointer['base_url']}"
+        ))
@@ -0,0 +1,26 @@
+"""
+Django management command to rebuild the full-text search index.
+Run with: python manage.py rebuild_search_index
+
+Saves and deletes keep the index current on their own; this is only needed
+after bulk loads that bypass model signals (bulk_create, queryset.update).
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api import search
+from api.cache import bump_generation
+
+
+class Command(BaseCommand):
+    help = 'Re-indexes every notice, news article, tender and career for /api/search/'
+
+    def handle(self, *args, **options):
+        if not search.is_supported():
+            self.stdout.write(self.style.WARNING('Full-text search is not supported on this database'))
+            return
+        with transaction.atomic():
+            total = search.rebuild()
+        for label, _, _ in search.SEARCH_SOURCES.values():
+            bump_generation(label.lower())
+        self.stdout.write(self.style.SUCCESS(f'Indexed {total} documents'))
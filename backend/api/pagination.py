@@ -0,0 +1,231 @@
+"""
+Opt-in pagination modes for the large, growing list endpoints.
+
+The default stays PageNumberPagination. A client can ask for:
+
+?paginate=cursor   Keyset pagination. The cursor holds the ordering values of
+                   the last row, so the next page is an index seek rather
+                   than an OFFSET scan and deep pages cost the same as page 1.
+                   Follow the `next` / `previous` links (they carry ?cursor=).
+                   A malformed or tampered cursor is a 400.
+?paginate=estimate Page numbers with an estimated total count. On PostgreSQL
+                   the planner's row estimate replaces COUNT(*) for large
+                   results; small results (and SQLite) are still counted.
+
+Keyset pages are ordered by the model's Meta.ordering plus a descending pk
+tie-breaker. The orderings mix directions (e.g. notices sort by -is_featured
+then order), which rules out a single row-value comparison, so "rows after
+the cursor" is split into one range query per ordering column, deepest
+first: equal on every earlier column and past the cursor on this one. Each
+is a seek on the matching composite index (see core/models.py), and the
+page is filled from them in order.
+"""
+import base64
+import binascii
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+# Below this many estimated rows an exact COUNT(*) is cheap enough
+EXACT_COUNT_THRESHOLD = 1000
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination over every ordering column plus the pk."""
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def get_ordering(self, queryset):
+        ordering = [
+            (field.lstrip('-'), field.startswith('-'))
+            for field in (queryset.query.order_by or queryset.model._meta.ordering)
+        ]
+        pk_name = queryset.model._meta.pk.name
+        if not any(name in ('pk', pk_name) for name, _ in ordering):
+            ordering.append((pk_name, True))
+        return ordering
+
+    def encode_cursor(self, values, reverse):
+        # isoformat() keeps full microsecond precision, which equality on
+        # datetime columns needs (DRF's JSONEncoder truncates to milliseconds)
+        raw = json.dumps({'v': values, 'r': int(reverse)}, default=lambda v: v.isoformat(), separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def invalid_cursor(self):
+        return ValidationError({self.cursor_query_param: [self.invalid_cursor_message]})
+
+    def decode_cursor(self, request, model):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)))
+            values, reverse = data['v'], bool(data['r'])
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise self.invalid_cursor()
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise self.invalid_cursor()
+        return self.clean_values(model, values), reverse
+
+    def clean_values(self, model, values):
+        """Cursor values as their columns' Python types, so a bad value never reaches the query."""
+        cleaned = []
+        for (name, _), value in zip(self.ordering, values):
+            field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+            if value is None:
+                raise self.invalid_cursor()
+            try:
+                cleaned.append(field.to_python(value))
+            except (DjangoValidationError, TypeError, ValueError):
+                raise self.invalid_cursor()
+        return cleaned
+
+    def seek(self, queryset, ordering, values, limit):
+        """Up to `limit` rows strictly after `values` in `ordering`."""
+        order_by = [f"-{name}" if desc else name for name, desc in ordering]
+        queryset = queryset.order_by(*order_by)
+        if values is None:
+            return list(queryset[:limit])
+
+        rows = []
+        for depth in reversed(range(len(ordering))):
+            equal = {name: value for (name, _), value in zip(ordering[:depth], values[:depth])}
+            name, desc = ordering[depth]
+            past = {f"{name}__{'lt' if desc else 'gt'}": values[depth]}
+            rows += queryset.filter(**equal, **past)[:limit - len(rows)]
+            if len(rows) >= limit:
+                break
+        return rows
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = self.get_ordering(queryset)
+        values, reverse = self.decode_cursor(request, queryset.model)
+
+        ordering = [(name, desc != reverse) for name, desc in self.ordering]
+        rows = self.seek(queryset, ordering, values, self.page_size + 1)
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        # Going forward there is a previous page whenever we came from a cursor;
+        # going backward there is always a next page (the one we came from)
+        self.has_next = has_more if not reverse else True
+        self.has_previous = values is not None if not reverse else has_more
+        self.page = rows
+        return rows
+
+    def row_values(self, row):
+        # Rows are model instances, or .values() dicts on the compiled list path
+        if isinstance(row, dict):
+            return [row[name] for name, _ in self.ordering]
+        return [getattr(row, name) for name, _ in self.ordering]
+
+    def get_link(self, row, reverse):
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, 'paginate', 'cursor')
+        if row is None:
+            return remove_query_param(url, self.cursor_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.row_values(row), reverse))
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.get_link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.get_link(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+def estimate_count(queryset):
+    """Planner row estimate for a queryset, or None where unavailable."""
+    if connection.vendor != 'postgresql':
+        return None
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        self.count_is_estimate = estimate is not None and estimate > EXACT_COUNT_THRESHOLD
+        if self.count_is_estimate:
+            return estimate
+        return super().count
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """Page-number pagination whose total count may be a planner estimate."""
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_paginated_response(self, data):
+        paginator = self.page.paginator
+        return Response(OrderedDict([
+            ('count', paginator.count),
+            ('count_is_estimate', paginator.count_is_estimate),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count_is_estimate'] = {'type': 'boolean'}
+        return response_schema
+
+
+class SelectablePaginationMixin:
+    """
+    Let clients opt into KeysetPagination or EstimatedCountPagination with
+    ?paginate=cursor|estimate; anything else keeps the default paginator.
+    """
+    pagination_modes = {
+        'cursor': KeysetPagination,
+        'estimate': EstimatedCountPagination,
+    }
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            params = self.request.query_params
+            mode = params.get('paginate') or ('cursor' if 'cursor' in params else None)
+            pagination_class = self.pagination_modes.get(mode, self.pagination_class)
+            self._paginator = pagination_class() if pagination_class else None
+        return self._paginator
@@ -0,0 +1,23 @@
+"""
+Request body parsers beyond DRF's JSON / form / multipart set.
+"""
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from .renderers import HAS_MSGPACK
+
+if HAS_MSGPACK:
+    import msgpack
+
+
+class MessagePackParser(BaseParser):
+    """Parse `Content-Type: application/msgpack` request bodies."""
+    media_type = 'application/msgpack'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if not HAS_MSGPACK:
+            raise ParseError('MessagePack support is not installed')
+        try:
+            return msgpack.unpackb(stream.read(), raw=False, strict_map_key=False)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError(f'MessagePack parse error - {exc or type(exc).__name__}')
@@ -0,0 +1,159 @@
+"""
+Per-request profiling, reported as a Server-Timing header and a log line.
+
+For a sampled share of requests (SERVER_TIMING_SAMPLE_RATE) the middleware
+records:
+
+    db         query count and time across every database connection
+    serialize  time in serializer .data and the compiled list path
+    render     time in the response renderers
+    total      time through the middleware stack
+
+It sends them back as
+
+    Server-Timing: db;dur=4.12;desc="12 queries, 10 repeated", serialize;dur=..., render;dur=..., total;dur=...
+
+which browser devtools show under Network > Timing. Sampled requests that
+reach SERVER_TIMING_LOG_MS or SERVER_TIMING_LOG_QUERIES are also logged,
+with the same numbers as structured fields (`extra`).
+
+`repeated` counts executions of SQL text already seen in the request, i.e.
+the same statement with different parameters. A per-row lookup such as
+JobApplication.__str__ reading career.title shows up there as one repeat
+per row.
+
+The spans overlap: serialize includes queries run for lazily loaded
+relations. Serializer .data is timed by wrapping BaseSerializer.data once
+at startup (install(), called from ApiConfig.ready). On requests that are
+not sampled the wrapper costs one ContextVar lookup. Queries are seen on
+the request's thread, which covers every view except the async chat view.
+"""
+import functools
+import logging
+import random
+import time
+from collections import Counter
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+SPANS = ('serialize', 'render')
+
+_profile = ContextVar('request_profile', default=None)
+
+
+class RequestProfile:
+    """Counters for one request; also the connection.execute_wrapper hook."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.statements = Counter()
+        self.spans = dict.fromkeys(SPANS, 0.0)
+        self.open_spans = set()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+            self.statements[sql] += 1
+
+    @property
+    def repeated(self):
+        return self.queries - len(self.statements)
+
+    def fields(self, total):
+        """Timings in milliseconds, keyed for structured logging."""
+        return {
+            'duration_ms': round(total * 1000, 2),
+            'db_queries': self.queries,
+            'db_repeated': self.repeated,
+            'db_ms': round(self.db_time * 1000, 2),
+            **{f'{name}_ms': round(self.spans[name] * 1000, 2) for name in SPANS},
+        }
+
+    def header(self, total):
+        metrics = [f'db;dur={self.db_time * 1000:.2f};desc="{self.queries} queries, {self.repeated} repeated"']
+        metrics += [f'{name};dur={self.spans[name] * 1000:.2f}' for name in SPANS]
+        metrics.append(f'total;dur={total * 1000:.2f}')
+        return ', '.join(metrics)
+
+
+def timed(name):
+    """Add the wrapped call's time to span `name` of the request being profiled."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profile = _profile.get()
+            # Nested calls (e.g. the browsable API rendering JSON) count once
+            if profile is None or name in profile.open_spans:
+                return func(*args, **kwargs)
+            profile.open_spans.add(name)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile.spans[name] += time.perf_counter() - start
+                profile.open_spans.discard(name)
+        wrapper.profiled = True
+        return wrapper
+    return decorator
+
+
+def install():
+    """Time serializer .data, which every DRF view reads, as the serialize span."""
+    from rest_framework.serializers import BaseSerializer
+
+    fget = BaseSerializer.data.fget
+    if not getattr(fget, 'profiled', False):
+        BaseSerializer.data = property(timed('serialize')(fget))
+
+
+class ServerTimingMiddleware:
+    """Profile a sample of requests; see the module docstring."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        rate = settings.SERVER_TIMING_SAMPLE_RATE
+        if rate <= 0 or (rate < 1 and random.random() >= rate):
+            return self.get_response(request)
+
+        profile = RequestProfile()
+        token = _profile.set(profile)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(profile))
+                response = self.get_response(request)
+        finally:
+            _profile.reset(token)
+        total = time.perf_counter() - start
+
+        response['Server-Timing'] = profile.header(total)
+        # Cross-origin pages only see the timings when allowed to
+        origin = response.get('Access-Control-Allow-Origin')
+        if origin:
+            response['Timing-Allow-Origin'] = origin
+
+        if total * 1000 >= settings.SERVER_TIMING_LOG_MS or profile.queries >= settings.SERVER_TIMING_LOG_QUERIES:
+            fields = {
+                'http_method': request.method,
+                'http_path': request.get_full_path(),
+                'http_status': response.status_code,
+                **profile.fields(total),
+            }
+            logger.warning(
+                'Request profile ' + ' '.join(f'{key}={value}' for key, value in fields.items()),
+                extra=fields,
+            )
+        return response
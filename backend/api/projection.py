@@ -0,0 +1,104 @@
+"""
+Column projection for list endpoints.
+
+List actions only SELECT the columns their serializer emits, so list pages no
+longer pull every TextField body (content, description, requirements) that
+the cards never show. Clients can narrow the payload further:
+
+?fields=id,title,slug   Only these serializer fields
+?omit=excerpt           Every serializer field except these
+
+The selection is applied both to the serializer and, via .only(), to the SQL.
+Columns the queryset is ordered by are always loaded so keyset pagination can
+read them without extra queries. If a serializer field's source cannot be
+mapped to a column (a property, a method or source='*') the queryset is left
+unprojected rather than risking a deferred-field query per row.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.exceptions import ValidationError
+
+DISPLAY_PREFIX, DISPLAY_SUFFIX = 'get_', '_display'
+
+
+def _split(value):
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def source_column(model, source):
+    """Concrete field name a serializer source reads, or None if unknown."""
+    name = source.split('.')[0]
+    if name.startswith(DISPLAY_PREFIX) and name.endswith(DISPLAY_SUFFIX):
+        name = name[len(DISPLAY_PREFIX):-len(DISPLAY_SUFFIX)]
+    if name == 'pk':
+        return model._meta.pk.name
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    if not field.concrete or field.many_to_many:
+        return None
+    return field.name
+
+
+class SparseFieldsetMixin:
+    """Project list querysets onto the serializer's (or client's) field set."""
+    fields_query_param = 'fields'
+    omit_query_param = 'omit'
+    projected_actions = ('list',)
+
+    def get_selected_fields(self, available):
+        """Field names kept for this request, or None for all of them."""
+        if self.action not in self.projected_actions:
+            return None
+        params = self.request.query_params
+        requested = _split(params.get(self.fields_query_param, ''))
+        omitted = _split(params.get(self.omit_query_param, ''))
+        if not requested and not omitted:
+            return None
+
+        unknown = sorted(set(requested + omitted) - set(available))
+        if unknown:
+            param = self.fields_query_param if set(unknown) & set(requested) else self.omit_query_param
+            raise ValidationError({param: [f"Unknown field(s): {', '.join(unknown)}"]})
+        selected = [name for name in available if not requested or name in requested]
+        return [name for name in selected if name not in omitted]
+
+    def get_projected_columns(self, queryset):
+        """Columns to load for the list serializer, or None to load everything."""
+        model = queryset.model
+        fields = self.get_serializer_class()().fields
+        selected = self.get_selected_fields(list(fields))
+        columns = {model._meta.pk.name}
+        for name, field in fields.items():
+            if selected is not None and name not in selected:
+                continue
+            column = source_column(model, field.source)
+            if column is None:
+                return None
+            columns.add(column)
+        ordering = queryset.query.order_by or model._meta.ordering
+        for name in ordering:
+            if not isinstance(name, str):
+                return None
+            column = source_column(model, name.lstrip('-'))
+            if column is not None:
+                columns.add(column)
+        return columns
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action in self.projected_actions:
+            columns = self.get_projected_columns(queryset)
+            if columns is not None:
+                queryset = queryset.only(*columns)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fields = getattr(serializer, 'child', serializer).fields
+        selected = self.get_selected_fields(list(fields))
+        if selected is not None:
+            for name in list(fields):
+                if name not in selected:
+                    fields.pop(name)
+        return serializer
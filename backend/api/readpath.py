@@ -0,0 +1,185 @@
+"""
+Compiled read-only serialization for list endpoints.
+
+A DRF list response builds a model instance per row and then, per field,
+resolves the source attribute, checks for None and calls to_representation.
+For `get_<field>_display` sources that also rebuilds the choices dict on
+every row. FastListMixin instead:
+
+- compiles each list serializer once into a field plan of
+  (output name, column, converter),
+- fetches the page with .values() so no model instances are created,
+- maps display sources through a label dict built once per choices field,
+- resolves file/image URLs once per distinct stored name on the page,
+- looks up the datetime output timezone once per response.
+
+Converters are the serializer fields' own to_representation methods (or
+exact equivalents), so the JSON is byte-for-byte what the serializer would
+produce; `python manage.py benchmark_serializers` checks that and times both
+paths. Serializers with anything the plan cannot express - method fields,
+dotted or '*' sources, relations, a custom to_representation - fall back to
+the regular DRF path.
+"""
+from django.db import models
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.relations import ManyRelatedField, RelatedField
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .profiling import timed
+from .projection import DISPLAY_PREFIX, DISPLAY_SUFFIX, source_column
+
+DATETIME = 'datetime'
+FILE = 'file'
+VALUE = 'value'
+
+_plans = {}
+
+
+def _display_converter(model_field, field):
+    labels = {value: str(label) for value, label in model_field.flatchoices}
+    to_representation = field.to_representation
+    return lambda value: to_representation(labels.get(value, value))
+
+
+def _compile_field(model, field):
+    """(column, kind, converter) for one serializer field, or None if unsupported."""
+    if isinstance(field, (serializers.SerializerMethodField, RelatedField, ManyRelatedField)):
+        return None
+    source = field.source
+    if source == '*' or '.' in source:
+        return None
+
+    if source.startswith(DISPLAY_PREFIX) and source.endswith(DISPLAY_SUFFIX):
+        column = source_column(model, source)
+        if column is None or not model._meta.get_field(column).choices:
+            return None
+        return column, VALUE, _display_converter(model._meta.get_field(column), field)
+
+    column = source_column(model, source)
+    if column is None or (column != source and source != 'pk'):
+        return None
+    model_field = model._meta.get_field(column)
+    if model_field.is_relation:
+        return None
+    if isinstance(model_field, models.FileField):
+        use_url = getattr(field, 'use_url', api_settings.UPLOADED_FILES_USE_URL)
+        if not isinstance(field, serializers.FileField) or not use_url:
+            return None
+        return column, FILE, model_field.storage
+    if isinstance(field, serializers.DateTimeField):
+        return column, DATETIME, field
+    return column, VALUE, field.to_representation
+
+
+def compile_plan(serializer_class):
+    """
+    Field plan [(name, column, kind, converter)] for a ModelSerializer, built
+    once per class, or None when the serializer needs the full DRF path.
+    """
+    if serializer_class in _plans:
+        return _plans[serializer_class]
+
+    plan = None
+    if (issubclass(serializer_class, serializers.ModelSerializer)
+            and serializer_class.to_representation is serializers.Serializer.to_representation):
+        model = serializer_class.Meta.model
+        plan = []
+        for field in serializer_class()._readable_fields:
+            compiled = _compile_field(model, field)
+            if compiled is None:
+                plan = None
+                break
+            plan.append((field.field_name, *compiled))
+    _plans[serializer_class] = plan
+    return plan
+
+
+def _file_urls(storage, names, request):
+    """Rendered URL for every distinct stored file name, as FileField would emit it."""
+    urls = {}
+    for name in names:
+        if name:
+            url = storage.url(name)
+            urls[name] = request.build_absolute_uri(url) if request is not None else url
+    return urls
+
+
+def _datetime_converter(field):
+    """
+    DateTimeField.to_representation with the output timezone looked up once
+    per response instead of once per value.
+    """
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    if field_timezone is None or output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+
+    def convert(value):
+        if isinstance(value, str) or timezone.is_naive(value):
+            return field.to_representation(value)
+        value = value.astimezone(field_timezone).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return convert
+
+
+@timed('serialize')
+def serialize_rows(plan, rows, context):
+    """Serialize .values() rows with a compiled plan."""
+    rows = list(rows)
+    request = context.get('request')
+    converters = []
+    for name, column, kind, converter in plan:
+        if kind == FILE:
+            urls = _file_urls(converter, {row[column] for row in rows}, request)
+            converter = urls.get
+        elif kind == DATETIME:
+            converter = _datetime_converter(converter)
+        converters.append((name, column, converter))
+
+    data = []
+    for row in rows:
+        item = {}
+        for name, column, converter in converters:
+            value = row[column]
+            item[name] = None if value is None else converter(value)
+        data.append(item)
+    return data
+
+
+class FastListMixin:
+    """Serve the list action through a compiled plan when the serializer allows it."""
+
+    def get_list_plan(self):
+        plan = compile_plan(self.get_serializer_class())
+        if plan is None or not hasattr(self, 'get_selected_fields'):
+            return plan
+        selected = self.get_selected_fields([name for name, *_ in plan])
+        if selected is None:
+            return plan
+        return [entry for entry in plan if entry[0] in selected]
+
+    def list(self, request, *args, **kwargs):
+        plan = self.get_list_plan()
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        model = queryset.model
+        # Keyset pagination reads the ordering columns back from each row
+        columns = {model._meta.pk.name, *(column for _, column, _, _ in plan)}
+        for name in queryset.query.order_by or model._meta.ordering:
+            column = source_column(model, name.lstrip('-')) if isinstance(name, str) else None
+            if column is None:
+                return super().list(request, *args, **kwargs)
+            columns.add(column)
+        queryset = queryset.values(*columns)
+
+        context = self.get_serializer_context()
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serialize_rows(plan, page, context))
+        return Response(serialize_rows(plan, queryset, context))
@@ -0,0 +1,77 @@
+"""
+Faster response renderers.
+
+FastJSONRenderer is the default JSON renderer. With orjson installed it
+encodes in C and falls back to DRF's JSONEncoder only for the values orjson
+does not handle natively (dates and datetimes, Decimal, lazy translations,
+querysets), so the bytes match the stock JSONRenderer: compact separators,
+UTF-8 rather than \\u escapes, DRF's datetime formatting and Decimal as a
+number. Without orjson, or for ?indent= / "; indent=" requests, it is the
+stock renderer.
+
+MessagePackRenderer answers `Accept: application/msgpack` (or
+?format=msgpack) with the same data as MessagePack, which is smaller and
+cheaper to decode for API clients that support it.
+"""
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from .profiling import timed
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+if HAS_ORJSON:
+    ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+# DRF escapes these so the output is also valid JavaScript
+LINE_SEPARATORS = ((b'\xe2\x80\xa8', b'\\u2028'), (b'\xe2\x80\xa9', b'\\u2029'))
+
+_encoder = JSONEncoder()
+
+
+def encode_default(obj):
+    """Convert values the fast encoders can't handle exactly as DRF would."""
+    return _encoder.default(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer producing the same bytes through orjson when available."""
+
+    @timed('render')
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not HAS_ORJSON or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        try:
+            ret = orjson.dumps(data, default=encode_default, option=ORJSON_OPTIONS)
+        except (TypeError, orjson.JSONEncodeError):
+            # e.g. integers beyond 64 bits
+            return super().render(data, accepted_media_type, renderer_context)
+        for raw, escaped in LINE_SEPARATORS:
+            if raw in ret:
+                ret = ret.replace(raw, escaped)
+        return ret
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    @timed('render')
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=encode_default, use_bin_type=True, datetime=False)
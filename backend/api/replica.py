@@ -0,0 +1,138 @@
+"""
+Read-replica routing for the public API.
+
+When REPLICA_DATABASE_URL is set, settings add a `replica` database alias.
+Viewsets using ReplicaReadMixin then serve safe-method `replica_actions`
+(list, retrieve, featured) from it. Everything else uses the primary:
+writes, migrations, the admin and any view without the mixin.
+
+Replication lags, so reads fall back to the primary for REPLICA_PIN_SECONDS
+in two cases:
+
+  * after a client's own successful POST/PUT/PATCH/DELETE (ReplicaPinMiddleware,
+    keyed by client address), for read-your-writes;
+  * after any write to one of the viewset's cached models (recorded next to
+    the cache generation bump in api/signals.py). Without this, a lagging
+    replica could re-fill the response cache with old rows under the new
+    generation.
+
+Both kinds of pin are kept in the shared cache, so they hold in every worker.
+
+A viewset can shorten the window with `replica_pin_seconds` (0 trusts the
+replica immediately) or opt out with `replica_actions = ()`. Within a
+request, the first write moves the rest of its reads to the primary too.
+
+To try it locally with two SQLite files, copy db.sqlite3 to replica.sqlite3
+and set REPLICA_DATABASE_URL=sqlite:///replica.sqlite3.
+"""
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.permissions import SAFE_METHODS
+
+from .cache import get_shared_cache
+
+REPLICA_ALIAS = 'replica'
+
+# Alias reads go to for the current request; None means the primary
+_read_db = ContextVar('read_db', default=None)
+
+
+def has_replica():
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def _written_key(label):
+    return f'api:written:{label}'
+
+
+def _client_key(request):
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR')
+    address = forwarded.split(',')[0].strip() if forwarded else request.META.get('REMOTE_ADDR', '')
+    return f'api:written:client:{address}'
+
+
+def record_write(label):
+    """Keep reads of a model on the primary while the replica catches up."""
+    if has_replica() and settings.REPLICA_PIN_SECONDS:
+        get_shared_cache().set(_written_key(label), time.time(), settings.REPLICA_PIN_SECONDS)
+
+
+# App label of the rows behind the database cache (the `shared` cache alias)
+CACHE_APP_LABEL = 'django_cache'
+
+
+class PrimaryReplicaRouter:
+    """Route reads to the alias chosen for the request; everything else to the primary."""
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label == CACHE_APP_LABEL:
+            # Cache generations must never be read from a lagging replica
+            return DEFAULT_DB_ALIAS
+        return _read_db.get()
+
+    def db_for_write(self, model, **hints):
+        if _read_db.get() is not None and model._meta.app_label != CACHE_APP_LABEL:
+            _read_db.set(None)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaPinMiddleware:
+    """Pin a client's reads to the primary for a short while after it writes."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (request.method not in SAFE_METHODS and response.status_code < 400
+                and has_replica() and settings.REPLICA_PIN_SECONDS):
+            get_shared_cache().set(_client_key(request), time.time(), settings.REPLICA_PIN_SECONDS)
+        return response
+
+
+class ReplicaReadMixin:
+    """Serve safe-method reads of `replica_actions` from the read replica."""
+    replica_actions = ('list', 'retrieve', 'featured')
+    # Seconds after a write during which reads stay on the primary;
+    # None uses REPLICA_PIN_SECONDS (which also caps it)
+    replica_pin_seconds = None
+
+    def get_replica_labels(self):
+        if hasattr(self, 'get_cache_labels'):
+            return self.get_cache_labels()
+        return [self.get_queryset().model._meta.label_lower]
+
+    def use_replica(self, request):
+        if not has_replica() or request.method not in SAFE_METHODS or self.action not in self.replica_actions:
+            return False
+        window = self.replica_pin_seconds
+        if window is None:
+            window = settings.REPLICA_PIN_SECONDS
+        if not window:
+            return True
+        keys = [_written_key(label) for label in self.get_replica_labels()] + [_client_key(request)]
+        cutoff = time.time() - window
+        return all(written < cutoff for written in get_shared_cache().get_many(keys).values())
+
+    def dispatch(self, request, *args, **kwargs):
+        # Reset whatever initial() chose once the response is built, even on errors
+        token = _read_db.set(None)
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            _read_db.reset(token)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.use_replica(request):
+            _read_db.set(REPLICA_ALIAS)
@@ -0,0 +1,427 @@
+"""
+Local retrieval engine for the chatbot.
+
+An in-process inverted index (BM25 ranking) over live Notice, Tender, Career,
+NewsArticle and CompanyInfo rows plus a few static FAQ answers. It answers
+common questions - "which electrical tenders are open?", "any job openings?",
+"how do I contact you?" - in milliseconds and reports a confidence so the
+chatbot only escalates to Gemini when retrieval is unsure.
+
+The index refreshes incrementally: each document type is stamped with its
+model's cache generation (bumped by api/signals.py on every save/delete), and
+when it moves only the rows whose updated_at changed since the last refresh
+are re-read. Deletes are published by the signal handlers to a short-lived
+log in the shared cache. This keeps every worker current without any
+cross-process messaging; a worker that finds the log incomplete falls back to
+re-reading the whole type.
+"""
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.models import CompanyInfo, Notice, Tender, Career, NewsArticle
+from .cache import get_generation, get_shared_cache
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+STOP_WORDS = frozenset(
+    'a an the is are was were be to of for in on at by and or i me my we our you your it its '
+    'do does did can could would should will please tell about what which who how any there '
+    'currently available now show list give with from this that have has'.split()
+)
+
+# Words that signal the visitor is asking for a list of a given document type
+TYPE_KEYWORDS = {
+    'tender': {'tender', 'bid', 'procurement', 'rfq', 'rfp'},
+    'career': {'career', 'job', 'vacancy', 'opening', 'recruitment', 'hiring', 'position'},
+    'notice': {'notice', 'announcement', 'circular'},
+    'news': {'news', 'press', 'update'},
+}
+TYPE_PAGES = {
+    'tender': ('tenders', '/tenders'),
+    'career': ('job openings', '/careers'),
+    'notice': ('notices', '/notices'),
+    'news': ('news articles', '/media'),
+}
+# Choice fields a list question can be narrowed by, in the order their labels are read out
+FACET_CHOICES = {
+    'tender': [Tender.STATUS_CHOICES, Tender.CATEGORY_CHOICES],
+    'career': [Career.EMPLOYMENT_TYPE_CHOICES],
+    'notice': [Notice.CATEGORY_CHOICES],
+    'news': [NewsArticle.CATEGORY_CHOICES],
+}
+MAX_LISTED = 5
+
+# Rows saved this long before a refresh started are read again by the next
+# one, so a transaction that committed late is not missed
+REFRESH_OVERLAP = timedelta(seconds=60)
+# Seconds a delete stays in the shared log; slower workers reload the type
+DELETED_LOG_TIMEOUT = 24 * 60 * 60
+
+# Static answers that used to live in get_fallback_response's keyword checks
+FAQ_DOCUMENTS = [
+    ('contact', 'contact phone email address office reach call location visit',
+     "Contact BIFPCL at:\n• Site Office: Rampal, Bagerhat - Phone: +880 2 968 1234\n"
+     "• Corporate Office: 117 Kazi Nazrul Islam Ave, Dhaka\n• Email: info@bifpcl.com\n\n"
+     "Visit /contact for more options."),
+    ('environment', 'environment emission pollution green sustainable sustainability fgd esp scr',
+     "BIFPCL uses Ultra-Supercritical Technology for lower emissions and higher efficiency. "
+     "We adhere to IFC guidelines and Equator Principles with advanced pollution control systems."),
+    ('greeting', 'hello hi hey greetings good morning',
+     "Hello! Welcome to BIFPCL. I'm here to help you with information about our organization, "
+     "the Maitree Power Project, tenders, careers, and more. What would you like to know?"),
+    ('thanks', 'thank thanks thankyou',
+     "You're welcome! If you have any more questions about BIFPCL, feel free to ask."),
+    ('apply', 'apply application resume cv submit',
+     "To apply for a job, open the position on our Careers page at /careers and submit the "
+     "application form with your resume."),
+]
+
+
+def stem(token):
+    if len(token) > 4 and token.endswith('ies'):
+        return token[:-3] + 'y'
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def raw_tokens(text):
+    return [stem(token) for token in TOKEN_RE.findall(text.lower())]
+
+
+def tokenize(text):
+    return [token for token in raw_tokens(text) if token not in STOP_WORDS]
+
+
+@dataclass
+class Document:
+    doc_id: str
+    doc_type: str
+    title: str
+    text: str
+    url: str
+    answer: str = ''
+    summary: str = ''
+    facets: frozenset = field(default_factory=frozenset)
+
+
+def _notice_document(notice):
+    if not notice.is_active:
+        return None
+    return Document(
+        f'notice:{notice.pk}', 'notice', notice.title,
+        f'{notice.title} {notice.excerpt} {notice.get_category_display()}',
+        f'/notices/{notice.slug}', summary=notice.published_date.strftime('%d %b %Y'),
+        facets=frozenset({notice.category}),
+    )
+
+
+def _tender_document(tender):
+    return Document(
+        f'tender:{tender.pk}', 'tender', f'{tender.tender_id} - {tender.title}',
+        f'{tender.tender_id} {tender.title} {tender.description} '
+        f'{tender.get_category_display()} {tender.get_status_display()}',
+        '/tenders', summary=f"{tender.get_status_display()}, deadline {tender.deadline:%d %b %Y}",
+        facets=frozenset({tender.category, tender.status}),
+    )
+
+
+def _career_document(career):
+    if not career.is_active:
+        return None
+    return Document(
+        f'career:{career.pk}', 'career', career.title,
+        f'{career.title} {career.department} {career.location} '
+        f'{career.get_employment_type_display()} {career.description}',
+        '/careers', summary=f"{career.department}, {career.location}, apply by {career.deadline:%d %b %Y}",
+        facets=frozenset({career.employment_type}),
+    )
+
+
+def _news_document(article):
+    return Document(
+        f'news:{article.pk}', 'news', article.title,
+        f'{article.title} {article.excerpt} {article.get_category_display()}',
+        f'/media/{article.slug}', summary=article.published_date.strftime('%d %b %Y'),
+        facets=frozenset({article.category}),
+    )
+
+
+def _company_document(company):
+    if company.pk != 1:
+        return None
+    return Document(
+        'company:1', 'company', company.name,
+        f'{company.name} {company.tagline} {company.technology} '
+        'company bifpcl maitree project plant power joint venture ntpc bpdb rampal',
+        '/', answer=f'{company.name}: {company.description}',
+    )
+
+
+# model -> (document type, row -> Document, or None when the row is not indexed)
+DOCUMENT_SOURCES = {
+    Notice: ('notice', _notice_document),
+    Tender: ('tender', _tender_document),
+    Career: ('career', _career_document),
+    NewsArticle: ('news', _news_document),
+    CompanyInfo: ('company', _company_document),
+}
+SOURCE_LABELS = {model._meta.label_lower for model in DOCUMENT_SOURCES}
+
+
+def _deleted_seq_key(label):
+    return f'chat:retrieval:deleted:{label}'
+
+
+def record_deleted(label, pks):
+    """
+    Publish deleted rows of a model to every worker's index. Call after the
+    delete commits and before the model's generation is bumped.
+    """
+    if label not in SOURCE_LABELS:
+        return
+    cache = get_shared_cache()
+    seq_key = _deleted_seq_key(label)
+    seq = cache.get(seq_key) or 0
+    for pk in pks:
+        # add() claims a slot atomically in Redis and in the database cache
+        # (incr() in the latter is a read and a write), so concurrent deletes
+        # never overwrite each other's entries
+        seq += 1
+        while not cache.add(f'{seq_key}:{seq}', pk, DELETED_LOG_TIMEOUT):
+            seq += 1
+    if pks:
+        cache.set(seq_key, seq, timeout=None)
+
+
+def _deleted_since(label, since_seq):
+    """Return (pks deleted after since_seq, current seq); pks is None if the log has gaps."""
+    cache = get_shared_cache()
+    seq_key = _deleted_seq_key(label)
+    seq = cache.get(seq_key) or 0
+    if seq < since_seq:
+        return None, seq
+    keys = [f'{seq_key}:{n}' for n in range(since_seq + 1, seq + 1)]
+    found = cache.get_many(keys)
+    if len(found) != len(keys):
+        return None, seq
+    pks = list(found.values())
+    # Concurrent writers may leave the counter behind their last claimed slot
+    while (pk := cache.get(f'{seq_key}:{seq + 1}')) is not None:
+        pks.append(pk)
+        seq += 1
+    return pks, seq
+
+
+@dataclass
+class SourceState:
+    generation: int
+    refreshed_at: object
+    deleted_seq: int
+
+
+class InvertedIndex:
+    """Token -> postings map with BM25 scoring and per-document add/remove."""
+    k1 = 1.5
+    b = 0.75
+
+    def __init__(self):
+        self.documents = {}
+        self.postings = defaultdict(dict)
+        self.lengths = {}
+        self.total_length = 0
+
+    def add(self, document):
+        self.remove(document.doc_id)
+        counts = Counter(tokenize(f'{document.title} {document.text}'))
+        for token, count in counts.items():
+            self.postings[token][document.doc_id] = count
+        self.documents[document.doc_id] = document
+        self.lengths[document.doc_id] = sum(counts.values())
+        self.total_length += self.lengths[document.doc_id]
+
+    def remove(self, doc_id):
+        if doc_id not in self.documents:
+            return
+        document = self.documents.pop(doc_id)
+        for token in set(tokenize(f'{document.title} {document.text}')):
+            postings = self.postings.get(token)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self.postings[token]
+        self.total_length -= self.lengths.pop(doc_id)
+
+    def search(self, tokens, doc_type=None):
+        """Return [(score, matched query tokens, document)] best first."""
+        total = len(self.documents)
+        if not total:
+            return []
+        avg_length = self.total_length / total or 1
+        scores = defaultdict(float)
+        matched = defaultdict(set)
+        for token in set(tokens):
+            postings = self.postings.get(token, {})
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[doc_id] / avg_length)
+                scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+                matched[doc_id].add(token)
+        results = [
+            (score, matched[doc_id], self.documents[doc_id])
+            for doc_id, score in scores.items()
+            if doc_type is None or self.documents[doc_id].doc_type == doc_type
+        ]
+        results.sort(key=lambda result: result[0], reverse=True)
+        return results
+
+
+class Retriever:
+    """Keeps an InvertedIndex in sync with the database and answers questions."""
+
+    def __init__(self):
+        self.index = InvertedIndex()
+        self.sources = {}
+        # Guards the index; refresh_lock lets one thread read changes from
+        # the database while others keep answering from the current index
+        self.lock = threading.Lock()
+        self.refresh_lock = threading.Lock()
+        self.loaded = False
+        for name, keywords, answer in FAQ_DOCUMENTS:
+            self.index.add(Document(f'faq:{name}', 'faq', name, keywords, '', answer=answer))
+
+    def refresh(self):
+        """Apply the rows changed since the last refresh of each document type."""
+        if not self.refresh_lock.acquire(blocking=not self.loaded):
+            return
+        try:
+            for model, (doc_type, build) in DOCUMENT_SOURCES.items():
+                self._refresh_source(model, doc_type, build)
+            self.loaded = True
+        finally:
+            self.refresh_lock.release()
+
+    def _refresh_source(self, model, doc_type, build):
+        label = model._meta.label_lower
+        generation = get_generation(label)
+        state = self.sources.get(label)
+        if state and state.generation == generation:
+            return
+        started = timezone.now()
+
+        deleted, deleted_seq = _deleted_since(label, state.deleted_seq if state else 0)
+        incremental = (
+            state is not None and deleted is not None
+            and any(f.name == 'updated_at' for f in model._meta.concrete_fields)
+        )
+        if incremental:
+            rows = model.objects.filter(updated_at__gte=state.refreshed_at - REFRESH_OVERLAP)
+        else:
+            rows = model.objects.all()
+        changes = [(f'{doc_type}:{row.pk}', build(row)) for row in rows.iterator()]
+
+        with self.lock:
+            if not incremental:
+                for doc_id in [d.doc_id for d in self.index.documents.values() if d.doc_type == doc_type]:
+                    self.index.remove(doc_id)
+            for pk in deleted or ():
+                self.index.remove(f'{doc_type}:{pk}')
+            for doc_id, document in changes:
+                if document is None:
+                    self.index.remove(doc_id)
+                else:
+                    self.index.add(document)
+        self.sources[label] = SourceState(generation, started, deleted_seq)
+
+    def answer(self, message):
+        """
+        Return (answer text, confidence 0..1), or (None, 0.0) when nothing
+        relevant is indexed.
+        """
+        self.refresh()
+        raw = set(raw_tokens(message))
+        tokens = tokenize(message)
+
+        # "it" is only the IT Services category when written in capitals
+        if 'IT' not in message.split():
+            raw.discard('it')
+
+        with self.lock:
+            doc_type = next((t for t, words in TYPE_KEYWORDS.items() if raw & words), None)
+            if doc_type:
+                return self._list_answer(doc_type, raw, tokens)
+
+            results = self.index.search(tokens)
+            if not results:
+                return None, 0.0
+            # Prefer the document covering most of the question, then curated
+            # answers (FAQ, company) over content rows, then BM25 score
+            score, matched, document = max(
+                results, key=lambda r: (len(r[1]), bool(r[2].answer), r[0])
+            )
+            confidence = len(matched) / len(set(tokens)) if tokens else 0.0
+            if document.answer:
+                return document.answer, confidence
+            text = f"**{document.title}** ({document.summary})" if document.summary else f"**{document.title}**"
+            return f"{text}\nMore details: {document.url}", confidence
+
+    def _list_answer(self, doc_type, raw, tokens):
+        """
+        List live documents of one type, narrowed by any facet words in the
+        question. Returns (answer text, confidence).
+
+        The confidence is the share of the question's words the list accounts
+        for - type keywords, facets and content words found in the listed
+        documents - scaled by the share of content words found. "How do I
+        submit a bid?" mentions tenders but asks something a list cannot
+        answer, so it scores low and the chatbot escalates.
+        """
+        candidates = [d for d in self.index.documents.values() if d.doc_type == doc_type]
+        labels = [
+            (value, label if label.split()[0].isupper() else label.lower())
+            for choices in FACET_CHOICES[doc_type]
+            for value, label in choices if value in raw
+        ]
+        wanted = {value for value, _ in labels}
+        if wanted:
+            candidates = [d for d in candidates if wanted <= d.facets]
+
+        # Rank by text relevance when the question has other content words
+        content = {t for t in tokens if t not in TYPE_KEYWORDS[doc_type] and t not in wanted}
+        found = set()
+        if content:
+            candidate_ids = {d.doc_id for d in candidates}
+            results = [r for r in self.index.search(content, doc_type) if r[2].doc_id in candidate_ids]
+            ranked = {r[2].doc_id: r[0] for r in results}
+            found = set().union(*(r[1] for r in results))
+            if ranked:
+                candidates.sort(key=lambda d: ranked.get(d.doc_id, 0.0), reverse=True)
+        question = set(tokens)
+        coverage = len(question - (content - found)) / len(question) if question else 1.0
+        confidence = coverage * (len(found) / len(content) if content else 1.0)
+
+        label, page = TYPE_PAGES[doc_type]
+        qualifier = ' '.join(label for _, label in labels)
+        if not candidates:
+            return f"There are no {qualifier + ' ' if qualifier else ''}{label} at the moment. Please check {page} for updates.", confidence
+        lines = [f"• {d.title} ({d.summary})" if d.summary else f"• {d.title}" for d in candidates[:MAX_LISTED]]
+        more = f"\n…and {len(candidates) - MAX_LISTED} more." if len(candidates) > MAX_LISTED else ''
+        return (
+            f"Here are the current {qualifier + ' ' if qualifier else ''}{label}:\n"
+            + '\n'.join(lines) + more + f"\n\nSee {page} for full details."
+        ), confidence
+
+
+retriever = Retriever()
+
+
+def is_confident(confidence):
+    return confidence >= settings.CHAT_RETRIEVAL_CONFIDENCE
@@ -0,0 +1,347 @@
+"""
+Full-text search across notices, news, tenders and careers.
+
+Every publicly visible row is mirrored into one `search_index` table (title,
+body text and its page URL), created by core migration 0009:
+
+- SQLite: an FTS5 virtual table with the porter tokenizer, ranked with
+  bm25() and highlighted with highlight()/snippet(). The FTS rowid encodes
+  (type, pk) so updates and deletes are single-row lookups.
+- PostgreSQL: a plain table whose weighted tsvector column is GENERATED from
+  title (A) and body (B) behind a GIN index, ranked with ts_rank_cd() and
+  highlighted with ts_headline().
+- Other backends have no search table. search() falls back to icontains
+  filters on the models, ranked by how many terms hit the title versus the
+  body, and highlights in Python.
+
+api/signals.py upserts or removes a row whenever one of the indexed models is
+saved or deleted, inside the same transaction, so the index never needs a
+periodic rebuild. The bulk admin endpoints (api/bulk.py) update it once per
+batch through index_objects() / remove_objects(). Other rows written with
+bulk_create/update() skip signals; run `python manage.py rebuild_search_index`
+after such loads.
+"""
+import html
+import re
+
+from django.apps import apps
+from django.db import connection
+from django.db.models import Case, Q, Value, When
+
+SEARCH_TABLE = 'search_index'
+MAX_RESULTS = 50
+TOKEN_RE = re.compile(r'[^\W_]+')
+
+# Sentinels wrapped around matches by the database, swapped for <mark> tags
+# after the surrounding text has been HTML-escaped
+MARK_START, MARK_END = '\x02', '\x03'
+
+
+def _notice(obj):
+    body = f'{obj.get_category_display()} {obj.excerpt} {obj.content}'
+    return obj.is_active, obj.title, body, f'/notices/{obj.slug}'
+
+
+def _news(obj):
+    body = f'{obj.get_category_display()} {obj.excerpt} {obj.content}'
+    return True, obj.title, body, f'/media/{obj.slug}'
+
+
+def _tender(obj):
+    body = f'{obj.tender_id} {obj.get_category_display()} {obj.get_status_display()} {obj.description}'
+    return True, obj.title, body, '/tenders'
+
+
+def _career(obj):
+    body = (
+        f'{obj.department} {obj.location} {obj.get_employment_type_display()} '
+        f'{obj.description} {obj.requirements}'
+    )
+    return obj.is_active, obj.title, body, '/careers'
+
+
+
+# type -> (model label, row -> (visible, title, body, url), rowid code)
+SEARCH_SOURCES = {
+    'notice': ('core.Notice', _notice, 1),
+    'news': ('core.NewsArticle', _news, 2),
+    'tender': ('core.Tender', _tender, 3),
+    'career': ('core.Career', _career, 4),
+}
+SOURCE_BY_LABEL = {label.lower(): doc_type for doc_type, (label, _, _) in SEARCH_SOURCES.items()}
+
+# type -> (filter for public rows, body fields) for backends without a search table
+FALLBACK_FIELDS = {
+    'notice': ({'is_active': True}, ('excerpt', 'content')),
+    'news': ({}, ('excerpt', 'content')),
+    'tender': ({}, ('tender_id', 'description')),
+    'career': ({'is_active': True}, ('department', 'location', 'description', 'requirements')),
+}
+# Score of a term found in the title relative to one found in the body
+TITLE_WEIGHT = 10
+
+
+def create_table_sql(vendor):
+    """DDL for the search table, or [] for backends without full-text support."""
+    if vendor == 'sqlite':
+        return [
+            f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+            "doc_type UNINDEXED, object_id UNINDEXED, url UNINDEXED, title, body, "
+            "tokenize='porter unicode61')"
+        ]
+    if vendor == 'postgresql':
+        return [
+            f"CREATE TABLE {SEARCH_TABLE} ("
+            "doc_type varchar(20) NOT NULL, object_id integer NOT NULL, url text NOT NULL, "
+            "title text NOT NULL, body text NOT NULL, "
+            "document tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', title), 'A') || "
+            "setweight(to_tsvector('english', body), 'B')) STORED, "
+            "PRIMARY KEY (doc_type, object_id))",
+            f"CREATE INDEX {SEARCH_TABLE}_document_idx ON {SEARCH_TABLE} USING gin (document)",
+        ]
+    return []
+
+
+def is_supported():
+    return connection.vendor in ('sqlite', 'postgresql')
+
+
+def _rowid(doc_type, pk):
+    return pk * 8 + SEARCH_SOURCES[doc_type][2]
+
+
+def index_object(doc_type, obj):
+    """Insert, refresh or (when no longer public) remove one row's entry."""
+    if not is_supported():
+        return
+    visible, title, body, url = SEARCH_SOURCES[doc_type][1](obj)
+    if not visible:
+        return remove_object(doc_type, obj.pk)
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [_rowid(doc_type, obj.pk)])
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE} (rowid, doc_type, object_id, url, title, body) '
+                'VALUES (%s, %s, %s, %s, %s, %s)',
+                [_rowid(doc_type, obj.pk), doc_type, obj.pk, url, title, body],
+            )
+        else:
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE} (doc_type, object_id, url, title, body) '
+                'VALUES (%s, %s, %s, %s, %s) ON CONFLICT (doc_type, object_id) '
+                'DO UPDATE SET url = EXCLUDED.url, title = EXCLUDED.title, body = EXCLUDED.body',
+                [doc_type, obj.pk, url, title, body],
+            )
+
+
+def remove_object(doc_type, pk):
+    if not is_supported():
+        return
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [_rowid(doc_type, pk)])
+        else:
+            cursor.execute(
+                f'DELETE FROM {SEARCH_TABLE} WHERE doc_type = %s AND object_id = %s', [doc_type, pk]
+            )
+
+
+def index_objects(doc_type, objs):
+    """Batch form of index_object(): one DELETE plus one multi-row INSERT."""
+    if not is_supported() or not objs:
+        return
+    rows = []
+    for obj in objs:
+        visible, title, body, url = SEARCH_SOURCES[doc_type][1](obj)
+        if visible:
+            rows.append((obj.pk, url, title, body))
+    remove_objects(doc_type, [obj.pk for obj in objs])
+    if not rows:
+        return
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.executemany(
+                f'INSERT INTO {SEARCH_TABLE} (rowid, doc_type, object_id, url, title, body) '
+                'VALUES (%s, %s, %s, %s, %s, %s)',
+                [(_rowid(doc_type, pk), doc_type, pk, url, title, body) for pk, url, title, body in rows],
+            )
+        else:
+            cursor.executemany(
+                f'INSERT INTO {SEARCH_TABLE} (doc_type, object_id, url, title, body) '
+                'VALUES (%s, %s, %s, %s, %s)',
+                [(doc_type, pk, url, title, body) for pk, url, title, body in rows],
+            )
+
+
+def remove_objects(doc_type, pks):
+    """Batch form of remove_object(): a single DELETE ... IN."""
+    if not is_supported() or not pks:
+        return
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            rowids = [_rowid(doc_type, pk) for pk in pks]
+            marks = ', '.join(['%s'] * len(rowids))
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({marks})', rowids)
+        else:
+            cursor.execute(
+                f'DELETE FROM {SEARCH_TABLE} WHERE doc_type = %s AND object_id = ANY(%s)', [doc_type, list(pks)]
+            )
+
+
+def rebuild():
+    """Re-index every row."""
+    if not is_supported():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+    total = 0
+    for doc_type, (label, _, _) in SEARCH_SOURCES.items():
+        for obj in apps.get_model(label).objects.iterator():
+            index_object(doc_type, obj)
+            total += 1
+    return total
+
+
+def _terms(query):
+    return TOKEN_RE.findall(query.lower())
+
+
+def _marked(text):
+    """Escape highlighted text and turn the match sentinels into <mark> tags."""
+    return html.escape(text or '').replace(MARK_START, '<mark>').replace(MARK_END, '</mark>')
+
+
+def _fulltext_search(terms, types, limit, facets):
+    """Ranked (doc_type, id, url, title, snippet, score) rows from the search table."""
+    type_marks = ', '.join(['%s'] * len(types))
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            match = ' '.join(f'"{term}"*' for term in terms)
+            cursor.execute(
+                f'SELECT doc_type, COUNT(*) FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s GROUP BY doc_type',
+                [match],
+            )
+            facets.update(dict(cursor.fetchall()))
+            cursor.execute(
+                f"SELECT doc_type, object_id, url, "
+                f"highlight({SEARCH_TABLE}, 3, %s, %s), "
+                f"snippet({SEARCH_TABLE}, 4, %s, %s, '…', 24), "
+                f"bm25({SEARCH_TABLE}, 0, 0, 0, 10.0, 1.0) AS score "
+                f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s AND doc_type IN ({type_marks}) "
+                f"ORDER BY score LIMIT %s",
+                [MARK_START, MARK_END, MARK_START, MARK_END, match, *types, limit],
+            )
+            rows = [(*row[:5], -row[5]) for row in cursor.fetchall()]
+        else:
+            tsquery = ' & '.join(f'{term}:*' for term in terms)
+            cursor.execute(
+                f"SELECT doc_type, COUNT(*) FROM {SEARCH_TABLE} "
+                f"WHERE document @@ to_tsquery('english', %s) GROUP BY doc_type",
+                [tsquery],
+            )
+            facets.update(dict(cursor.fetchall()))
+            options = f'StartSel={MARK_START}, StopSel={MARK_END}'
+            # Rank and limit first so ts_headline only runs on the returned page
+            cursor.execute(
+                f"SELECT doc_type, object_id, url, "
+                f"ts_headline('english', title, query, %s), "
+                f"ts_headline('english', body, query, %s), score "
+                f"FROM (SELECT doc_type, object_id, url, title, body, query, "
+                f"ts_rank_cd(document, query) AS score "
+                f"FROM {SEARCH_TABLE}, to_tsquery('english', %s) query "
+                f"WHERE document @@ query AND doc_type IN ({type_marks}) "
+                f"ORDER BY score DESC LIMIT %s) hits ORDER BY score DESC",
+                [f'{options}, HighlightAll=true', f'{options}, MaxFragments=2, MaxWords=24, MinWords=8',
+                 tsquery, *types, limit],
+            )
+            rows = cursor.fetchall()
+    return rows
+
+
+def _highlight(text, terms):
+    """Mark every word containing a term, as the full-text highlighters mark whole tokens."""
+    pattern = re.compile(r'\w*(?:%s)\w*' % '|'.join(map(re.escape, terms)), re.IGNORECASE)
+    return pattern.sub(lambda m: f'{MARK_START}{m.group(0)}{MARK_END}', text)
+
+
+def _snippet(text, terms, words=24):
+    """Up to `words` words of text around the first match, highlighted."""
+    tokens = text.split()
+    first = next((i for i, token in enumerate(tokens) if any(term in token.lower() for term in terms)), 0)
+    start = max(0, min(first - words // 3, len(tokens) - words))
+    end = start + words
+    return ''.join([
+        '…' if start else '', _highlight(' '.join(tokens[start:end]), terms), '…' if end < len(tokens) else '',
+    ])
+
+
+def _fallback_search(terms, types, limit, facets):
+    """
+    Same rows as _fulltext_search() from icontains filters, for backends
+    without a search table. Every term must appear in the title or a body
+    field; each one found in the title scores TITLE_WEIGHT and each one found
+    in the body scores 1, like the title/body weights used with bm25().
+    """
+    hits = []
+    for doc_type, (label, build, _) in SEARCH_SOURCES.items():
+        public, body_fields = FALLBACK_FIELDS[doc_type]
+        queryset = apps.get_model(label).objects.filter(**public)
+        score = Value(0)
+        for term in terms:
+            in_body = Q()
+            for name in body_fields:
+                in_body |= Q(**{f'{name}__icontains': term})
+            queryset = queryset.filter(Q(title__icontains=term) | in_body)
+            score = (
+                score
+                + Case(When(title__icontains=term, then=Value(TITLE_WEIGHT)), default=Value(0))
+                + Case(When(in_body, then=Value(1)), default=Value(0))
+            )
+        facets[doc_type] = queryset.count()
+        if doc_type not in types:
+            continue
+        for obj in queryset.annotate(score=score).order_by('-score', '-pk')[:limit]:
+            _, title, body, url = build(obj)
+            hits.append((doc_type, obj.pk, url, _highlight(title, terms), _snippet(body, terms), obj.score))
+    hits.sort(key=lambda hit: hit[5], reverse=True)
+    return hits[:limit]
+
+
+def search(query, types=None, limit=20):
+    """
+    Ranked hits for a free-text query.
+
+    Every word must match (as a prefix, so "transf" finds "transformer").
+    Returns {'count', 'facets': {type: hits}, 'results': [...]}; facets
+    always cover every type so the client can show per-type counts while a
+    type filter is applied.
+    """
+    terms = _terms(query)
+    types = [t for t in (types or SEARCH_SOURCES) if t in SEARCH_SOURCES]
+    facets = {doc_type: 0 for doc_type in SEARCH_SOURCES}
+    if not terms or not types:
+        return {'count': 0, 'facets': facets, 'results': []}
+
+    limit = max(1, min(limit, MAX_RESULTS))
+    if is_supported():
+        rows = _fulltext_search(terms, types, limit, facets)
+    else:
+        rows = _fallback_search(terms, types, limit, facets)
+
+    results = [
+        {
+            'type': doc_type,
+            'id': object_id,
+            'url': url,
+            'title': _marked(title),
+            'snippet': _marked(snippet),
+            'score': round(float(score), 4),
+        }
+        for doc_type, object_id, url, title, snippet, score in rows
+    ]
+    return {
+        'count': sum(facets[t] for t in types),
+        'facets': facets,
+        'results': results,
+    }
@@ -1,5 +1,4 @@
 from rest_framework import serializers
-from django.utils.text import slugify
 from core.models import (
     CompanyInfo, Project, Director, NewsArticle,
     Career, JobApplication, Tender, ContactInquiry, CSRInitiative, Notice,
@@ -7,20 +6,6 @@ from core.models import (
 )
 
 
-def generate_unique_slug(model_class, name, instance=None):
-    """Generate a unique slug for a model instance."""
-    base_slug = slugify(name)[:200]
-    slug = base_slug
-    counter = 1
-    queryset = model_class.objects.all()
-    if instance:
-        queryset = queryset.exclude(pk=instance.pk)
-    while queryset.filter(slug=slug).exists():
-        slug = f"{base_slug}-{counter}"
-        counter += 1
-    return slug
-
-
 class CompanyInfoSerializer(serializers.ModelSerializer):
     class Meta:
         model = CompanyInfo
@@ -40,11 +25,6 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
         model = Project
         fields = '__all__'
 
-    def create(self, validated_data):
-        if not validated_data.get('slug'):
-            validated_data['slug'] = generate_unique_slug(Project, validated_data['name'])
-        return super().create(validated_data)
-
     def update(self, instance, validated_data):
         # Remove empty slug to keep existing one
         if 'slug' in validated_data and not validated_data['slug']:
@@ -61,7 +41,8 @@ class DirectorSerializer(serializers.ModelSerializer):
 class NewsListSerializer(serializers.ModelSerializer):
     class Meta:
         model = NewsArticle
-        fields = '__all__'
+        fields = ['id', 'title', 'slug', 'category', 'excerpt', 'image',
+                  'published_date', 'is_featured', 'updated_at']
 
 
 class NewsDetailSerializer(serializers.ModelSerializer):
@@ -71,11 +52,6 @@ class NewsDetailSerializer(serializers.ModelSerializer):
         model = NewsArticle
         fields = '__all__'
 
-    def create(self, validated_data):
-        if not validated_data.get('slug'):
-            validated_data['slug'] = generate_unique_slug(NewsArticle, validated_data['title'])
-        return super().create(validated_data)
-
     def update(self, instance, validated_data):
         if 'slug' in validated_data and not validated_data['slug']:
             del validated_data['slug']
@@ -137,11 +113,6 @@ class NoticeDetailSerializer(serializers.ModelSerializer):
                   'content', 'published_date', 'document', 'attachment_name', 'link',
                   'is_featured', 'is_active', 'created_at', 'updated_at']
 
-    def create(self, validated_data):
-        if not validated_data.get('slug'):
-            validated_data['slug'] = generate_unique_slug(Notice, validated_data['title'])
-        return super().create(validated_data)
-
     def update(self, instance, validated_data):
         if 'slug' in validated_data and not validated_data['slug']:
             del validated_data['slug']
@@ -181,11 +152,6 @@ class GalleryImageDetailSerializer(serializers.ModelSerializer):
                     data['is_featured'] = is_featured.lower() in ('true', '1', 'yes')
         return super().to_internal_value(data)
 
-    def create(self, validated_data):
-        if not validated_data.get('slug'):
-            validated_data['slug'] = generate_unique_slug(GalleryImage, validated_data['title'])
-        return super().create(validated_data)
-
     def update(self, instance, validated_data):
         if 'slug' in validated_data and not validated_data['slug']:
             del validated_data['slug']
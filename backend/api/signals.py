@@ -0,0 +1,138 @@
+"""
+Signal handlers that keep API caches in sync with admin edits.
+
+Inside batched_invalidation() the handlers only record what changed; the
+search index update then runs once for the whole batch when the block exits,
+and the cache bump and snapshot publish once the batch's transaction commits.
+"""
+import functools
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from core.models import (
+    CompanyInfo, Project, Director, NewsArticle,
+    Career, Tender, CSRInitiative, Notice, GalleryImage, SiteSettings
+)
+from . import search
+from .cache import bump_generation
+from .replica import record_write
+from .retrieval import record_deleted
+from .snapshots import SNAPSHOT_MODELS, schedule_publish
+
+CACHED_MODELS = (
+    CompanyInfo, Project, Director, NewsArticle,
+    Career, Tender, CSRInitiative, Notice, GalleryImage, SiteSettings,
+)
+
+_batch = ContextVar('invalidation_batch', default=None)
+
+
+@contextmanager
+def batched_invalidation():
+    """
+    Defer invalidation for the rows changed in this block to a single pass at
+    the end. Rows written without signals (bulk_create, bulk_update,
+    queryset.update) are registered with record_saved() / record_changed().
+    """
+    batch = {'models': set(), 'saved': defaultdict(dict), 'deleted': defaultdict(set)}
+    token = _batch.set(batch)
+    try:
+        yield batch
+    finally:
+        _batch.reset(token)
+    _flush(batch)
+
+
+def record_saved(model, objs):
+    """Register created/updated rows with the active batch."""
+    batch = _batch.get()
+    batch['models'].add(model)
+    for obj in objs:
+        batch['saved'][model][obj.pk] = obj
+        batch['deleted'][model].discard(obj.pk)
+
+
+def record_changed(model):
+    """Register a change to non-indexed columns (e.g. a reorder)."""
+    _batch.get()['models'].add(model)
+
+
+def _record_deleted(model, pk):
+    batch = _batch.get()
+    batch['models'].add(model)
+    batch['saved'][model].pop(pk, None)
+    batch['deleted'][model].add(pk)
+
+
+def _invalidate(label, deleted=()):
+    # Deletes are logged before the bump so a worker that sees the new
+    # generation also sees them
+    if deleted:
+        record_deleted(label, deleted)
+    bump_generation(label)
+    record_write(label)
+
+
+def _flush(batch):
+    # Bumps and replica pins wait for the commit, as in invalidate_response_cache;
+    # the search index rows are written in the batch's own transaction
+    for model in batch['models']:
+        if model in CACHED_MODELS:
+            transaction.on_commit(functools.partial(
+                _invalidate, model._meta.label_lower, list(batch['deleted'][model])
+            ))
+    if settings.SNAPSHOT_AUTO_PUBLISH and batch['models'] & set(SNAPSHOT_MODELS):
+        transaction.on_commit(schedule_publish)
+    for model in batch['models']:
+        doc_type = search.SOURCE_BY_LABEL.get(model._meta.label_lower)
+        if doc_type:
+            search.remove_objects(doc_type, list(batch['deleted'][model]))
+            search.index_objects(doc_type, list(batch['saved'][model].values()))
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_response_cache(sender, instance, signal, **kwargs):
+    """Drop cached API responses for a model whenever one of its rows changes"""
+    if _batch.get() is not None:
+        return
+    if sender in CACHED_MODELS:
+        deleted = [instance.pk] if signal is post_delete else []
+        # After commit: a read between the bump and the commit would cache
+        # the old row under the new generation
+        transaction.on_commit(functools.partial(_invalidate, sender._meta.label_lower, deleted))
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def republish_snapshots(sender, **kwargs):
+    """Queue a new static snapshot once the current transaction commits"""
+    if _batch.get() is not None:
+        return
+    if settings.SNAPSHOT_AUTO_PUBLISH and sender in SNAPSHOT_MODELS:
+        transaction.on_commit(schedule_publish)
+
+
+@receiver(post_save)
+def update_search_index(sender, instance, **kwargs):
+    """Upsert the row's full-text entry in the same transaction as the save"""
+    if _batch.get() is not None:
+        return record_saved(sender, [instance])
+    doc_type = search.SOURCE_BY_LABEL.get(sender._meta.label_lower)
+    if doc_type:
+        search.index_object(doc_type, instance)
+
+
+@receiver(post_delete)
+def remove_from_search_index(sender, instance, **kwargs):
+    if _batch.get() is not None:
+        return _record_deleted(sender, instance.pk)
+    doc_type = search.SOURCE_BY_LABEL.get(sender._meta.label_lower)
+    if doc_type:
+        search.remove_object(doc_type, instance.pk)
@@ -0,0 +1,238 @@
+"""
+Static JSON snapshots of the read-only API.
+
+publish_snapshots() renders list and detail payloads into a new versioned
+directory under SNAPSHOT_ROOT, writes .gz/.br siblings next to every file and
+then atomically swaps SNAPSHOT_ROOT/current.json to point at it. Because a
+version directory is complete before the pointer moves, clients that follow
+the pointer never see a half-published snapshot.
+
+Clients read the pointer from /api/snapshots/current/ and fetch the version
+files from its base_url, which api.views.serve_snapshot (or a CDN configured
+through SNAPSHOT_URL) serves as immutable, precompressed when the client
+accepts it. Payloads are rendered against SNAPSHOT_SITE_URL so their media
+URLs are absolute, exactly as in live API responses. Each <resource>/index.json
+uses the live list endpoint's {count, next, previous, results} envelope with
+every row on a single page, so clients parse both the same way.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import connection
+from django.http import HttpRequest
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+
+from core.models import (
+    Project, Director, NewsArticle, Tender, CSRInitiative, Notice, GalleryImage
+)
+from .serializers import (
+    ProjectListSerializer, ProjectDetailSerializer, DirectorSerializer,
+    NewsListSerializer, NewsDetailSerializer, TenderSerializer,
+    CSRInitiativeSerializer, NoticeListSerializer, NoticeDetailSerializer,
+    GalleryImageListSerializer, GalleryImageDetailSerializer
+)
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+logger = logging.getLogger(__name__)
+
+POINTER_FILE = 'current.json'
+
+# name -> (list queryset, detail queryset, list serializer, detail serializer, file key)
+# The querysets mirror what the corresponding viewset's list/retrieve return.
+SNAPSHOT_RESOURCES = {
+    'notices': (
+        lambda: Notice.objects.filter(is_active=True), lambda: Notice.objects.all(),
+        NoticeListSerializer, NoticeDetailSerializer, 'slug',
+    ),
+    'news': (
+        lambda: NewsArticle.objects.all(), lambda: NewsArticle.objects.all(),
+        NewsListSerializer, NewsDetailSerializer, 'slug',
+    ),
+    'tenders': (
+        lambda: Tender.objects.all(), lambda: Tender.objects.all(),
+        TenderSerializer, TenderSerializer, 'pk',
+    ),
+    'projects': (
+        lambda: Project.objects.all(), lambda: Project.objects.all(),
+        ProjectListSerializer, ProjectDetailSerializer, 'slug',
+    ),
+    'directors': (
+        lambda: Director.objects.all(), lambda: Director.objects.all(),
+        DirectorSerializer, DirectorSerializer, 'pk',
+    ),
+    'csr': (
+        lambda: CSRInitiative.objects.all(), lambda: CSRInitiative.objects.all(),
+        CSRInitiativeSerializer, CSRInitiativeSerializer, 'pk',
+    ),
+    'gallery': (
+        lambda: GalleryImage.objects.all(), lambda: GalleryImage.objects.all(),
+        GalleryImageListSerializer, GalleryImageDetailSerializer, 'slug',
+    ),
+}
+
+SNAPSHOT_MODELS = (Project, Director, NewsArticle, Tender, CSRInitiative, Notice, GalleryImage)
+
+
+def get_snapshot_root():
+    return settings.SNAPSHOT_ROOT
+
+
+def _dump(data):
+    return json.dumps(data, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _list_page(results):
+    """The live list endpoint's paginated envelope, holding every row on one page."""
+    return {'count': len(results), 'next': None, 'previous': None, 'results': results}
+
+
+class _SiteRequest(HttpRequest):
+    """A bare GET on the public site, so serializers build absolute URLs for it."""
+
+    def __init__(self, site_url):
+        super().__init__()
+        url = urlsplit(site_url)
+        self._site_scheme = url.scheme or 'https'
+        self._site_host = url.netloc
+        self.method = 'GET'
+
+    def _get_scheme(self):
+        return self._site_scheme
+
+    def get_host(self):
+        return self._site_host
+
+
+def render_snapshot(request=None):
+    """
+    Render every snapshot file into memory: {relative path: bytes}.
+
+    URLs are built for `request` when given, otherwise for SNAPSHOT_SITE_URL.
+    """
+    if request is None:
+        request = Request(_SiteRequest(settings.SNAPSHOT_SITE_URL))
+    context = {'request': request}
+    files = {}
+    for name, resource in SNAPSHOT_RESOURCES.items():
+        list_queryset, detail_queryset, list_serializer, detail_serializer, key = resource
+        results = list_serializer(list_queryset(), many=True, context=context).data
+        files[f'{name}/index.json'] = _dump(_list_page(results))
+        for obj in detail_queryset():
+            files[f'{name}/{getattr(obj, key)}.json'] = _dump(detail_serializer(obj, context=context).data)
+    return files
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as fh:
+        fh.write(content)
+    with open(f'{path}.gz', 'wb') as fh:
+        fh.write(gzip.compress(content, compresslevel=9, mtime=0))
+    if HAS_BROTLI:
+        with open(f'{path}.br', 'wb') as fh:
+            fh.write(brotli.compress(content))
+
+
+def get_current_snapshot():
+    """Return the pointer to the current snapshot version, or None."""
+    try:
+        with open(os.path.join(get_snapshot_root(), POINTER_FILE), 'rb') as fh:
+            return json.load(fh)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def publish_snapshots(force=False, request=None):
+    """
+    Publish a new snapshot version. Returns the pointer dict.
+
+    Skips writing when the content is identical to the current version
+    unless force=True.
+    """
+    root = get_snapshot_root()
+    files = render_snapshot(request)
+    digest = hashlib.sha256()
+    for path in sorted(files):
+        digest.update(path.encode())
+        digest.update(files[path])
+    content_hash = digest.hexdigest()[:12]
+
+    current = get_current_snapshot()
+    if current and current.get('hash') == content_hash and not force:
+        return current
+
+    now = datetime.now(timezone.utc)
+    version = f"{now:%Y%m%d%H%M%S}-{content_hash}"
+    version_dir = os.path.join(root, version)
+    for path, content in files.items():
+        _write(os.path.join(version_dir, path), content)
+
+    pointer = {
+        'version': version,
+        'hash': content_hash,
+        'base_url': f"{settings.SNAPSHOT_URL.rstrip('/')}/{version}/",
+        'published_at': now.isoformat(),
+        'resources': sorted(SNAPSHOT_RESOURCES),
+    }
+    tmp_path = os.path.join(root, f'.{POINTER_FILE}.{os.getpid()}.tmp')
+    with open(tmp_path, 'wb') as fh:
+        fh.write(_dump(pointer))
+    os.replace(tmp_path, os.path.join(root, POINTER_FILE))
+
+    _prune(root, keep=settings.SNAPSHOT_KEEP_VERSIONS, current=version)
+    logger.info(f"Published API snapshot {version} ({len(files)} files)")
+    return pointer
+
+
+def _prune(root, keep, current):
+    # Versions published within the same second sort by hash, so the current
+    # one is set aside rather than assumed to sort last
+    older = sorted(
+        entry for entry in os.listdir(root)
+        if entry != current and os.path.isdir(os.path.join(root, entry))
+    )
+    for version in older[:max(len(older) - (keep - 1), 0)]:
+        shutil.rmtree(os.path.join(root, version), ignore_errors=True)
+
+
+_publish_timer = None
+_publish_lock = threading.Lock()
+
+
+def schedule_publish(delay=None):
+    """
+    Debounced background publish, used by the on-save hook so a burst of
+    admin edits produces a single new snapshot.
+    """
+    global _publish_timer
+    if delay is None:
+        delay = settings.SNAPSHOT_PUBLISH_DELAY
+
+    def run():
+        try:
+            publish_snapshots()
+        except Exception as e:
+            logger.error(f"Snapshot publish failed: {str(e)}")
+        finally:
+            connection.close()
+
+    with _publish_lock:
+        if _publish_timer is not None:
+            _publish_timer.cancel()
+        _publish_timer = threading.Timer(delay, run)
+        _publish_timer.daemon = True
+        _publish_timer.start()
@@ -0,0 +1,30 @@
+import datetime
+import re
+
+from django.conf import settings
+from django.db import connection
+
+from core.models import Tender
+
+TRANSACTION_RE = re.compile(r'(BEGIN|COMMIT|ROLLBACK|SAVEPOINT|RELEASE SAVEPOINT)\b')
+
+
+def make_tender(tender_id, **fields):
+    fields.setdefault('title', f'Tender {tender_id}')
+    fields.setdefault('category', 'mechanical')
+    fields.setdefault('description', 'Supply of spare parts')
+    fields.setdefault('publication_date', datetime.date(2026, 1, 1))
+    fields.setdefault('deadline', datetime.date(2026, 2, 1))
+    return Tender.objects.create(tender_id=tender_id, **fields)
+
+
+def content_queries(context):
+    """
+    Queries captured by a CaptureQueriesContext, minus the shared cache's
+    lookups and the transactions its writes open.
+    """
+    table = connection.ops.quote_name(settings.CACHES.get('shared', {}).get('LOCATION', ''))
+    return [
+        q['sql'] for q in context.captured_queries
+        if table not in q['sql'] and not TRANSACTION_RE.match(q['sql'])
+    ]
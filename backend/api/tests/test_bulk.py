@@ -0,0 +1,24 @@
+from django.test import TestCase
+
+from ..cache import get_cache, get_generation
+from .helpers import make_tender
+
+
+class BulkInvalidationTests(TestCase):
+    def setUp(self):
+        get_cache().clear()
+        self.tender = make_tender('T-1')
+
+    def test_generation_moves_only_when_the_batch_commits(self):
+        generation = get_generation('core.tender')
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.patch(
+                '/api/tenders/bulk/', [{'id': self.tender.pk, 'title': 'Renamed'}],
+                content_type='application/json',
+            )
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_generation('core.tender'), generation)
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_generation('core.tender'), generation)
@@ -0,0 +1,27 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.models import SiteSettings
+from ..cache import _singletons, bump_generation, get_cache, get_singleton
+from .helpers import content_queries
+
+
+class SingletonTests(TestCase):
+    def setUp(self):
+        get_cache().clear()
+        _singletons.clear()
+        self.addCleanup(_singletons.clear)
+
+    def test_row_is_reused_until_another_worker_saves(self):
+        row = get_singleton(SiteSettings)
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertIs(get_singleton(SiteSettings), row)
+        self.assertEqual(content_queries(ctx), [])
+
+        # What a save in another worker leaves behind: a changed row and a
+        # moved stamp in the shared cache, but nothing in this worker's memory
+        SiteSettings.objects.filter(pk=1).update(certificate_title='ISO 14001')
+        get_cache().clear()
+        bump_generation('core.sitesettings')
+        self.assertEqual(get_singleton(SiteSettings).certificate_title, 'ISO 14001')
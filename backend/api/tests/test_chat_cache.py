@@ -0,0 +1,68 @@
+import threading
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from ..cache import get_cache
+from ..chat_cache import INDEX_KEY, AnswerCache
+
+
+@override_settings(CHAT_CACHE_MAX_ENTRIES=50, CHAT_CACHE_SIMILARITY=0.8)
+class AnswerCacheTests(TestCase):
+    def setUp(self):
+        get_cache().clear()
+
+    def test_concurrent_answers_all_reach_the_index(self):
+        def answer(worker):
+            cache = AnswerCache()
+            for i in range(5):
+                cache.set(f'question {worker} number {i}', f'answer {worker}-{i}', 10)
+
+        threads = [threading.Thread(target=answer, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(AnswerCache().stats()['size'], 20)
+
+    def test_size_cap_evicts_entries_with_their_questions(self):
+        cache = AnswerCache()
+        with self.settings(CHAT_CACHE_MAX_ENTRIES=2):
+            for topic in ('coal supply', 'ash disposal', 'unit capacity'):
+                cache.set(f'what is the {topic} plan', topic, 10)
+        self.assertIsNone(cache.get('what is the coal supply plan'))
+        self.assertEqual(cache.get('what is the unit capacity plan')['match'], 'exact')
+
+    def test_similar_match_after_incremental_updates(self):
+        cache = AnswerCache()
+        cache.set('What is the capacity of the Maitree power plant?', '1320 MW', 10)
+        self.assertEqual(cache.get('Maitree power plant capacity')['match'], 'similar')
+
+        cache.set('Where is the plant located?', 'Rampal, Bagerhat', 10)
+        row = cache._tfidf.rows['what is the capacity of the maitree power plant']
+        self.assertEqual(cache.get('where is the plant located')['response'], 'Rampal, Bagerhat')
+        self.assertEqual(cache.get('capacity of maitree power plant')['response'], '1320 MW')
+        # Existing questions keep their rows when others are added
+        self.assertEqual(cache._tfidf.rows['what is the capacity of the maitree power plant'], row)
+
+    def test_hits_refresh_recency_without_rewriting_the_index(self):
+        cache = AnswerCache()
+        with self.settings(CHAT_CACHE_MAX_ENTRIES=2):
+            cache.set('what is the coal supply plan', 'coal', 10)
+            cache.set('what is the ash disposal plan', 'ash', 10)
+            with mock.patch.object(get_cache(), 'set', wraps=get_cache().set) as cache_set:
+                self.assertEqual(cache.get('what is the coal supply plan')['match'], 'exact')
+            self.assertNotIn(INDEX_KEY, [call.args[0] for call in cache_set.call_args_list])
+
+            cache.set('what is the unit capacity plan', 'unit', 10)
+        self.assertEqual(cache.get('what is the coal supply plan')['response'], 'coal')
+        self.assertIsNone(cache.get('what is the ash disposal plan'))
+
+    def test_bengali_questions_get_their_own_entries(self):
+        cache = AnswerCache()
+        cache.set('রামপাল বিদ্যুৎ কেন্দ্রের ক্ষমতা কত?', '১৩২০ মেগাওয়াট', 10)
+        cache.set('রামপাল বিদ্যুৎ কেন্দ্র কোথায়?', 'বাগেরহাট', 10)
+
+        self.assertEqual(cache.get('রামপাল বিদ্যুৎ কেন্দ্রের ক্ষমতা কত')['response'], '১৩২০ মেগাওয়াট')
+        self.assertEqual(cache.get('রামপাল বিদ্যুৎ কেন্দ্র কোথায়')['response'], 'বাগেরহাট')
+        self.assertEqual(cache.stats()['size'], 2)
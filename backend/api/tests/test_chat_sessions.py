@@ -0,0 +1,40 @@
+from django.test import TestCase, override_settings
+
+from .. import chat_sessions
+from ..cache import get_cache
+
+
+@override_settings(GEMINI_API_KEY='')
+class ChatSessionTests(TestCase):
+    def setUp(self):
+        get_cache().clear()
+
+    def ask(self, message, session_id=None):
+        data = {'message': message}
+        if session_id:
+            data['session_id'] = session_id
+        response = self.client.post('/api/chat/', data, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        return response.json()['session_id']
+
+    def test_follow_up_on_another_worker_continues_the_session(self):
+        session_id = self.ask('Tell me about the Maitree plant')
+        # The next request lands on a worker with an empty local cache
+        get_cache().clear()
+        self.assertEqual(self.ask('And who runs it?', session_id), session_id)
+
+        _, session = chat_sessions.load_session(session_id)
+        questions = [turn['content'] for turn in session['turns'] if turn['role'] == 'user']
+        self.assertEqual(questions, ['Tell me about the Maitree plant', 'And who runs it?'])
+
+    @override_settings(CHAT_HISTORY_TOKEN_BUDGET=40)
+    def test_history_is_compacted_into_a_summary(self):
+        session_id = None
+        for topic in ('coal supply', 'ash disposal', 'unit capacity'):
+            session_id = self.ask(f'What is the {topic} arrangement for the plant?', session_id)
+
+        _, session = chat_sessions.load_session(session_id)
+        self.assertIn('coal supply', chat_sessions.summary_text(session))
+        self.assertLessEqual(
+            sum(chat_sessions.estimate_tokens(turn['content']) for turn in session['turns']), 40
+        )
@@ -0,0 +1,42 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from ..cache import get_cache, get_generation, get_shared_cache
+from .helpers import content_queries, make_tender
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        get_cache().clear()
+        make_tender('T-1')
+
+    def test_revalidation_with_unchanged_generations_costs_no_query(self):
+        response = self.client.get('/api/tenders/')
+        etag = response['ETag']
+
+        # Only the generation lookups in the shared cache, if it is a table
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self.client.get('/api/tenders/').status_code, 200)
+            response = self.client.get('/api/tenders/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(content_queries(ctx), [])
+
+    def test_generations_outlive_the_worker_cache(self):
+        if get_shared_cache() is get_cache():
+            self.skipTest('generations share the response cache (REDIS_URL)')
+        etag = self.client.get('/api/tenders/')['ETag']
+        generation = get_generation('core.tender')
+        # Another worker (or a restarted one) starts with an empty local cache
+        # but must agree on the generation, and so on the ETag
+        get_cache().clear()
+        self.assertEqual(get_generation('core.tender'), generation)
+        self.assertEqual(self.client.get('/api/tenders/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_write_changes_the_etag(self):
+        etag = self.client.get('/api/tenders/')['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            make_tender('T-2')
+        response = self.client.get('/api/tenders/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
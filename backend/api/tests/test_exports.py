@@ -0,0 +1,45 @@
+import csv
+import io
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from core.models import ContactInquiry
+
+
+class CsvExportTests(TestCase):
+    def setUp(self):
+        admin = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'secret')
+        self.client.force_login(admin)
+
+    def export(self):
+        response = self.client.get('/api/exports/inquiries.csv')
+        self.assertEqual(response.status_code, 200)
+        body = b''.join(response.streaming_content).decode('utf-8-sig')
+        return list(csv.DictReader(io.StringIO(body)))
+
+    def test_formula_cells_are_escaped(self):
+        ContactInquiry.objects.create(
+            full_name='=HYPERLINK("http://evil.example","Click")', organization='+880 1700',
+            email='a@example.com', category='general', message='@SUM(A1:A9)',
+        )
+        ContactInquiry.objects.create(
+            full_name='-2+3', organization='\tTabbed', email='b@example.com',
+            category='media', message='\rcmd',
+        )
+        ContactInquiry.objects.create(
+            full_name='Rahim Uddin', organization='BPDB', email='c@example.com',
+            category='technical', message='Meeting at 10 = fine',
+        )
+        first, second, plain = self.export()
+
+        self.assertEqual(first['full_name'], '\'=HYPERLINK("http://evil.example","Click")')
+        self.assertEqual(first['organization'], "'+880 1700")
+        self.assertEqual(first['message'], "'@SUM(A1:A9)")
+        self.assertEqual(second['full_name'], "'-2+3")
+        self.assertEqual(second['organization'], "'\tTabbed")
+        self.assertEqual(second['message'], "'\rcmd")
+        self.assertEqual(
+            [plain['full_name'], plain['organization'], plain['message']],
+            ['Rahim Uddin', 'BPDB', 'Meeting at 10 = fine'],
+        )
@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from .. import gemini
+from ..management.commands.gemini_stub import DEFAULT_REPLY, StubServer, make_handler
+
+
+@override_settings(
+    GEMINI_BREAKER_FAILURES=2, GEMINI_BREAKER_RESET_SECONDS=0.1, GEMINI_SLOW_CALL_MS=5000,
+    GEMINI_MAX_CONCURRENCY=1, GEMINI_QUEUE_TIMEOUT=0,
+)
+class GeminiUpstreamTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.options = {
+            'reply': DEFAULT_REPLY, 'chunks': 2, 'first_token_ms': 0,
+            'chunk_delay_ms': 0, 'fail': False, 'verbosity': 0,
+        }
+        cls.requests = []
+        handler = make_handler(cls.options)
+
+        class CountingHandler(handler):
+            def do_POST(self):
+                cls.requests.append(self.path)
+                super().do_POST()
+
+        cls.server = StubServer(('127.0.0.1', 0), CountingHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.enterClassContext(override_settings(
+            GEMINI_API_BASE=f'http://127.0.0.1:{cls.server.server_address[1]}/v1beta'
+        ))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.options['fail'] = False
+        self.requests.clear()
+        self.enterContext(mock.patch.object(gemini, 'breaker', gemini.CircuitBreaker()))
+        self.enterContext(mock.patch.object(gemini, '_budget', None))
+
+    def generate(self):
+        return gemini.generate('test-key', gemini.build_payload('system', 'hello', []))
+
+    def test_breaker_opens_after_consecutive_failures_and_rejects_instantly(self):
+        self.options['fail'] = True
+        for _ in range(2):
+            with self.assertRaisesMessage(Exception, 'API returned 503'):
+                self.generate()
+        self.assertEqual(gemini.breaker.state, gemini.CircuitBreaker.OPEN)
+
+        started = time.monotonic()
+        with self.assertRaises(gemini.UpstreamUnavailable):
+            self.generate()
+        self.assertLess(time.monotonic() - started, 0.05)
+        self.assertEqual(len(self.requests), 2)
+
+    def test_half_open_lets_a_single_probe_through(self):
+        self.options['fail'] = True
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                self.generate()
+        time.sleep(0.15)
+        self.options['fail'] = False
+
+        with gemini.upstream_call():
+            self.assertEqual(gemini.breaker.state, gemini.CircuitBreaker.HALF_OPEN)
+            # A second caller is turned away while the probe is in flight
+            with self.assertRaisesMessage(gemini.UpstreamUnavailable, 'probe in flight'):
+                gemini.breaker.before_call()
+        self.assertEqual(gemini.breaker.state, gemini.CircuitBreaker.CLOSED)
+        self.assertEqual(self.generate(), DEFAULT_REPLY)
+
+    def test_failed_probe_reopens_the_breaker(self):
+        self.options['fail'] = True
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                self.generate()
+        time.sleep(0.15)
+        with self.assertRaises(Exception):
+            self.generate()
+        self.assertEqual(gemini.breaker.state, gemini.CircuitBreaker.OPEN)
+        self.assertEqual(len(self.requests), 3)
+
+    def test_exhausted_budget_raises_without_calling_upstream(self):
+        with gemini.upstream_call():
+            with self.assertRaisesMessage(gemini.UpstreamUnavailable, 'budget exhausted'):
+                self.generate()
+        self.assertEqual(self.requests, [])
+        self.assertEqual(self.generate(), DEFAULT_REPLY)
+
+    def agenerate(self):
+        return gemini.agenerate('test-key', gemini.build_payload('system', 'hello', []))
+
+    def test_async_clients_are_closed_outside_asgi(self):
+        clients = []
+        new_client = gemini._new_async_client
+
+        def tracked():
+            clients.append(new_client())
+            return clients[-1]
+
+        with mock.patch.object(gemini, '_new_async_client', tracked):
+            # Under WSGI each async_to_sync call runs in a fresh event loop
+            for _ in range(2):
+                self.assertEqual(asyncio.run(self.agenerate()), DEFAULT_REPLY)
+        self.assertEqual(len(clients), 2)
+        self.assertTrue(all(client.is_closed for client in clients))
+
+    @override_settings(CHAT_ASYNC=True)
+    def test_async_client_is_shared_within_an_asgi_loop(self):
+        async def twice():
+            first = await self.agenerate()
+            client = gemini._async_clients[asyncio.get_running_loop()]
+            second = await self.agenerate()
+            self.assertIs(gemini._async_clients[asyncio.get_running_loop()], client)
+            self.assertFalse(client.is_closed)
+            await client.aclose()
+            return [first, second]
+
+        self.assertEqual(asyncio.run(twice()), [DEFAULT_REPLY, DEFAULT_REPLY])
@@ -0,0 +1,63 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+
+from core.models import Career, Notice, Tender
+from ..imports import RowImporter
+
+
+class ImportTests(TestCase):
+    def upload(self, content, name='tenders.csv'):
+        return self.client.post('/api/tenders/import/', {'file': SimpleUploadedFile(name, content.encode())})
+
+    def test_import_requires_an_admin(self):
+        content = 'tender_id,title,category,description,publication_date,deadline\nT-9,Pumps,mechanical,Spares,2026-01-01,2026-02-01\n'
+        self.assertEqual(self.upload(content).status_code, 403)
+        self.assertFalse(Tender.objects.exists())
+
+        admin = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'secret')
+        self.client.force_login(admin)
+        response = self.upload(content)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['imported'], 1)
+
+    def test_career_ids_only_update_existing_rows(self):
+        career = Career.objects.create(
+            title='Shift engineer', department='Operations', location='Rampal',
+            description='Run the units', requirements='BSc', deadline=datetime.date(2026, 3, 1),
+        )
+        common = {'department': 'Operations', 'location': 'Rampal', 'description': 'd',
+                  'requirements': 'r', 'deadline': '2026-03-01'}
+        rows = [
+            (2, {'id': str(career.pk), 'title': 'Senior shift engineer', **common}),
+            (3, {'id': str(career.pk + 100), 'title': 'Ghost', **common}),
+            (4, {'title': 'Chemist', **common}),
+        ]
+        summary = RowImporter('careers').run(rows)
+
+        self.assertEqual(summary['imported'], 2)
+        self.assertEqual([e['line'] for e in summary['errors']], [3])
+        career.refresh_from_db()
+        self.assertEqual(career.title, 'Senior shift engineer')
+        self.assertFalse(Career.objects.filter(pk=career.pk + 100).exists())
+        self.assertEqual(Career.objects.filter(title='Chemist').count(), 1)
+
+    def test_notices_without_a_slug_are_always_inserted(self):
+        existing = Notice.objects.create(title='Holiday notice', content='Eid', published_date=datetime.date(2026, 1, 1))
+        rows = [
+            (2, {'title': 'Holiday notice', 'content': 'Victory Day', 'published_date': '2026-03-01'}),
+            (3, {'title': 'Holiday notice', 'content': 'New Year', 'published_date': '2026-04-01'}),
+            (4, {'slug': 'holiday-notice', 'title': 'Holiday notice', 'content': 'Eid ul-Fitr',
+                 'published_date': '2026-01-01'}),
+        ]
+        summary = RowImporter('notices').run(rows)
+
+        self.assertEqual(summary['imported'], 3)
+        self.assertEqual(
+            dict(Notice.objects.values_list('slug', 'content')),
+            {'holiday-notice': 'Eid ul-Fitr', 'holiday-notice-1': 'Victory Day', 'holiday-notice-2': 'New Year'},
+        )
+        # Only the row naming the slug touched the stored notice
+        self.assertEqual(Notice.objects.get(slug='holiday-notice').pk, existing.pk)
@@ -0,0 +1,96 @@
+import base64
+import datetime
+import json
+from unittest import mock
+
+from django.test import TestCase
+
+from core.models import Notice
+from .. import pagination
+from ..cache import get_cache
+
+
+def cursor(payload):
+    raw = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+@mock.patch.object(pagination.KeysetPagination, 'page_size', 3)
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        get_cache().clear()
+        # Ties on every ordering column but the pk: -is_featured, -published_date, order, -id
+        for i in range(10):
+            Notice.objects.create(
+                title=f'Notice {i}', is_featured=i % 4 == 0, order=i % 2,
+                published_date=datetime.date(2026, 1, 1 + i % 3),
+            )
+        self.expected = list(
+            Notice.objects.filter(is_active=True)
+            .order_by('-is_featured', '-published_date', 'order', '-id').values_list('id', flat=True)
+        )
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_next_and_previous_walk_every_row_once(self):
+        pages = []
+        url = '/api/notices/?paginate=cursor'
+        while url:
+            data = self.get(url)
+            pages.append([row['id'] for row in data['results']])
+            url = data['next']
+        self.assertEqual([pk for page in pages for pk in page], self.expected)
+        self.assertEqual([len(page) for page in pages], [3, 3, 3, 1])
+        self.assertIsNone(self.get('/api/notices/?paginate=cursor')['previous'])
+
+        # Back from the last page through the previous links
+        backward = []
+        url = data['previous']
+        while url:
+            data = self.get(url)
+            backward.append([row['id'] for row in data['results']])
+            url = data['previous']
+        self.assertEqual(backward, pages[-2::-1])
+
+    def test_invalid_cursors_are_bad_requests(self):
+        first = self.get('/api/notices/?paginate=cursor')['results'][-1]
+        row = Notice.objects.get(pk=first['id'])
+        valid = [row.is_featured, row.published_date.isoformat(), row.order, row.pk]
+        tampered = [
+            'not base64 at all!',
+            cursor(b'not json'),
+            cursor(['v', 'r']),
+            cursor({'v': valid[:2], 'r': 0}),
+            cursor({'v': ['yes', *valid[1:]], 'r': 0}),
+            cursor({'v': [valid[0], 'tomorrow', *valid[2:]], 'r': 0}),
+            cursor({'v': [*valid[:3], {'id': 1}], 'r': 0}),
+            cursor({'v': [*valid[:3], None], 'r': 0}),
+        ]
+        for value in tampered:
+            with self.subTest(cursor=value):
+                response = self.client.get('/api/notices/', {'paginate': 'cursor', 'cursor': value})
+                self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            self.client.get('/api/notices/', {'paginate': 'cursor', 'cursor': cursor({'v': valid, 'r': 0})}).status_code,
+            200,
+        )
+
+
+class EstimatedCountPaginationTests(TestCase):
+    def setUp(self):
+        get_cache().clear()
+        for i in range(3):
+            Notice.objects.create(title=f'Notice {i}', published_date=datetime.date(2026, 1, 1))
+
+    def test_small_or_unestimated_results_are_counted(self):
+        data = self.client.get('/api/notices/?paginate=estimate').json()
+        self.assertEqual((data['count'], data['count_is_estimate']), (3, False))
+
+    def test_large_estimates_replace_the_count(self):
+        with mock.patch.object(pagination, 'estimate_count', return_value=250000):
+            data = self.client.get('/api/notices/?paginate=estimate').json()
+        self.assertEqual((data['count'], data['count_is_estimate']), (250000, True))
+        self.assertEqual(len(data['results']), 3)
@@ -0,0 +1,26 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from ..cache import get_cache
+from ..management.commands.check_query_plans import DEFAULT_URLS, explain, find_problems, seed
+
+
+class QueryPlanTests(TestCase):
+    """The paged list queries must stay index-backed (see check_query_plans)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed(5000)
+
+    def test_list_queries_use_indexes(self):
+        for url in DEFAULT_URLS:
+            with self.subTest(url=url):
+                get_cache().clear()
+                with CaptureQueriesContext(connection) as ctx:
+                    self.assertEqual(self.client.get(url).status_code, 200)
+                paged = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('SELECT') and ' LIMIT ' in q['sql']]
+                self.assertTrue(paged)
+                for sql in paged:
+                    plan = explain(sql)
+                    self.assertEqual(find_problems(plan), [], '\n'.join([sql, *plan]))
@@ -0,0 +1,100 @@
+import datetime
+import json
+
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from core.models import Career, GalleryImage, NewsArticle, Notice, Project, Tender
+from .. import serializers
+from ..cache import get_cache
+from ..readpath import compile_plan
+from .helpers import make_tender
+
+# (list URL, model, list serializer) for every viewset served by FastListMixin
+ENDPOINTS = [
+    ('/api/projects/', Project, serializers.ProjectListSerializer),
+    ('/api/news/', NewsArticle, serializers.NewsListSerializer),
+    ('/api/careers/', Career, serializers.CareerListSerializer),
+    ('/api/tenders/', Tender, serializers.TenderSerializer),
+    ('/api/notices/', Notice, serializers.NoticeListSerializer),
+    ('/api/gallery/', GalleryImage, serializers.GalleryImageListSerializer),
+]
+
+
+class CompiledListParityTests(TestCase):
+    """The compiled .values() path must render exactly what the serializers do."""
+
+    @classmethod
+    def setUpTestData(cls):
+        # One row with stored files and one without, per model; auto_now
+        # timestamps carry microseconds and render in TIME_ZONE (Asia/Dhaka)
+        for i, name in enumerate(['', 'uploads/report 2026 (final).pdf']):
+            Project.objects.create(
+                name=f'Project {i}', location='Rampal', capacity_mw=660, technology='Ultra-supercritical',
+                description='Coal', status=['operational', 'construction'][i], hero_image=name,
+                latitude='22.583300' if i else None, efficiency_percent='41.50' if i else None,
+            )
+            NewsArticle.objects.create(
+                title=f'News {i}', category=['press', 'in_the_news'][i], excerpt='Excerpt', content='Body',
+                image=name, published_date=datetime.date(2026, 3, 1 + i), is_featured=bool(i),
+            )
+            Career.objects.create(
+                title=f'Engineer {i}', department='Operations', location='Bagerhat',
+                employment_type=['full_time', 'contract'][i], description='Shift work',
+                requirements='BSc', deadline=datetime.date(2026, 4, 1),
+            )
+            make_tender(f'BIFPCL-{i}', category=['mechanical', 'it'][i], status=['open', 'awarded'][i], document=name)
+            Notice.objects.create(
+                title=f'Notice {i}', category=['general', 'urgent'][i], document=name,
+                attachment_name='Report' if i else '', published_date=datetime.date(2026, 1, 1 + i),
+            )
+            GalleryImage.objects.create(
+                title=f'Photo {i}', category=['project', 'event'][i], media_type=['image', 'video'][i],
+                image=name or 'gallery/plant.jpg', is_featured=bool(i),
+            )
+
+    def setUp(self):
+        get_cache().clear()
+
+    def expected(self, url, model, serializer_class):
+        """Serializer output for every row, keyed by id, as the JSON renderer emits it."""
+        request = APIRequestFactory().get(url)
+        data = serializer_class(model.objects.all(), many=True, context={'request': request}).data
+        return {row['id']: row for row in json.loads(JSONRenderer().render(data))}
+
+    def assertMatchesSerializer(self, url, model, serializer_class, fields=None):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        body = response.json()
+        rows = body['results'] if isinstance(body, dict) else body
+        self.assertEqual(len(rows), model.objects.count())
+        expected = self.expected(url, model, serializer_class)
+        for row in rows:
+            want = expected[row['id']]
+            if fields is not None:
+                want = {name: value for name, value in want.items() if name in fields}
+            self.assertEqual(row, want)
+
+    def test_every_list_endpoint_uses_the_compiled_plan(self):
+        for url, model, serializer_class in ENDPOINTS:
+            with self.subTest(url=url):
+                self.assertIsNotNone(compile_plan(serializer_class))
+
+    def test_list_output_matches_the_serializer(self):
+        for url, model, serializer_class in ENDPOINTS:
+            with self.subTest(url=url):
+                self.assertMatchesSerializer(url, model, serializer_class)
+
+    def test_keyset_pages_match_the_serializer(self):
+        for url in ['/api/notices/', '/api/news/', '/api/gallery/', '/api/tenders/']:
+            _, model, serializer_class = next(endpoint for endpoint in ENDPOINTS if endpoint[0] == url)
+            with self.subTest(url=url):
+                self.assertMatchesSerializer(f'{url}?paginate=cursor', model, serializer_class)
+
+    def test_sparse_fieldsets_match_the_serializer(self):
+        fields = {'id', 'category_display', 'document', 'published_date'}
+        self.assertMatchesSerializer(
+            '/api/notices/?fields=id,category_display,document,published_date',
+            Notice, serializers.NoticeListSerializer, fields=fields,
+        )
@@ -0,0 +1,81 @@
+import time
+from unittest import mock
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.models import Tender
+from ..cache import get_cache, get_shared_cache
+from ..replica import REPLICA_ALIAS
+from .helpers import content_queries, make_tender
+
+
+@override_settings(REPLICA_PIN_SECONDS=1)
+class ReplicaRoutingTests(TransactionTestCase):
+    @classmethod
+    def setUpClass(cls):
+        # A second alias mirroring the test database lets the router be
+        # exercised without a real replica. It is added to the connection
+        # handler only, and only for this class, so has_replica() (which reads
+        # settings.DATABASES) stays False for every other test. The test
+        # runner never sees the alias, so it is declared here rather than in
+        # a class-level `databases`.
+        handler_settings = connections.settings
+        primary = connections[DEFAULT_DB_ALIAS].settings_dict
+        connections.settings = {
+            **handler_settings,
+            REPLICA_ALIAS: {**primary, 'TEST': {**primary['TEST'], 'MIRROR': DEFAULT_DB_ALIAS}},
+        }
+
+        def remove_alias():
+            connections[REPLICA_ALIAS].close()
+            del connections[REPLICA_ALIAS]
+            connections.settings = handler_settings
+
+        cls.addClassCleanup(remove_alias)
+        cls.databases = {DEFAULT_DB_ALIAS, REPLICA_ALIAS}
+        super().setUpClass()
+
+    def setUp(self):
+        make_tender('T-1')
+        get_cache().clear()
+        # The cache table is not flushed between transactional tests
+        get_shared_cache().clear()
+        self.enterContext(mock.patch('api.replica.has_replica', return_value=True))
+
+    def get_tenders(self, query, **extra):
+        # Distinct query strings keep each read out of the response cache
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as primary, \
+                CaptureQueriesContext(connections[REPLICA_ALIAS]) as replica:
+            self.assertEqual(self.client.get(f'/api/tenders/?read={query}', **extra).status_code, 200)
+        return len(content_queries(primary)), len(replica)
+
+    def test_reads_go_to_the_replica(self):
+        primary, replica = self.get_tenders(1)
+        self.assertEqual(primary, 0)
+        self.assertGreater(replica, 0)
+        # The mirror reads the same test database
+        self.assertEqual(Tender.objects.using(REPLICA_ALIAS).count(), 1)
+
+    def test_writes_go_to_the_primary_and_pin_later_reads(self):
+        data = {
+            'tender_id': 'T-2', 'title': 'Cables', 'category': 'electrical', 'description': 'HV cables',
+            'publication_date': '2026-01-01', 'deadline': '2026-02-01',
+        }
+        with CaptureQueriesContext(connections[REPLICA_ALIAS]) as replica:
+            self.assertEqual(self.client.post('/api/tenders/', data).status_code, 201)
+        self.assertEqual(len(replica), 0)
+        self.assertTrue(Tender.objects.using(DEFAULT_DB_ALIAS).filter(tender_id='T-2').exists())
+
+        # Both the writer and other clients reading the written model stay
+        # on the primary for REPLICA_PIN_SECONDS
+        for query, extra in ((1, {}), (2, {'REMOTE_ADDR': '10.0.0.2'})):
+            primary, replica = self.get_tenders(query, **extra)
+            self.assertGreater(primary, 0)
+            self.assertEqual(replica, 0)
+
+        time.sleep(1.1)
+        primary, replica = self.get_tenders(3)
+        self.assertEqual(primary, 0)
+        self.assertGreater(replica, 0)
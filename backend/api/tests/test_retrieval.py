@@ -0,0 +1,59 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.models import Tender
+from ..cache import get_cache, get_shared_cache
+from ..retrieval import Retriever, _deleted_seq_key, _deleted_since, is_confident, record_deleted
+from .helpers import content_queries, make_tender
+
+
+class RetrieverTests(TestCase):
+    def setUp(self):
+        get_cache().clear()
+        make_tender('T-1', title='Boiler feed pump spares', category='mechanical')
+        make_tender('T-2', title='Switchyard breakers', category='electrical')
+        self.retriever = Retriever()
+
+    def test_pure_list_questions_are_confident(self):
+        answer, confidence = self.retriever.answer('Which electrical tenders are open?')
+        self.assertTrue(is_confident(confidence))
+        self.assertIn('Switchyard breakers', answer)
+        self.assertNotIn('Boiler feed pump', answer)
+
+    def test_content_words_matching_listed_documents_stay_confident(self):
+        answer, confidence = self.retriever.answer('Any tenders for boiler pumps?')
+        self.assertTrue(is_confident(confidence))
+        self.assertTrue(answer.split('\n')[1].startswith('• T-1'))
+
+    def test_unmatched_content_words_escalate(self):
+        _, confidence = self.retriever.answer('How do I submit a bid for tender T-1?')
+        self.assertFalse(is_confident(confidence))
+        _, confidence = self.retriever.answer('Any update on the unit 2 synchronisation?')
+        self.assertFalse(is_confident(confidence))
+
+    def test_refresh_reads_only_changed_rows_and_logged_deletes(self):
+        self.retriever.refresh()
+        tenders = list(Tender.objects.order_by('tender_id'))
+        with self.captureOnCommitCallbacks(execute=True):
+            tenders[0].title = 'Coal conveyor belts'
+            tenders[0].save()
+        with self.captureOnCommitCallbacks(execute=True):
+            tenders[1].delete()
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.retriever.refresh()
+        self.assertEqual(len(content_queries(ctx)), 1)
+        titles = {d.title for d in self.retriever.index.documents.values() if d.doc_type == 'tender'}
+        self.assertEqual(titles, {'T-1 - Coal conveyor belts'})
+
+    def test_delete_log_tolerates_a_lagging_counter(self):
+        record_deleted('core.tender', [101])
+        record_deleted('core.tender', [102])
+        # A racing writer claimed slot 2, then the other writer's counter
+        # update landed last
+        get_shared_cache().set(_deleted_seq_key('core.tender'), 1, timeout=None)
+        self.assertEqual(_deleted_since('core.tender', 0), ([101, 102], 2))
+
+        record_deleted('core.tender', [103])
+        self.assertEqual(_deleted_since('core.tender', 2), ([103], 3))
@@ -0,0 +1,65 @@
+import datetime
+import importlib
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+
+from core.models import Notice
+from .. import search
+from .helpers import make_tender
+
+migration = importlib.import_module('core.migrations.0009_search_index')
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        self.notice = Notice.objects.create(
+            title='Transformer maintenance shutdown', excerpt='Unit 1 outage',
+            content='The generator transformer will be serviced next week.',
+            published_date=datetime.date(2026, 1, 1),
+        )
+        self.tender = make_tender(
+            'T-1', title='Cooling water pumps', category='electrical',
+            description='Spares for the pumps feeding the auxiliary transformer bay.',
+        )
+        Notice.objects.create(
+            title='Transformer tender archive', content='Old', is_active=False,
+            published_date=datetime.date(2025, 1, 1),
+        )
+
+    def assert_ranked(self, result):
+        self.assertEqual(result['facets'], {'notice': 1, 'news': 0, 'tender': 1, 'career': 0})
+        self.assertEqual(
+            [(hit['type'], hit['id']) for hit in result['results']],
+            [('notice', self.notice.pk), ('tender', self.tender.pk)],
+        )
+        self.assertEqual(result['results'][0]['title'], '<mark>Transformer</mark> maintenance shutdown')
+        self.assertIn('<mark>transformer</mark>', result['results'][1]['snippet'])
+
+    def test_full_text_prefix_match_ranks_title_hits_first(self):
+        self.assertTrue(search.is_supported())
+        self.assert_ranked(search.search('transf'))
+        self.assertEqual(search.search('transformer pumps', types=['tender'])['count'], 1)
+        self.assertEqual(search.search('transformer', types=['news'])['results'], [])
+
+    def test_icontains_fallback_ranks_title_hits_first(self):
+        with mock.patch.object(search, 'is_supported', return_value=False):
+            self.assert_ranked(search.search('transf'))
+            result = search.search('transformer pumps', types=['tender'])
+        self.assertEqual(result['count'], 1)
+        self.assertEqual(result['results'][0]['title'], 'Cooling water <mark>pumps</mark>')
+
+    def test_migration_backfill_matches_the_signal_built_rows(self):
+        def rows():
+            with connection.cursor() as cursor:
+                cursor.execute(f'SELECT doc_type, object_id, url, title, body FROM {search.SEARCH_TABLE} ORDER BY rowid')
+                return cursor.fetchall()
+
+        indexed = rows()
+        self.assertEqual(len(indexed), 2)
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {search.SEARCH_TABLE}')
+            for sql in migration.backfill_sql(connection.vendor):
+                cursor.execute(sql)
+        self.assertEqual(rows(), indexed)
@@ -0,0 +1,53 @@
+import gzip
+import json
+import tempfile
+
+from django.test import TestCase, override_settings
+
+from core.models import Tender
+from ..snapshots import publish_snapshots
+from .helpers import make_tender
+
+
+class SnapshotTests(TestCase):
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        settings_override = override_settings(
+            SNAPSHOT_ROOT=root.name, SNAPSHOT_KEEP_VERSIONS=1,
+            SNAPSHOT_SITE_URL='https://bifpcl.example',
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.tender = make_tender('T-1', document='tenders/t-1.pdf')
+
+    def test_versions_are_served_and_pointer_is_api_only(self):
+        pointer = publish_snapshots()
+        self.assertEqual(self.client.get('/api/snapshots/current/').json(), pointer)
+        self.assertEqual(self.client.get('/snapshots/current.json').status_code, 404)
+
+        url = f"{pointer['base_url']}tenders/{self.tender.pk}.json"
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('immutable', response['Cache-Control'])
+        data = json.loads(gzip.decompress(b''.join(response.streaming_content)))
+        self.assertEqual(data['document'], 'https://bifpcl.example/media/tenders/t-1.pdf')
+
+    def test_pruned_versions_are_not_found(self):
+        old = publish_snapshots()
+        Tender.objects.filter(pk=self.tender.pk).update(title='Renamed')
+        new = publish_snapshots()
+        self.assertNotEqual(old['version'], new['version'])
+        self.assertEqual(self.client.get(f"{old['base_url']}tenders/index.json").status_code, 404)
+        self.assertEqual(self.client.get(f"{new['base_url']}tenders/index.json").status_code, 200)
+
+    @override_settings(SNAPSHOT_SITE_URL='http://testserver')
+    def test_index_uses_the_list_endpoint_envelope(self):
+        make_tender('T-2')
+        pointer = publish_snapshots()
+        response = self.client.get(f"{pointer['base_url']}tenders/index.json")
+        index = json.loads(b''.join(response.streaming_content))
+        live = self.client.get('/api/tenders/').json()
+        self.assertEqual(index, live)
+        self.assertEqual(index['count'], 2)
+        self.assertIsNone(index['next'])
@@ -1,12 +1,16 @@
 from django.urls import path, include
+from django.conf import settings
 from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework.routers import DefaultRouter
 from .views import (
     CompanyInfoView, ProjectViewSet, DirectorViewSet, NewsViewSet,
     CareerViewSet, JobApplicationView, TenderViewSet,
     ContactInquiryView, CSRInitiativeViewSet, NoticeViewSet, GalleryImageViewSet,
-    SiteSettingsView, ChatBotView
+    SiteSettingsView, ChatBotView, CacheStatsView, HomeBundleView,
+    SnapshotPointerView, AsyncChatBotView, SearchView
 )
+from .exports import ExportView
 
 
 def health_check(request):
@@ -28,8 +32,14 @@ urlpatterns = [
     path('health/', health_check, name='health-check'),
     path('', include(router.urls)),
     path('company/', CompanyInfoView.as_view(), name='company-info'),
+    path('home/', HomeBundleView.as_view(), name='home-bundle'),
+    path('search/', SearchView.as_view(), name='search'),
     path('apply/', JobApplicationView.as_view(), name='job-application'),
     path('contact/', ContactInquiryView.as_view(), name='contact-inquiry'),
+    path('exports/<str:resource>.<str:fmt>', ExportView.as_view(), name='export'),
     path('settings/', SiteSettingsView.as_view(), name='site-settings'),
-    path('chat/', ChatBotView.as_view(), name='chatbot'),
+    path('chat/', csrf_exempt(AsyncChatBotView.as_view()) if settings.CHAT_ASYNC else ChatBotView.as_view(), name='chatbot'),
+    path('chat/async/', csrf_exempt(AsyncChatBotView.as_view()), name='chatbot-async'),
+    path('cache/stats/', CacheStatsView.as_view(), name='cache-stats'),
+    path('snapshots/current/', SnapshotPointerView.as_view(), name='snapshot-current'),
 ]
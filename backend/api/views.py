@@ -3,11 +3,18 @@ from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.views import APIView
+from rest_framework.permissions import SAFE_METHODS
 from django_filters.rest_framework import DjangoFilterBackend
 from django.conf import settings
-import requests
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.views import View
+from asgiref.sync import sync_to_async
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.static import serve
 import json
 import logging
+import os
+import time
 
 logger = logging.getLogger(__name__)
 from core.models import (
@@ -23,6 +30,24 @@ from .serializers import (
     GalleryImageListSerializer, GalleryImageDetailSerializer,
     SiteSettingsSerializer
 )
+from .bulk import BulkMixin, ReorderMixin
+from .cache import (
+    CachedResponseMixin, build_cache_key, cached_action, cached_response,
+    get_singleton, get_stats
+)
+from .conditional import ConditionalGetMixin
+from .dbpool import get_pool_status
+from .imports import ImportMixin
+from .lookups import SlugOrPkLookupMixin
+from .pagination import SelectablePaginationMixin
+from .parsers import MessagePackParser
+from .projection import SparseFieldsetMixin
+from .readpath import FastListMixin
+from .replica import ReplicaReadMixin
+from .snapshots import get_current_snapshot
+from .chat_cache import answer_cache
+from .retrieval import retriever, is_confident
+from . import chat_sessions, gemini, search
 
 
 class CompanyInfoView(generics.RetrieveAPIView):
@@ -30,44 +55,14 @@ class CompanyInfoView(generics.RetrieveAPIView):
     serializer_class = CompanyInfoSerializer
 
     def get_object(self):
-        obj, _ = CompanyInfo.objects.get_or_create(pk=1)
-        return obj
+        return get_singleton(CompanyInfo)
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(SlugOrPkLookupMixin, SparseFieldsetMixin, BulkMixin, ReplicaReadMixin, ConditionalGetMixin, CachedResponseMixin, FastListMixin, viewsets.ModelViewSet):
     """CRUD operations for projects"""
     queryset = Project.objects.all()
     serializer_class = ProjectDetailSerializer
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
-
-    def get_lookup_field(self):
-        """Use 'slug' for retrieve, 'pk' for update/delete"""
-        if self.action in ['retrieve']:
-            return 'slug'
-        return 'pk'
-
-    def get_object(self):
-        """Override to support both slug and pk lookups"""
-        queryset = self.get_queryset()
-        lookup_value = self.kwargs.get('pk')
-
-        # Try pk first for update/delete operations
-        if self.action in ['update', 'partial_update', 'destroy']:
-            try:
-                obj = queryset.get(pk=int(lookup_value))
-                self.check_object_permissions(self.request, obj)
-                return obj
-            except (ValueError, Project.DoesNotExist):
-                pass
-
-        # Fall back to slug lookup
-        try:
-            obj = queryset.get(slug=lookup_value)
-            self.check_object_permissions(self.request, obj)
-            return obj
-        except Project.DoesNotExist:
-            from rest_framework.exceptions import NotFound
-            raise NotFound("Project not found")
+    parser_classes = [MultiPartParser, FormParser, JSONParser, MessagePackParser]
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -75,41 +70,18 @@ class ProjectViewSet(viewsets.ModelViewSet):
         return ProjectDetailSerializer
 
 
-class DirectorViewSet(viewsets.ModelViewSet):
+class DirectorViewSet(BulkMixin, ReorderMixin, ReplicaReadMixin, ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
     """CRUD operations for directors"""
     queryset = Director.objects.all()
     serializer_class = DirectorSerializer
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser, MessagePackParser]
 
 
-class NewsViewSet(viewsets.ModelViewSet):
+class NewsViewSet(SelectablePaginationMixin, SlugOrPkLookupMixin, SparseFieldsetMixin, BulkMixin, ReplicaReadMixin, ConditionalGetMixin, CachedResponseMixin, FastListMixin, viewsets.ModelViewSet):
     """CRUD operations for news articles"""
     queryset = NewsArticle.objects.all()
     serializer_class = NewsDetailSerializer
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
-
-    def get_object(self):
-        """Override to support both slug and pk lookups"""
-        queryset = self.get_queryset()
-        lookup_value = self.kwargs.get('pk')
-
-        # Try pk first for update/delete operations
-        if self.action in ['update', 'partial_update', 'destroy']:
-            try:
-                obj = queryset.get(pk=int(lookup_value))
-                self.check_object_permissions(self.request, obj)
-                return obj
-            except (ValueError, NewsArticle.DoesNotExist):
-                pass
-
-        # Fall back to slug lookup
-        try:
-            obj = queryset.get(slug=lookup_value)
-            self.check_object_permissions(self.request, obj)
-            return obj
-        except NewsArticle.DoesNotExist:
-            from rest_framework.exceptions import NotFound
-            raise NotFound("News article not found")
+    parser_classes = [MultiPartParser, FormParser, JSONParser, MessagePackParser]
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -117,6 +89,7 @@ class NewsViewSet(viewsets.ModelViewSet):
         return NewsDetailSerializer
 
     @action(detail=False, methods=['get'])
+    @cached_action
     def featured(self, request):
         """Get featured news articles"""
         featured = self.queryset.filter(is_featured=True)[:3]
@@ -124,10 +97,11 @@ class NewsViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class CareerViewSet(viewsets.ModelViewSet):
+class CareerViewSet(SparseFieldsetMixin, BulkMixin, ImportMixin, ReplicaReadMixin, ConditionalGetMixin, CachedResponseMixin, FastListMixin, viewsets.ModelViewSet):
     """CRUD operations for job listings"""
+    import_resource = 'careers'
     queryset = Career.objects.all()
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser, MessagePackParser]
 
     def get_queryset(self):
         """Show only active careers for list, all for admin operations"""
@@ -146,11 +120,12 @@ class JobApplicationView(generics.CreateAPIView):
     serializer_class = JobApplicationSerializer
 
 
-class TenderViewSet(viewsets.ModelViewSet):
+class TenderViewSet(SelectablePaginationMixin, SparseFieldsetMixin, BulkMixin, ImportMixin, ReplicaReadMixin, ConditionalGetMixin, CachedResponseMixin, FastListMixin, viewsets.ModelViewSet):
     """CRUD operations for tenders with filtering"""
+    import_resource = 'tenders'
     queryset = Tender.objects.all()
     serializer_class = TenderSerializer
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser, MessagePackParser]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['status', 'category']
 
@@ -160,18 +135,19 @@ class ContactInquiryView(generics.CreateAPIView):
     serializer_class = ContactInquirySerializer
 
 
-class CSRInitiativeViewSet(viewsets.ModelViewSet):
+class CSRInitiativeViewSet(BulkMixin, ReorderMixin, ReplicaReadMixin, ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
     """CRUD operations for CSR initiatives"""
     queryset = CSRInitiative.objects.all()
     serializer_class = CSRInitiativeSerializer
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser, MessagePackParser]
 
 
-class NoticeViewSet(viewsets.ModelViewSet):
+class NoticeViewSet(SelectablePaginationMixin, SlugOrPkLookupMixin, SparseFieldsetMixin, BulkMixin, ImportMixin, ReorderMixin, ReplicaReadMixin, ConditionalGetMixin, CachedResponseMixin, FastListMixin, viewsets.ModelViewSet):
     """CRUD operations for notices"""
+    import_resource = 'notices'
     queryset = Notice.objects.all()
     serializer_class = NoticeDetailSerializer
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser, MessagePackParser]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['category', 'is_featured']
 
@@ -181,35 +157,13 @@ class NoticeViewSet(viewsets.ModelViewSet):
             return Notice.objects.filter(is_active=True)
         return Notice.objects.all()
 
-    def get_object(self):
-        """Override to support both slug and pk lookups"""
-        queryset = Notice.objects.all()  # Use all notices for admin
-        lookup_value = self.kwargs.get('pk')
-
-        # Try pk first for update/delete operations
-        if self.action in ['update', 'partial_update', 'destroy']:
-            try:
-                obj = queryset.get(pk=int(lookup_value))
-                self.check_object_permissions(self.request, obj)
-                return obj
-            except (ValueError, Notice.DoesNotExist):
-                pass
-
-        # Fall back to slug lookup
-        try:
-            obj = queryset.get(slug=lookup_value)
-            self.check_object_permissions(self.request, obj)
-            return obj
-        except Notice.DoesNotExist:
-            from rest_framework.exceptions import NotFound
-            raise NotFound("Notice not found")
-
     def get_serializer_class(self):
         if self.action == 'list':
             return NoticeListSerializer
         return NoticeDetailSerializer
 
     @action(detail=False, methods=['get'])
+    @cached_action
     def featured(self, request):
         """Get featured notices"""
         featured = Notice.objects.filter(is_active=True, is_featured=True)[:5]
@@ -217,43 +171,21 @@ class NoticeViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class GalleryImageViewSet(viewsets.ModelViewSet):
+class GalleryImageViewSet(SelectablePaginationMixin, SlugOrPkLookupMixin, SparseFieldsetMixin, BulkMixin, ReorderMixin, ReplicaReadMixin, ConditionalGetMixin, CachedResponseMixin, FastListMixin, viewsets.ModelViewSet):
     """CRUD operations for gallery images"""
     queryset = GalleryImage.objects.all()
     serializer_class = GalleryImageDetailSerializer
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser, MessagePackParser]
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['category', 'media_type', 'is_featured']
 
-    def get_object(self):
-        """Override to support both slug and pk lookups"""
-        queryset = self.get_queryset()
-        lookup_value = self.kwargs.get('pk')
-
-        # Try pk first for update/delete operations
-        if self.action in ['update', 'partial_update', 'destroy']:
-            try:
-                obj = queryset.get(pk=int(lookup_value))
-                self.check_object_permissions(self.request, obj)
-                return obj
-            except (ValueError, GalleryImage.DoesNotExist):
-                pass
-
-        # Fall back to slug lookup
-        try:
-            obj = queryset.get(slug=lookup_value)
-            self.check_object_permissions(self.request, obj)
-            return obj
-        except GalleryImage.DoesNotExist:
-            from rest_framework.exceptions import NotFound
-            raise NotFound("Gallery image not found")
-
     def get_serializer_class(self):
         if self.action == 'list':
             return GalleryImageListSerializer
         return GalleryImageDetailSerializer
 
     @action(detail=False, methods=['get'])
+    @cached_action
     def featured(self, request):
         """Get featured gallery images"""
         featured = self.queryset.filter(is_featured=True)[:8]
@@ -264,12 +196,118 @@ class GalleryImageViewSet(viewsets.ModelViewSet):
 class SiteSettingsView(generics.RetrieveUpdateAPIView):
     """Get and update site settings (singleton)"""
     serializer_class = SiteSettingsSerializer
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser, MessagePackParser]
 
     def get_object(self):
+        if self.request.method in SAFE_METHODS:
+            return get_singleton(SiteSettings)
         return SiteSettings.get_settings()
 
 
+class HomeBundleView(APIView):
+    """Everything the homepage renders, in a single cacheable response"""
+    cache_models = (
+        CompanyInfo, SiteSettings, Project, Director, NewsArticle,
+        Tender, CSRInitiative, Notice, GalleryImage,
+    )
+
+    def get(self, request):
+        labels = sorted(model._meta.label_lower for model in self.cache_models)
+        key = build_cache_key(request, labels, 'home')
+        return cached_response(request, key, lambda: Response(self.get_bundle(request)))
+
+    def get_bundle(self, request):
+        """One query per section; company and settings come from the singleton cache"""
+        context = {'request': request}
+        page_size = settings.REST_FRAMEWORK['PAGE_SIZE']
+        active_notices = Notice.objects.filter(is_active=True)
+
+        def serialize(serializer_class, queryset):
+            return serializer_class(queryset, many=True, context=context).data
+
+        return {
+            'company': CompanyInfoSerializer(get_singleton(CompanyInfo), context=context).data,
+            'settings': SiteSettingsSerializer(get_singleton(SiteSettings), context=context).data,
+            'projects': serialize(ProjectListSerializer, Project.objects.all()[:page_size]),
+            'directors': serialize(DirectorSerializer, Director.objects.all()[:page_size]),
+            'news': serialize(NewsListSerializer, NewsArticle.objects.all()[:4]),
+            'featured_news': serialize(NewsListSerializer, NewsArticle.objects.filter(is_featured=True)[:3]),
+            'notices': serialize(NoticeListSerializer, active_notices[:page_size]),
+            'featured_notices': serialize(NoticeListSerializer, active_notices.filter(is_featured=True)[:5]),
+            'featured_gallery': serialize(GalleryImageListSerializer, GalleryImage.objects.filter(is_featured=True)[:8]),
+            'csr': serialize(CSRInitiativeSerializer, CSRInitiative.objects.all()[:page_size]),
+            'open_tenders': serialize(TenderSerializer, Tender.objects.filter(status='open')[:3]),
+        }
+
+
+class SearchView(APIView):
+    """Full-text search across notices, news, tenders and careers"""
+    cache_models = (Notice, NewsArticle, Tender, Career)
+
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if len(query) < 2:
+            return Response(
+                {'error': 'Query must be at least 2 characters'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        types = [t for t in request.query_params.get('type', '').split(',') if t]
+        try:
+            limit = int(request.query_params.get('limit', 20))
+        except ValueError:
+            limit = 20
+
+        labels = sorted(model._meta.label_lower for model in self.cache_models)
+        key = build_cache_key(request, labels, 'search')
+        return cached_response(
+            request, key, lambda: Response({'query': query, **search.search(query, types, limit)})
+        )
+
+
+class SnapshotPointerView(APIView):
+    """Pointer to the current static JSON snapshot version"""
+
+    def get(self, request):
+        pointer = get_current_snapshot()
+        if pointer is None:
+            return Response({'error': 'No snapshot published'}, status=status.HTTP_404_NOT_FOUND)
+        response = Response(pointer)
+        patch_cache_control(response, no_cache=True)
+        return response
+
+
+def serve_snapshot(request, path):
+    """Serve files of a published snapshot version, precompressed when accepted"""
+    # The pointer moves, so it is only served from /api/snapshots/current/
+    if '/' not in path.strip('/'):
+        raise Http404
+    accept_encoding = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    for suffix, encoding in (('.br', 'br'), ('.gz', 'gzip')):
+        if encoding in accept_encoding and os.path.isfile(os.path.join(settings.SNAPSHOT_ROOT, path + suffix)):
+            response = serve(request, path + suffix, document_root=settings.SNAPSHOT_ROOT)
+            response['Content-Type'] = 'application/json'
+            response['Content-Encoding'] = encoding
+            break
+    else:
+        response = serve(request, path, document_root=settings.SNAPSHOT_ROOT)
+    # Version directories are never rewritten once published
+    patch_cache_control(response, public=True, max_age=31536000, immutable=True)
+    patch_vary_headers(response, ['Accept-Encoding'])
+    return response
+
+
+class CacheStatsView(APIView):
+    """Hit/miss counters for the API response cache, plus chat, Gemini and DB pool state"""
+
+    def get(self, request):
+        return Response({
+            **get_stats(),
+            'chat': answer_cache.stats(),
+            'gemini': gemini.get_status(),
+            'database': get_pool_status(),
+        })
+
+
 class ChatBotView(APIView):
     """AI-powered chatbot using Google Gemini API"""
 
@@ -314,7 +352,6 @@ Guidelines:
     def post(self, request):
         """Handle chat messages"""
         message = request.data.get('message', '').strip()
-        conversation_history = request.data.get('history', [])
 
         if not message:
             return Response(
@@ -322,116 +359,207 @@ Guidelines:
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        session_id, session = chat_sessions.load_session(request.data.get('session_id'))
+        if chat_sessions.is_first_turn(session) and request.data.get('history'):
+            # Widgets predating server-side sessions still send their history
+            session = chat_sessions.session_from_history(request.data['history'])
+
+        def reply(text, **extra):
+            chat_sessions.record_exchange(session_id, session, message, text)
+            return Response({'response': text, 'session_id': session_id, **extra})
+
+        # Answer from live site content when local retrieval is confident
+        local_answer, confidence = retriever.answer(message)
+        if local_answer and is_confident(confidence):
+            return reply(local_answer, source='local')
+
         api_key = settings.GEMINI_API_KEY
         if not api_key:
-            # Fallback to predefined responses if no API key
-            return Response({
-                'response': self.get_fallback_response(message),
-                'fallback': True
-            })
+            # Fallback to the best local answer if no API key
+            return reply(self.get_fallback_response(message), fallback=True)
+
+        # First-turn questions can be answered from the shared answer cache
+        cacheable = chat_sessions.is_first_turn(session)
+        if cacheable:
+            cached = answer_cache.get(message)
+            if cached:
+                return reply(cached['response'], cached=cached['match'])
+
+        if request.data.get('stream'):
+            return self.stream_response(api_key, message, session_id, session, cacheable)
 
         try:
-            response_text = self.call_gemini_api(api_key, message, conversation_history)
-            return Response({'response': response_text})
+            started = time.perf_counter()
+            response_text = self.call_gemini_api(api_key, message, session)
+            if cacheable:
+                answer_cache.set(message, response_text, (time.perf_counter() - started) * 1000)
+            return reply(response_text)
+        except gemini.UpstreamUnavailable as e:
+            logger.warning(f"Gemini API skipped: {str(e)}")
+            return reply(self.get_fallback_response(message), fallback=True)
         except Exception as e:
             logger.error(f"Gemini API error: {str(e)}")
             # Fallback on error
-            return Response({
-                'response': self.get_fallback_response(message),
-                'fallback': True
-            })
+            return reply(self.get_fallback_response(message), fallback=True)
+
+    def build_payload(self, message, session):
+        """Prompt for the new message with the session's compacted history"""
+        return gemini.build_payload(
+            self.SYSTEM_PROMPT, message, session['turns'], chat_sessions.summary_text(session)
+        )
 
-    def call_gemini_api(self, api_key, message, history):
+    def call_gemini_api(self, api_key, message, session):
         """Call Google Gemini API"""
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={api_key}"
+        return gemini.generate(api_key, self.build_payload(message, session))
 
-        # Build conversation with system prompt
-        contents = []
+    def stream_gemini_api(self, api_key, message, session):
+        """Call Google Gemini's streaming API, yielding text chunks"""
+        return gemini.stream_generate(api_key, self.build_payload(message, session))
 
-        # Add system instruction as first user message
-        contents.append({
-            "role": "user",
-            "parts": [{"text": self.SYSTEM_PROMPT}]
-        })
-        contents.append({
-            "role": "model",
-            "parts": [{"text": "I understand. I'm the BIFPCL AI Assistant, ready to help visitors with information about the Maitree Super Thermal Power Project, tenders, careers, and more. How can I assist you?"}]
-        })
+    def stream_response(self, api_key, message, session_id, session, cacheable):
+        """Relay Gemini's reply to the client as server-sent events"""
 
-        # Add conversation history
-        for msg in history[-10:]:  # Keep last 10 messages for context
-            role = "user" if msg.get('role') == 'user' else "model"
-            contents.append({
-                "role": role,
-                "parts": [{"text": msg.get('content', '')}]
-            })
-
-        # Add current message
-        contents.append({
-            "role": "user",
-            "parts": [{"text": message}]
-        })
+        def sse(data):
+            return f"data: {json.dumps(data)}\n\n"
 
-        payload = {
-            "contents": contents,
-            "generationConfig": {
-                "temperature": 0.7,
-                "topK": 40,
-                "topP": 0.95,
-                "maxOutputTokens": 1024,
-            },
-            "safetySettings": [
-                {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-                {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-                {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-                {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
-            ]
-        }
+        def events():
+            parts = []
+            started = time.perf_counter()
+            try:
+                for text in self.stream_gemini_api(api_key, message, session):
+                    parts.append(text)
+                    yield sse({'delta': text})
+                if not parts:
+                    raise Exception("No valid response from API")
+            except Exception as e:
+                logger.error(f"Gemini streaming error: {str(e)}")
+                if parts:
+                    yield sse({'done': True, 'error': True, 'session_id': session_id})
+                else:
+                    # Nothing sent yet: fall back exactly like the JSON path
+                    fallback = self.get_fallback_response(message)
+                    chat_sessions.record_exchange(session_id, session, message, fallback)
+                    yield sse({'delta': fallback})
+                    yield sse({'done': True, 'fallback': True, 'session_id': session_id})
+                return
+
+            response_text = ''.join(parts)
+            if cacheable:
+                answer_cache.set(message, response_text, (time.perf_counter() - started) * 1000)
+            chat_sessions.record_exchange(session_id, session, message, response_text)
+            yield sse({'done': True, 'session_id': session_id})
+
+        response = StreamingHttpResponse(events(), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'  # Don't let proxies buffer the stream
+        return response
 
-        response = requests.post(
-            url,
-            headers={"Content-Type": "application/json"},
-            json=payload,
-            timeout=30
-        )
+    def get_fallback_response(self, query):
+        """Best local retrieval answer when the API is unavailable"""
+        answer, _ = retriever.answer(query)
+        if answer:
+            return answer
 
-        if response.status_code != 200:
-            logger.error(f"Gemini API error: {response.status_code} - {response.text}")
-            raise Exception(f"API returned {response.status_code}")
+        return "Thank you for your question. For more information, please visit:\n• /tenders - Procurement opportunities\n• /careers - Job openings\n• /notices - Announcements\n• /contact - Get in touch\n\nIs there something specific about BIFPCL I can help you with?"
 
-        data = response.json()
 
-        # Extract response text
-        if 'candidates' in data and len(data['candidates']) > 0:
-            candidate = data['candidates'][0]
-            if 'content' in candidate and 'parts' in candidate['content']:
-                return candidate['content']['parts'][0].get('text', '')
+class AsyncChatBotView(View):
+    """
+    Non-blocking chat endpoint for ASGI deployments (e.g. uvicorn workers).
 
-        raise Exception("No valid response from API")
+    Same request and response contract as ChatBotView, but waiting on Gemini
+    suspends a coroutine instead of pinning a worker thread, so one process
+    can hold hundreds of open conversations.
+    """
+    http_method_names = ['post', 'options']
 
-    def get_fallback_response(self, query):
-        """Fallback responses when API is unavailable"""
-        query_lower = query.lower()
+    async def post(self, request):
+        """Handle chat messages"""
+        try:
+            data = json.loads(request.body or b'{}')
+        except ValueError:
+            return JsonResponse({'error': 'Invalid JSON'}, status=status.HTTP_400_BAD_REQUEST)
 
-        if any(word in query_lower for word in ['bifpcl', 'about', 'maitree', 'project', 'company']):
-            return "BIFPCL (Bangladesh-India Friendship Power Company Limited) is a 50:50 joint venture between NTPC Ltd. of India and BPDB of Bangladesh. The Maitree Super Thermal Power Project is a 1320 MW ultra-supercritical coal-fired power plant located in Rampal, Bagerhat, Bangladesh."
+        message = (data.get('message') or '').strip()
+        if not message:
+            return JsonResponse({'error': 'Message is required'}, status=status.HTTP_400_BAD_REQUEST)
 
-        if any(word in query_lower for word in ['tender', 'bid', 'procurement']):
-            return "You can view all active tenders on our Tenders page at /tenders. We regularly post new procurement opportunities for goods, services, and works."
+        session_id, session = await sync_to_async(chat_sessions.load_session)(data.get('session_id'))
+        if chat_sessions.is_first_turn(session) and data.get('history'):
+            session = chat_sessions.session_from_history(data['history'])
 
-        if any(word in query_lower for word in ['career', 'job', 'opening', 'vacancy', 'work']):
-            return "BIFPCL offers various career opportunities. View current openings on our Careers page at /careers. We're always looking for talented individuals to join our team."
+        chatbot = ChatBotView()
+        fallback = sync_to_async(chatbot.get_fallback_response)
+        record = sync_to_async(chat_sessions.record_exchange)
 
-        if any(word in query_lower for word in ['contact', 'phone', 'email', 'address', 'office']):
-            return "Contact BIFPCL at:\n• Site Office: Rampal, Bagerhat - Phone: +880 2 968 1234\n• Corporate Office: 117 Kazi Nazrul Islam Ave, Dhaka\n• Email: info@bifpcl.com\n\nVisit /contact for more options."
+        async def reply(text, **extra):
+            await record(session_id, session, message, text)
+            return JsonResponse({'response': text, 'session_id': session_id, **extra})
 
-        if any(word in query_lower for word in ['environment', 'emission', 'pollution', 'green', 'sustainable']):
-            return "BIFPCL uses Ultra-Supercritical Technology for lower emissions and higher efficiency. We adhere to IFC guidelines and Equator Principles with advanced pollution control systems."
+        local_answer, confidence = await sync_to_async(retriever.answer)(message)
+        if local_answer and is_confident(confidence):
+            return await reply(local_answer, source='local')
 
-        if any(word in query_lower for word in ['hello', 'hi', 'hey', 'greet']):
-            return "Hello! Welcome to BIFPCL. I'm here to help you with information about our organization, the Maitree Power Project, tenders, careers, and more. What would you like to know?"
+        api_key = settings.GEMINI_API_KEY
+        if not api_key:
+            return await reply(await fallback(message), fallback=True)
 
-        if 'thank' in query_lower:
-            return "You're welcome! If you have any more questions about BIFPCL, feel free to ask."
+        cacheable = chat_sessions.is_first_turn(session)
+        if cacheable:
+            cached = await sync_to_async(answer_cache.get)(message)
+            if cached:
+                return await reply(cached['response'], cached=cached['match'])
 
-        return "Thank you for your question. For more information, please visit:\n• /tenders - Procurement opportunities\n• /careers - Job openings\n• /notices - Announcements\n• /contact - Get in touch\n\nIs there something specific about BIFPCL I can help you with?"
+        payload = chatbot.build_payload(message, session)
+        if data.get('stream'):
+            return self.stream_response(api_key, payload, message, session_id, session, cacheable, fallback)
+
+        try:
+            started = time.perf_counter()
+            response_text = await gemini.agenerate(api_key, payload)
+            if cacheable:
+                await sync_to_async(answer_cache.set)(message, response_text, (time.perf_counter() - started) * 1000)
+            return await reply(response_text)
+        except gemini.UpstreamUnavailable as e:
+            logger.warning(f"Gemini API skipped: {str(e)}")
+        except Exception as e:
+            logger.error(f"Gemini API error: {str(e)}")
+        return await reply(await fallback(message), fallback=True)
+
+    def stream_response(self, api_key, payload, message, session_id, session, cacheable, fallback):
+        """Relay Gemini's reply as server-sent events (see ChatBotView.stream_response)"""
+        record = sync_to_async(chat_sessions.record_exchange)
+
+        def sse(data):
+            return f"data: {json.dumps(data)}\n\n"
+
+        async def events():
+            parts = []
+            started = time.perf_counter()
+            try:
+                async for text in gemini.astream_generate(api_key, payload):
+                    parts.append(text)
+                    yield sse({'delta': text})
+                if not parts:
+                    raise Exception("No valid response from API")
+            except Exception as e:
+                logger.error(f"Gemini streaming error: {str(e)}")
+                if parts:
+                    yield sse({'done': True, 'error': True, 'session_id': session_id})
+                else:
+                    fallback_text = await fallback(message)
+                    await record(session_id, session, message, fallback_text)
+                    yield sse({'delta': fallback_text})
+                    yield sse({'done': True, 'fallback': True, 'session_id': session_id})
+                return
+
+            response_text = ''.join(parts)
+            if cacheable:
+                await sync_to_async(answer_cache.set)(message, response_text, (time.perf_counter() - started) * 1000)
+            await record(session_id, session, message, response_text)
+            yield sse({'done': True, 'session_id': session_id})
+
+        response = StreamingHttpResponse(events(), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
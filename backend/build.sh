@@ -13,6 +13,9 @@ python manage.py collectstatic --no-input --clear
 echo "==> Running database migrations..."
 python manage.py migrate --no-input
 
+echo "==> Creating the shared cache table..."
+python manage.py createcachetable
+
 echo "==> Creating superuser..."
 python manage.py shell -c "
 from django.contrib.auth import get_user_model;
@@ -33,4 +36,7 @@ if username and password:
 echo "==> Seeding database with images..."
 python manage.py seed_data --with-images
 
+echo "==> Publishing static API snapshots..."
+python manage.py publish_snapshots
+
 echo "==> Build completed successfully!"
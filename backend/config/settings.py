@@ -14,6 +14,19 @@ try:
 except ImportError:
     HAS_DJ_DATABASE_URL = False
 
+try:
+    import msgpack  # noqa: F401
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+# psycopg_pool (psycopg 3) enables Django's native PostgreSQL connection pool
+try:
+    import psycopg_pool  # noqa: F401
+    HAS_PSYCOPG_POOL = True
+except ImportError:
+    HAS_PSYCOPG_POOL = False
+
 load_dotenv()
 
 
@@ -77,6 +90,7 @@ JAZZMIN_SETTINGS = {
 }
 
 MIDDLEWARE = [
+    'api.profiling.ServerTimingMiddleware',  # First, so it times the whole stack
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # WhiteNoise - right after SecurityMiddleware
@@ -86,6 +100,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.replica.ReplicaPinMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -111,14 +126,46 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # DATABASE CONFIGURATION
 # =============================================================================
 DATABASE_URL = os.getenv('DATABASE_URL')
+
+# PostgreSQL connection pool (psycopg 3). Each gunicorn worker process owns
+# one pool, so keep workers x DB_POOL_MAX_SIZE below the server's
+# max_connections. A request waits up to DB_POOL_TIMEOUT seconds for a free
+# connection before failing. With DB_POOL off (or psycopg 2 installed),
+# connections persist per thread instead. Pool state is reported by
+# /api/cache/stats/.
+DB_POOL = os.getenv('DB_POOL', 'True').lower() == 'true' and HAS_PSYCOPG_POOL
+DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', '1'))
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', '4'))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '10'))
+
+# Set when connecting through PgBouncer in transaction mode. Server-side
+# cursors don't survive there, so .iterator() (e.g. the streaming exports)
+# fetches whole results instead. psycopg 3 already skips prepared statements.
+DB_PGBOUNCER = os.getenv('DB_PGBOUNCER', 'False').lower() == 'true'
+
+
+def _database(url):
+    """Settings for a database URL, pooled when it is PostgreSQL and DB_POOL is on."""
+    config = dj_database_url.parse(
+        url,
+        conn_max_age=0 if DB_POOL else 600,  # the pool replaces persistent connections
+        conn_health_checks=True,
+        ssl_require=not DEBUG,  # Require SSL in production
+    )
+    if config['ENGINE'] == 'django.db.backends.postgresql':
+        if DB_POOL:
+            config.setdefault('OPTIONS', {})['pool'] = {
+                'min_size': DB_POOL_MIN_SIZE,
+                'max_size': DB_POOL_MAX_SIZE,
+                'timeout': DB_POOL_TIMEOUT,
+            }
+        config['DISABLE_SERVER_SIDE_CURSORS'] = DB_PGBOUNCER
+    return config
+
+
 if DATABASE_URL and HAS_DJ_DATABASE_URL:
     DATABASES = {
-        'default': dj_database_url.config(
-            default=DATABASE_URL,
-            conn_max_age=600,
-            conn_health_checks=True,
-            ssl_require=not DEBUG,  # Require SSL in production
-        )
+        'default': _database(DATABASE_URL),
     }
 else:
     DATABASES = {
@@ -128,6 +175,54 @@ else:
         }
     }
 
+# Optional read replica for safe-method API reads (see api/replica.py).
+# Any dj-database-url URL works, e.g. sqlite:///replica.sqlite3 locally.
+REPLICA_DATABASE_URL = os.getenv('REPLICA_DATABASE_URL')
+if REPLICA_DATABASE_URL and HAS_DJ_DATABASE_URL:
+    DATABASES['replica'] = _database(REPLICA_DATABASE_URL)
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+
+DATABASE_ROUTERS = ['api.replica.PrimaryReplicaRouter']
+
+# Seconds reads stay on the primary after a write, per client and per model
+REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', '5'))
+
+# =============================================================================
+# CACHE CONFIGURATION
+# =============================================================================
+# Set REDIS_URL to share the cache across gunicorn workers. Without it each
+# worker keeps its own in-memory cache for response bodies, and the state that
+# must be the same in every worker (cache generations, chat sessions) goes to
+# the `shared` alias instead: a table in the main database, created by
+# `python manage.py createcachetable` (see build.sh).
+REDIS_URL = os.getenv('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'bifpcl-api',
+            'OPTIONS': {'MAX_ENTRIES': 5000},
+        },
+        'shared': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'api_shared_cache',
+            'OPTIONS': {'MAX_ENTRIES': 20000},
+        },
+    }
+
+# Cache alias for cross-worker state (see api/cache.py)
+API_SHARED_CACHE_ALIAS = 'default' if REDIS_URL else 'shared'
+
+# Seconds a cached API response may be served before it is rebuilt
+API_CACHE_TIMEOUT = int(os.getenv('API_CACHE_TIMEOUT', '300'))
+
 # =============================================================================
 # PASSWORD VALIDATION
 # =============================================================================
@@ -152,6 +247,24 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# =============================================================================
+# API SNAPSHOTS (static JSON copies of the read-only endpoints)
+# =============================================================================
+# Kept out of WhiteNoise: it indexes files once at startup and would serve a
+# rewritten current.json with stale headers. Versions are served by
+# api.views.serve_snapshot, or by a CDN when SNAPSHOT_URL points at one.
+SNAPSHOT_ROOT = BASE_DIR / 'snapshots'
+SNAPSHOT_URL = os.getenv('SNAPSHOT_URL', '/snapshots/')
+# Host the snapshots' absolute media URLs are built for, as in live responses
+SNAPSHOT_SITE_URL = os.getenv('SNAPSHOT_SITE_URL') or (
+    f'https://{CUSTOM_DOMAIN or RENDER_EXTERNAL_HOSTNAME}'
+    if CUSTOM_DOMAIN or RENDER_EXTERNAL_HOSTNAME else 'http://localhost:8000'
+)
+SNAPSHOT_KEEP_VERSIONS = int(os.getenv('SNAPSHOT_KEEP_VERSIONS', '3'))
+# Republish automatically (debounced) after content is saved or deleted
+SNAPSHOT_AUTO_PUBLISH = os.getenv('SNAPSHOT_AUTO_PUBLISH', 'False').lower() == 'true'
+SNAPSHOT_PUBLISH_DELAY = float(os.getenv('SNAPSHOT_PUBLISH_DELAY', '5'))
+
 # =============================================================================
 # MEDIA FILES & CLOUDINARY CONFIGURATION
 # =============================================================================
@@ -230,14 +343,31 @@ REST_FRAMEWORK = {
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
     ],
+    # JSON stays the default for clients that send no (or a wildcard) Accept;
+    # MessagePack is served on Accept: application/msgpack when installed
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-    ] if not DEBUG else [
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
+        'api.renderers.FastJSONRenderer',
+        *(['api.renderers.MessagePackRenderer'] if HAS_MSGPACK else []),
+        *(['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'rest_framework.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+        'api.parsers.MessagePackParser',
     ],
 }
 
+# Largest batch accepted by the admin /bulk/ and /reorder/ endpoints
+BULK_MAX_ITEMS = int(os.getenv('BULK_MAX_ITEMS', '500'))
+
+# Rows per transaction for streaming imports, and how many row errors to report
+IMPORT_BATCH_SIZE = int(os.getenv('IMPORT_BATCH_SIZE', '1000'))
+IMPORT_MAX_REPORTED_ERRORS = int(os.getenv('IMPORT_MAX_REPORTED_ERRORS', '200'))
+
+# Rows fetched per database round trip by the streaming CSV/NDJSON exports
+EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', '2000'))
+
 # =============================================================================
 # PRODUCTION SECURITY SETTINGS
 # =============================================================================
@@ -271,6 +401,49 @@ if not DEBUG:
 # GEMINI AI CONFIGURATION
 # =============================================================================
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
+GEMINI_MODEL = os.getenv('GEMINI_MODEL', 'gemini-2.5-flash')
+# Override to point the chatbot at a local stand-in (manage.py gemini_stub)
+GEMINI_API_BASE = os.getenv('GEMINI_API_BASE', 'https://generativelanguage.googleapis.com/v1beta')
+GEMINI_CONNECT_TIMEOUT = float(os.getenv('GEMINI_CONNECT_TIMEOUT', '5'))
+GEMINI_READ_TIMEOUT = float(os.getenv('GEMINI_READ_TIMEOUT', '30'))
+# In-flight Gemini calls allowed per process. Keep below the gunicorn thread
+# count (render.yaml runs 8 threads) so the content API always has threads.
+GEMINI_MAX_CONCURRENCY = int(os.getenv('GEMINI_MAX_CONCURRENCY', '4'))
+# Seconds a chat request may wait for a free slot before falling back, so a
+# short burst queues briefly instead of getting the canned reply at once
+GEMINI_QUEUE_TIMEOUT = float(os.getenv('GEMINI_QUEUE_TIMEOUT', '1.5'))
+# In-flight Gemini calls per process for the async chat view (ASGI)
+GEMINI_ASYNC_MAX_CONCURRENCY = int(os.getenv('GEMINI_ASYNC_MAX_CONCURRENCY', '200'))
+# Serve /api/chat/ from the async view; enable when running under ASGI. Also
+# lets the async view keep one httpx client per (long-lived) event loop.
+CHAT_ASYNC = os.getenv('CHAT_ASYNC', 'False').lower() == 'true'
+# Circuit breaker: consecutive failures (or calls slower than the limit)
+# before opening, and how long to stay open before a half-open probe
+GEMINI_BREAKER_FAILURES = int(os.getenv('GEMINI_BREAKER_FAILURES', '3'))
+GEMINI_SLOW_CALL_MS = float(os.getenv('GEMINI_SLOW_CALL_MS', '15000'))
+GEMINI_BREAKER_RESET_SECONDS = float(os.getenv('GEMINI_BREAKER_RESET_SECONDS', '30'))
+
+# Answer cache for first-turn chatbot questions
+CHAT_CACHE_TTL = int(os.getenv('CHAT_CACHE_TTL', '86400'))
+CHAT_CACHE_MAX_ENTRIES = int(os.getenv('CHAT_CACHE_MAX_ENTRIES', '500'))
+# Minimum TF-IDF cosine similarity for a paraphrase to reuse a cached answer
+CHAT_CACHE_SIMILARITY = float(os.getenv('CHAT_CACHE_SIMILARITY', '0.8'))
+# Local retrieval answers at or above this confidence skip the Gemini call
+CHAT_RETRIEVAL_CONFIDENCE = float(os.getenv('CHAT_RETRIEVAL_CONFIDENCE', '0.6'))
+# Server-side chat sessions: idle lifetime and prompt history budget (estimated tokens)
+CHAT_SESSION_TTL = int(os.getenv('CHAT_SESSION_TTL', '3600'))
+CHAT_HISTORY_TOKEN_BUDGET = int(os.getenv('CHAT_HISTORY_TOKEN_BUDGET', '1200'))
+CHAT_SUMMARY_TOKEN_BUDGET = int(os.getenv('CHAT_SUMMARY_TOKEN_BUDGET', '150'))
+
+# =============================================================================
+# REQUEST PROFILING (Server-Timing)
+# =============================================================================
+# Share of requests profiled (0 turns it off). Profiled responses carry a
+# Server-Timing header with query count, DB, serializer and render time;
+# those at or over either threshold are also logged (see api/profiling.py).
+SERVER_TIMING_SAMPLE_RATE = float(os.getenv('SERVER_TIMING_SAMPLE_RATE', '1' if DEBUG else '0.1'))
+SERVER_TIMING_LOG_MS = float(os.getenv('SERVER_TIMING_LOG_MS', '500'))
+SERVER_TIMING_LOG_QUERIES = int(os.getenv('SERVER_TIMING_LOG_QUERIES', '20'))
 
 # =============================================================================
 # LOGGING CONFIGURATION
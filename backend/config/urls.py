@@ -4,6 +4,7 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.urls import re_path
 from django.views.static import serve
+from api.views import serve_snapshot
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -12,6 +13,8 @@ urlpatterns = [
     re_path(r'^media/(?P<path>.*)$', serve, {
         'document_root': settings.MEDIA_ROOT,
     }),
+    # Published snapshot versions (the pointer is at /api/snapshots/current/)
+    re_path(r'^snapshots/(?P<path>.*)$', serve_snapshot),
 ]
 
 if settings.DEBUG:
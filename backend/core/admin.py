@@ -1,4 +1,6 @@
 from django.contrib import admin
+
+from api.exports import export_actions
 from .models import (
     CompanyInfo, Project, Director, NewsArticle,
     Career, JobApplication, Tender, ContactInquiry, CSRInitiative, Notice
@@ -52,6 +54,9 @@ class JobApplicationAdmin(admin.ModelAdmin):
     list_display = ['full_name', 'career', 'email', 'submitted_at', 'status']
     list_filter = ['status', 'career']
     readonly_fields = ['submitted_at']
+    date_hierarchy = 'submitted_at'
+    list_select_related = ['career']
+    actions = export_actions('applications')
 
 
 @admin.register(Tender)
@@ -66,6 +71,8 @@ class ContactInquiryAdmin(admin.ModelAdmin):
     list_display = ['full_name', 'category', 'email', 'submitted_at', 'is_resolved']
     list_filter = ['category', 'is_resolved']
     readonly_fields = ['submitted_at']
+    date_hierarchy = 'submitted_at'
+    actions = export_actions('inquiries')
 
 
 @admin.register(CSRInitiative)
@@ -0,0 +1,57 @@
+# Generated by Django 6.0.1 on 2026-10-16 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_add_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='career',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['id'], name='career_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['-is_featured', 'order', '-created_at'], name='gallery_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['category', '-is_featured', 'order', '-created_at'], name='gallery_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['-published_date'], name='news_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['category', '-published_date'], name='news_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['-published_date'], name='news_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-is_featured', '-published_date', 'order'], name='notice_active_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category', '-is_featured', '-published_date', 'order'], name='notice_active_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tender',
+            index=models.Index(fields=['-publication_date'], name='tender_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tender',
+            index=models.Index(fields=['status', '-publication_date'], name='tender_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tender',
+            index=models.Index(fields=['category', '-publication_date'], name='tender_category_idx'),
+        ),
+    ]
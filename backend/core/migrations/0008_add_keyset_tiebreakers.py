@@ -0,0 +1,93 @@
+# Generated by Django 6.0.1 on 2026-10-16 15:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_add_list_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='galleryimage',
+            name='gallery_feed_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='galleryimage',
+            name='gallery_category_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='newsarticle',
+            name='news_published_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='newsarticle',
+            name='news_category_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='newsarticle',
+            name='news_featured_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='notice',
+            name='notice_active_feed_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='notice',
+            name='notice_active_category_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tender',
+            name='tender_published_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tender',
+            name='tender_status_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tender',
+            name='tender_category_idx',
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['-is_featured', 'order', '-created_at', '-id'], name='gallery_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['category', '-is_featured', 'order', '-created_at', '-id'], name='gallery_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['-published_date', '-id'], name='news_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['category', '-published_date', '-id'], name='news_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['-published_date', '-id'], name='news_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-is_featured', '-published_date', 'order', '-id'], name='notice_active_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category', '-is_featured', '-published_date', 'order', '-id'], name='notice_active_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tender',
+            index=models.Index(fields=['-publication_date', '-id'], name='tender_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tender',
+            index=models.Index(fields=['status', '-publication_date', '-id'], name='tender_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tender',
+            index=models.Index(fields=['category', '-publication_date', '-id'], name='tender_category_idx'),
+        ),
+    ]
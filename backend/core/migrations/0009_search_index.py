@@ -0,0 +1,101 @@
+# Generated by Django 6.0.1 on 2026-10-16 16:40
+
+from django.db import migrations
+
+# The search table DDL and backfill are frozen here rather than imported from
+# api/search.py, so later changes to that module cannot change what this
+# migration does. The backfill mirrors the row builders in api/search.py as
+# they were when the table was introduced.
+SEARCH_TABLE = 'search_index'
+
+CREATE_SQL = {
+    'sqlite': [
+        f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+        "doc_type UNINDEXED, object_id UNINDEXED, url UNINDEXED, title, body, "
+        "tokenize='porter unicode61')"
+    ],
+    'postgresql': [
+        f"CREATE TABLE {SEARCH_TABLE} ("
+        "doc_type varchar(20) NOT NULL, object_id integer NOT NULL, url text NOT NULL, "
+        "title text NOT NULL, body text NOT NULL, "
+        "document tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', title), 'A') || "
+        "setweight(to_tsvector('english', body), 'B')) STORED, "
+        "PRIMARY KEY (doc_type, object_id))",
+        f"CREATE INDEX {SEARCH_TABLE}_document_idx ON {SEARCH_TABLE} USING gin (document)",
+    ],
+}
+
+
+def _label(column, choices):
+    """SQL for get_<column>_display()."""
+    whens = ' '.join(f"WHEN '{value}' THEN '{label}'" for value, label in choices)
+    return f"(CASE {column} {whens} ELSE {column} END)"
+
+
+def _join(*parts):
+    return " || ' ' || ".join(parts)
+
+
+NOTICE_CATEGORIES = [('general', 'General'), ('urgent', 'Urgent'), ('tender', 'Tender'), ('recruitment', 'Recruitment')]
+NEWS_CATEGORIES = [('press', 'Press Release'), ('event', 'Event'), ('in_the_news', 'In The News'), ('update', 'Update')]
+TENDER_CATEGORIES = [('mechanical', 'Mechanical'), ('electrical', 'Electrical'), ('civil', 'Civil'), ('it', 'IT Services')]
+TENDER_STATUSES = [('open', 'Open'), ('evaluation', 'Evaluation'), ('awarded', 'Awarded'), ('closed', 'Closed')]
+EMPLOYMENT_TYPES = [('full_time', 'Full Time'), ('contract', 'Contract')]
+
+# (doc_type, rowid code, table, url, body, WHERE)
+SOURCES = [
+    ('notice', 1, 'core_notice', "'/notices/' || slug",
+     _join(_label('category', NOTICE_CATEGORIES), 'excerpt', 'content'), 'is_active'),
+    ('news', 2, 'core_newsarticle', "'/media/' || slug",
+     _join(_label('category', NEWS_CATEGORIES), 'excerpt', 'content'), None),
+    ('tender', 3, 'core_tender', "'/tenders'",
+     _join('tender_id', _label('category', TENDER_CATEGORIES), _label('status', TENDER_STATUSES), 'description'),
+     None),
+    ('career', 4, 'core_career', "'/careers'",
+     _join('department', 'location', _label('employment_type', EMPLOYMENT_TYPES), 'description', 'requirements'),
+     'is_active'),
+]
+
+
+def backfill_sql(vendor):
+    """INSERT ... SELECT statements indexing every existing public row."""
+    statements = []
+    for doc_type, code, table, url, body, condition in SOURCES:
+        where = f' WHERE {condition}' if condition else ''
+        if vendor == 'sqlite':
+            # The FTS rowid encodes (type, pk) as in api/search.py
+            statements.append(
+                f"INSERT INTO {SEARCH_TABLE} (rowid, doc_type, object_id, url, title, body) "
+                f"SELECT id * 8 + {code}, '{doc_type}', id, {url}, title, {body} FROM {table}{where}"
+            )
+        else:
+            statements.append(
+                f"INSERT INTO {SEARCH_TABLE} (doc_type, object_id, url, title, body) "
+                f"SELECT '{doc_type}', id, {url}, title, {body} FROM {table}{where}"
+            )
+    return statements
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor not in CREATE_SQL:
+        return
+    for sql in CREATE_SQL[vendor] + backfill_sql(vendor):
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in CREATE_SQL:
+        schema_editor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_add_keyset_tiebreakers'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
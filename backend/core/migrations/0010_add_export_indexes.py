@@ -0,0 +1,25 @@
+# Generated by Django 6.0.1 on 2026-10-16 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactinquiry',
+            index=models.Index(fields=['submitted_at', 'id'], name='inquiry_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['submitted_at', 'id'], name='application_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['status', 'submitted_at', 'id'], name='application_status_idx'),
+        ),
+    ]
@@ -1,5 +1,18 @@
 from django.db import models
 
+from .slugs import save_with_unique_slug
+
+
+class UniqueSlugMixin:
+    """Fill a blank `slug` from the `slug_source` field with the next free suffix"""
+    slug_source = 'title'
+
+    def save(self, *args, **kwargs):
+        if self.slug:
+            return super().save(*args, **kwargs)
+        parent_save = super().save
+        return save_with_unique_slug(self, getattr(self, self.slug_source), lambda: parent_save(*args, **kwargs))
+
 
 class CompanyInfo(models.Model):
     """Singleton model for company information"""
@@ -17,8 +30,9 @@ class CompanyInfo(models.Model):
         return self.name
 
 
-class Project(models.Model):
+class Project(UniqueSlugMixin, models.Model):
     """Power plant projects"""
+    slug_source = 'name'
     STATUS_CHOICES = [
         ('operational', 'Operational'),
         ('construction', 'Under Construction'),
@@ -37,6 +51,7 @@ class Project(models.Model):
     longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
     efficiency_percent = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
@@ -51,6 +66,7 @@ class Director(models.Model):
     bio = models.TextField()
     order = models.IntegerField(default=0)
     is_chairman = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['order']
@@ -59,7 +75,7 @@ class Director(models.Model):
         return self.name
 
 
-class NewsArticle(models.Model):
+class NewsArticle(UniqueSlugMixin, models.Model):
     """Press releases and news"""
     CATEGORY_CHOICES = [
         ('press', 'Press Release'),
@@ -76,10 +92,16 @@ class NewsArticle(models.Model):
     image = models.ImageField(upload_to='news/', blank=True)
     published_date = models.DateField()
     is_featured = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-published_date']
         verbose_name_plural = "News Articles"
+        indexes = [
+            models.Index(fields=['-published_date', '-id'], name='news_published_idx'),
+            models.Index(fields=['category', '-published_date', '-id'], name='news_category_idx'),
+            models.Index(fields=['-published_date', '-id'], condition=models.Q(is_featured=True), name='news_featured_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -102,6 +124,13 @@ class Career(models.Model):
     deadline = models.DateField()
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Public list: Career.objects.filter(is_active=True)
+            models.Index(fields=['id'], condition=models.Q(is_active=True), name='career_active_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -126,6 +155,13 @@ class JobApplication(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
 
+    class Meta:
+        indexes = [
+            # Streaming exports: date range (optionally per status) in submission order
+            models.Index(fields=['submitted_at', 'id'], name='application_submitted_idx'),
+            models.Index(fields=['status', 'submitted_at', 'id'], name='application_status_idx'),
+        ]
+
     def __str__(self):
         return f"{self.full_name} - {self.career.title}"
 
@@ -154,9 +190,15 @@ class Tender(models.Model):
     deadline = models.DateField()
     value_range = models.CharField(max_length=100, blank=True)
     document = models.FileField(upload_to='tenders/', blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-publication_date']
+        indexes = [
+            models.Index(fields=['-publication_date', '-id'], name='tender_published_idx'),
+            models.Index(fields=['status', '-publication_date', '-id'], name='tender_status_idx'),
+            models.Index(fields=['category', '-publication_date', '-id'], name='tender_category_idx'),
+        ]
 
     def __str__(self):
         return f"{self.tender_id} - {self.title}"
@@ -181,6 +223,9 @@ class ContactInquiry(models.Model):
 
     class Meta:
         verbose_name_plural = "Contact Inquiries"
+        indexes = [
+            models.Index(fields=['submitted_at', 'id'], name='inquiry_submitted_idx'),
+        ]
 
     def __str__(self):
         return f"{self.full_name} - {self.category}"
@@ -201,6 +246,7 @@ class CSRInitiative(models.Model):
     impact_metric = models.CharField(max_length=100)
     image = models.ImageField(upload_to='csr/', blank=True)
     order = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['order']
@@ -211,7 +257,7 @@ class CSRInitiative(models.Model):
         return self.title
 
 
-class Notice(models.Model):
+class Notice(UniqueSlugMixin, models.Model):
     """Notice Board"""
     CATEGORY_CHOICES = [
         ('general', 'General'),
@@ -239,18 +285,18 @@ class Notice(models.Model):
         ordering = ['-is_featured', '-published_date', 'order']
         verbose_name = "Notice"
         verbose_name_plural = "Notices"
-
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            from django.utils.text import slugify
-            base_slug = slugify(self.title)[:450]
-            slug = base_slug
-            counter = 1
-            while Notice.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
-        super().save(*args, **kwargs)
+        # The public API only lists active notices, so both indexes are partial.
+        # Trailing -id is the keyset pagination tie-breaker (api/pagination.py).
+        indexes = [
+            models.Index(
+                fields=['-is_featured', '-published_date', 'order', '-id'],
+                condition=models.Q(is_active=True), name='notice_active_feed_idx',
+            ),
+            models.Index(
+                fields=['category', '-is_featured', '-published_date', 'order', '-id'],
+                condition=models.Q(is_active=True), name='notice_active_category_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -281,7 +327,7 @@ class SiteSettings(models.Model):
         return obj
 
 
-class GalleryImage(models.Model):
+class GalleryImage(UniqueSlugMixin, models.Model):
     """Media Gallery for photos and videos"""
     CATEGORY_CHOICES = [
         ('project', 'Project Photos'),
@@ -304,23 +350,16 @@ class GalleryImage(models.Model):
     order = models.IntegerField(default=0)
     is_featured = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-is_featured', 'order', '-created_at']
         verbose_name = "Gallery Image"
         verbose_name_plural = "Gallery Images"
-
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            from django.utils.text import slugify
-            base_slug = slugify(self.title)[:200]
-            slug = base_slug
-            counter = 1
-            while GalleryImage.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
-        super().save(*args, **kwargs)
+        indexes = [
+            models.Index(fields=['-is_featured', 'order', '-created_at', '-id'], name='gallery_feed_idx'),
+            models.Index(fields=['category', '-is_featured', 'order', '-created_at', '-id'], name='gallery_category_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -0,0 +1,107 @@
+"""
+Unique slug allocation shared by every model with a `slug` field.
+
+allocate_slug() finds the next free "-N" suffix for a base slug in a single
+aggregate query (an indexed prefix match plus the max numeric suffix), so the
+50th "tender-notice" costs one query instead of fifty. Two concurrent saves
+can still compute the same slug; save_with_unique_slug() runs the insert in
+a savepoint and, if it loses the race on the unique constraint, allocates
+again and retries. bulk_create_with_unique_slugs() does the same for a batch of
+new rows.
+"""
+import re
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, IntegerField, Max, Q
+from django.db.models.functions import Cast, Substr
+from django.utils.text import slugify
+
+# Room kept at the end of the column for a "-N" suffix
+SUFFIX_RESERVE = 8
+MAX_ATTEMPTS = 5
+
+
+def base_slug(model, text, field='slug'):
+    max_length = model._meta.get_field(field).max_length
+    return slugify(text)[:max_length - SUFFIX_RESERVE].strip('-') or model._meta.model_name
+
+
+def _taken(model, base, field, exclude_pk=None):
+    """(is `base` itself in use, highest N of any `base-N` in use or 0)"""
+    queryset = model._default_manager.filter(**{f'{field}__startswith': base})
+    if exclude_pk is not None:
+        queryset = queryset.exclude(pk=exclude_pk)
+    taken = queryset.aggregate(
+        exact=Count('pk', filter=Q(**{field: base})),
+        top=Max(
+            Cast(Substr(field, len(base) + 2), IntegerField()),
+            filter=Q(**{f'{field}__regex': rf'^{re.escape(base)}-[0-9]+$'}),
+        ),
+    )
+    return bool(taken['exact']), taken['top'] or 0
+
+
+def allocate_slug(model, text, field='slug', exclude_pk=None):
+    """Return `base` if free, else `base-N` with N one past the highest suffix in use"""
+    base = base_slug(model, text, field)
+    exact, top = _taken(model, base, field, exclude_pk)
+    if not exact:
+        return base
+    return f"{base}-{top + 1}"
+
+
+def allocate_slugs(model, texts, field='slug'):
+    """
+    Slugs for a batch of new rows, unique among themselves as well as in the
+    table, with one aggregate query per distinct base.
+    """
+    state = {}
+    slugs = []
+    for text in texts:
+        base = base_slug(model, text, field)
+        if base not in state:
+            state[base] = list(_taken(model, base, field))
+        exact, top = state[base]
+        if not exact:
+            state[base][0] = True
+            slugs.append(base)
+        else:
+            state[base][1] = top + 1
+            slugs.append(f"{base}-{top + 1}")
+    return slugs
+
+
+def save_with_unique_slug(instance, text, save, field='slug'):
+    """
+    Allocate a slug for `instance` from `text` and call save(), retrying with
+    a fresh allocation if a concurrent insert claimed the same slug first.
+    """
+    model = type(instance)
+    for attempt in range(MAX_ATTEMPTS):
+        slug = allocate_slug(model, text, field, exclude_pk=instance.pk)
+        setattr(instance, field, slug)
+        try:
+            with transaction.atomic():
+                return save()
+        except IntegrityError:
+            lost_race = model._default_manager.filter(**{field: slug}).exclude(pk=instance.pk).exists()
+            if not lost_race or attempt == MAX_ATTEMPTS - 1:
+                raise
+
+
+def bulk_create_with_unique_slugs(model, objs, texts, field='slug'):
+    """
+    Insert new rows with slugs allocated from `texts` (one per row),
+    retrying with fresh allocations if a concurrent insert claimed one first.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        for obj, slug in zip(objs, allocate_slugs(model, texts, field)):
+            setattr(obj, field, slug)
+        try:
+            with transaction.atomic():
+                return model._default_manager.bulk_create(objs)
+        except IntegrityError:
+            slugs = [getattr(obj, field) for obj in objs]
+            lost_race = model._default_manager.filter(**{f'{field}__in': slugs}).exists()
+            if not lost_race or attempt == MAX_ATTEMPTS - 1:
+                raise
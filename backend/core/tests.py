@@ -1,3 +1,71 @@
+import datetime
+from unittest import mock
+
 from django.test import TestCase
 
-# Create your tests here.
+from . import slugs
+from .models import Notice, Project
+
+
+def make_notice(title, slug=''):
+    return Notice.objects.create(title=title, slug=slug, published_date=datetime.date(2026, 1, 1))
+
+
+def make_project(name):
+    return Project.objects.create(
+        name=name, location='Rampal', capacity_mw=1320, technology='Ultra-supercritical', description='Coal',
+    )
+
+
+class SlugAllocationTests(TestCase):
+    def test_next_suffix_follows_the_highest_in_use(self):
+        make_notice('Foo', slug='foo')
+        make_notice('Foo', slug='foo-3')
+        self.assertEqual(make_notice('Foo').slug, 'foo-4')
+
+    def test_a_free_base_is_used_as_is(self):
+        make_notice('Foo', slug='foo-2')
+        self.assertEqual(make_notice('Foo').slug, 'foo')
+
+    def test_hyphenated_titles_are_not_suffixes(self):
+        make_notice('Foo', slug='foo')
+        make_notice('Foo bar', slug='foo-bar')
+        make_notice('Foo 7 bar', slug='foo-7-bar')
+        self.assertEqual(make_notice('Foo').slug, 'foo-1')
+
+    def test_base_slug_is_truncated_to_leave_room_for_a_suffix(self):
+        name = 'Maitree super thermal power project unit one and two'
+        first, second = make_project(name), make_project(name)
+        self.assertEqual(first.slug, 'maitree-super-thermal-power-project-unit-o')
+        self.assertEqual(len(first.slug), 42)
+        self.assertEqual(second.slug, f'{first.slug}-1')
+
+    def test_batch_slugs_are_unique_among_themselves(self):
+        make_notice('Holiday', slug='holiday')
+        self.assertEqual(
+            slugs.allocate_slugs(Notice, ['Holiday', 'Holiday', 'Outage']),
+            ['holiday-1', 'holiday-2', 'outage'],
+        )
+
+    def test_lost_race_retries_inside_a_savepoint(self):
+        make_notice('Foo', slug='foo')
+        allocate = slugs.allocate_slug
+        calls = []
+
+        def stale_then_fresh(*args, **kwargs):
+            # The first allocation ran before a concurrent insert of "foo"
+            calls.append(args)
+            return 'foo' if len(calls) == 1 else allocate(*args, **kwargs)
+
+        with mock.patch.object(slugs, 'allocate_slug', side_effect=stale_then_fresh):
+            notice = make_notice('Foo')
+        self.assertEqual(notice.slug, 'foo-1')
+        self.assertEqual(len(calls), 2)
+        # The failed insert only rolled back its savepoint
+        self.assertEqual(Notice.objects.count(), 2)
+
+    def test_other_integrity_errors_are_not_retried(self):
+        with mock.patch.object(slugs, 'allocate_slug', return_value='fresh') as allocate, \
+                self.assertRaises(slugs.IntegrityError):
+            slugs.save_with_unique_slug(Notice(title='Foo'), 'Foo', mock.Mock(side_effect=slugs.IntegrityError))
+        self.assertEqual(allocate.call_count, 1)
@@ -34,6 +34,7 @@ export function ChatBot() {
     const [messages, setMessages] = useState<Message[]>([welcomeMessage]);
     const [inputValue, setInputValue] = useState('');
     const [isTyping, setIsTyping] = useState(false);
+    const sessionIdRef = useRef<string | undefined>(undefined);
     const messagesEndRef = useRef<HTMLDivElement>(null);
     const inputRef = useRef<HTMLInputElement>(null);
 
@@ -66,25 +67,36 @@ export function ChatBot() {
         setIsTyping(true);
 
         try {
-            // Prepare conversation history for API (exclude welcome message)
-            const history = messages
-                .filter(m => m.id !== 'welcome')
-                .map(m => ({
-                    role: m.role,
-                    content: m.content,
-                }));
-
-            // Call the API
-            const response = await chatApi.sendMessage(content.trim(), history);
-
-            const assistantMessage: Message = {
-                id: `assistant-${Date.now()}`,
-                content: response.response,
-                role: 'assistant',
-                timestamp: new Date(),
+            // Stream the reply into a placeholder message as it arrives
+            const assistantId = `assistant-${Date.now()}`;
+            let received = false;
+            const appendDelta = (delta: string) => {
+                if (!received) {
+                    received = true;
+                    setIsTyping(false);
+                    setMessages(prev => [...prev, {
+                        id: assistantId,
+                        content: delta,
+                        role: 'assistant',
+                        timestamp: new Date(),
+                    }]);
+                    return;
+                }
+                setMessages(prev => prev.map(m =>
+                    m.id === assistantId ? { ...m, content: m.content + delta } : m
+                ));
             };
 
-            setMessages(prev => [...prev, assistantMessage]);
+            try {
+                // The server keeps the conversation; only the new message is sent
+                sessionIdRef.current = await chatApi.streamMessage(content.trim(), sessionIdRef.current, appendDelta);
+            } catch (streamError) {
+                // Fall back to the plain JSON endpoint if nothing was streamed
+                if (received) throw streamError;
+                const response = await chatApi.sendMessage(content.trim(), sessionIdRef.current);
+                sessionIdRef.current = response.session_id;
+                appendDelta(response.response);
+            }
         } catch (error) {
             console.error('Chat API error:', error);
             // Show error message
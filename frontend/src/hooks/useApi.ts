@@ -1,12 +1,23 @@
 import { useQuery } from '@tanstack/react-query';
 import {
     companyApi, projectsApi, directorsApi, newsApi,
-    careersApi, tendersApi, csrApi, noticesApi, galleryApi
+    careersApi, tendersApi, csrApi, noticesApi, galleryApi, homeApi, searchApi
 } from '../services/api';
+import type { SearchResultType } from '../types';
 
 export const useCompanyInfo = () =>
     useQuery({ queryKey: ['company'], queryFn: companyApi.getInfo });
 
+export const useHomeBundle = () =>
+    useQuery({ queryKey: ['home'], queryFn: homeApi.getBundle });
+
+export const useSearch = (q: string, types?: SearchResultType[]) =>
+    useQuery({
+        queryKey: ['search', q, types],
+        queryFn: () => searchApi.search(q, types),
+        enabled: q.trim().length >= 2,
+    });
+
 export const useProjects = () =>
     useQuery({ queryKey: ['projects'], queryFn: projectsApi.getAll });
 
@@ -2,7 +2,7 @@ import { useState, useEffect, useCallback } from 'react';
 import { Link } from 'react-router-dom';
 import { Zap, Users, Leaf, MapPin, Calendar, ChevronRight, ArrowRight, ChevronLeft, Briefcase, Newspaper, Clock, ExternalLink, TrendingUp } from 'lucide-react';
 import { Button, Card, LoadingSpinner, ProjectLocationMap, NoticeBoard } from '../components/ui';
-import { useDirectors, useCSRInitiatives, useNotices, useNews, useTenders } from '../hooks/useApi';
+import { useHomeBundle } from '../hooks/useApi';
 import { getMediaUrl } from '../services/api';
 
 // Hero slides data
@@ -37,14 +37,17 @@ export function HomePage() {
     const [currentSlide, setCurrentSlide] = useState(0);
     const [isAutoPlaying, setIsAutoPlaying] = useState(true);
 
-    const { data: directors } = useDirectors();
-    const { data: csrInitiatives, isLoading: csrLoading } = useCSRInitiatives();
-    const { data: notices, isLoading: noticesLoading } = useNotices();
-    const { data: news, isLoading: newsLoading } = useNews();
-    const { data: tenders, isLoading: tendersLoading } = useTenders();
-
-    const recentNews = news?.slice(0, 4);
-    const openTenders = tenders?.filter(t => t.status === 'open').slice(0, 3);
+    // All homepage sections arrive in a single /api/home/ request
+    const { data: home, isLoading } = useHomeBundle();
+    const directors = home?.directors;
+    const csrInitiatives = home?.csr;
+    const notices = home?.notices;
+    const recentNews = home?.news;
+    const openTenders = home?.open_tenders;
+    const csrLoading = isLoading;
+    const noticesLoading = isLoading;
+    const newsLoading = isLoading;
+    const tendersLoading = isLoading;
 
     const newsCategoryConfig: Record<string, { label: string; icon: typeof Newspaper; color: string; bgColor: string }> = {
         press: { label: 'Press Release', icon: Newspaper, color: 'text-primary-light', bgColor: 'bg-primary/20' },
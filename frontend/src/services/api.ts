@@ -1,7 +1,8 @@
 import axios from 'axios';
 import type {
     CompanyInfo, Project, Director, NewsArticle,
-    Career, Tender, CSRInitiative, ContactFormData, Notice, GalleryImage, SiteSettings
+    Career, Tender, CSRInitiative, ContactFormData, Notice, GalleryImage, SiteSettings,
+    HomeBundle, SearchResponse, SearchResultType
 } from '../types';
 
 // API Base URL (without /api suffix for media URLs)
@@ -39,11 +40,41 @@ interface PaginatedResponse<T> {
 // Helper to extract results from paginated response
 const getResults = <T>(response: { data: PaginatedResponse<T> }): T[] => response.data.results;
 
+// Bulk admin endpoints: a whole batch in one request and one transaction.
+// Invalid batches are rejected with one error object per item.
+const bulkApi = <T>(resource: string) => ({
+    bulkCreate: (items: Partial<T>[]) =>
+        api.post<T[]>(`/${resource}/bulk/`, items).then(res => res.data),
+    bulkUpdate: (items: (Partial<T> & { id: number })[]) =>
+        api.patch<T[]>(`/${resource}/bulk/`, items).then(res => res.data),
+    bulkDelete: (ids: number[]) =>
+        api.delete<{ deleted: number }>(`/${resource}/bulk/`, { data: { ids } }).then(res => res.data),
+});
+
+// Rewrites the `order` field so rows appear in the given id order
+const reorderApi = (resource: string) => ({
+    reorder: (ids: number[]) =>
+        api.post<{ updated: number }>(`/${resource}/reorder/`, { ids }).then(res => res.data),
+});
+
 // Company
 export const companyApi = {
     getInfo: () => api.get<CompanyInfo>('/company/').then(res => res.data),
 };
 
+// Homepage bundle (all homepage sections in one request)
+export const homeApi = {
+    getBundle: () => api.get<HomeBundle>('/home/').then(res => res.data),
+};
+
+// Full-text search
+export const searchApi = {
+    search: (q: string, types?: SearchResultType[]) =>
+        api.get<SearchResponse>('/search/', {
+            params: { q, type: types?.length ? types.join(',') : undefined }
+        }).then(res => res.data),
+};
+
 // Projects
 export const projectsApi = {
     getAll: () => api.get<PaginatedResponse<Project>>('/projects/').then(getResults),
@@ -55,6 +86,7 @@ export const projectsApi = {
         headers: { 'Content-Type': 'multipart/form-data' }
     }).then(res => res.data),
     delete: (id: number) => api.delete(`/projects/${id}/`),
+    ...bulkApi<Project>('projects'),
 };
 
 // Directors
@@ -67,6 +99,8 @@ export const directorsApi = {
         headers: { 'Content-Type': 'multipart/form-data' }
     }).then(res => res.data),
     delete: (id: number) => api.delete(`/directors/${id}/`),
+    ...bulkApi<Director>('directors'),
+    ...reorderApi('directors'),
 };
 
 // News
@@ -81,6 +115,7 @@ export const newsApi = {
         headers: { 'Content-Type': 'multipart/form-data' }
     }).then(res => res.data),
     delete: (id: number) => api.delete(`/news/${id}/`),
+    ...bulkApi<NewsArticle>('news'),
 };
 
 // Careers
@@ -93,6 +128,7 @@ export const careersApi = {
     create: (data: Career) => api.post<Career>('/careers/', data).then(res => res.data),
     update: (id: number, data: Career) => api.patch<Career>(`/careers/${id}/`, data).then(res => res.data),
     delete: (id: number) => api.delete(`/careers/${id}/`),
+    ...bulkApi<Career>('careers'),
 };
 
 // Tenders
@@ -106,11 +142,14 @@ export const tendersApi = {
         headers: { 'Content-Type': 'multipart/form-data' }
     }).then(res => res.data),
     delete: (id: number) => api.delete(`/tenders/${id}/`),
+    ...bulkApi<Tender>('tenders'),
 };
 
 // CSR
 export const csrApi = {
     getAll: () => api.get<PaginatedResponse<CSRInitiative>>('/csr/').then(getResults),
+    ...bulkApi<CSRInitiative>('csr'),
+    ...reorderApi('csr'),
 };
 
 // Notices
@@ -126,6 +165,8 @@ export const noticesApi = {
         headers: { 'Content-Type': 'multipart/form-data' }
     }).then(res => res.data),
     delete: (id: number) => api.delete(`/notices/${id}/`),
+    ...bulkApi<Notice>('notices'),
+    ...reorderApi('notices'),
 };
 
 // Gallery
@@ -141,6 +182,8 @@ export const galleryApi = {
         headers: { 'Content-Type': 'multipart/form-data' }
     }).then(res => res.data),
     delete: (id: number) => api.delete(`/gallery/${id}/`),
+    ...bulkApi<GalleryImage>('gallery'),
+    ...reorderApi('gallery'),
 };
 
 // Contact
@@ -157,17 +200,62 @@ export const siteSettingsApi = {
 };
 
 // ChatBot API
-interface ChatMessage {
-    role: 'user' | 'assistant';
-    content: string;
-}
-
 interface ChatResponse {
     response: string;
+    session_id: string;
+    fallback?: boolean;
+}
+
+interface ChatStreamEvent {
+    delta?: string;
+    done?: boolean;
     fallback?: boolean;
+    error?: boolean;
+    session_id?: string;
 }
 
 export const chatApi = {
-    sendMessage: (message: string, history: ChatMessage[]) =>
-        api.post<ChatResponse>('/chat/', { message, history }).then(res => res.data),
+    /** The conversation so far is kept server-side under session_id. */
+    sendMessage: (message: string, sessionId?: string) =>
+        api.post<ChatResponse>('/chat/', { message, session_id: sessionId }).then(res => res.data),
+
+    /**
+     * Streams a reply over server-sent events, calling onDelta for each chunk.
+     * Replies the server sends as plain JSON (cached, local or fallback answers)
+     * arrive as a single onDelta call, so callers handle both the same way.
+     * Resolves to the session ID to send with the next message.
+     */
+    streamMessage: async (message: string, sessionId: string | undefined, onDelta: (text: string) => void) => {
+        const res = await fetch(`${API_BASE}/chat/`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ message, session_id: sessionId, stream: true }),
+        });
+        if (!res.ok) throw new Error(`Chat API returned ${res.status}`);
+
+        if (!res.body || !res.headers.get('Content-Type')?.includes('text/event-stream')) {
+            const data: ChatResponse = await res.json();
+            onDelta(data.response);
+            return data.session_id;
+        }
+
+        const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+        let buffer = '';
+        let nextSessionId = sessionId;
+        for (;;) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += value;
+            const events = buffer.split('\n\n');
+            buffer = events.pop() ?? '';
+            for (const event of events) {
+                const line = event.split('\n').find(l => l.startsWith('data:'));
+                if (!line) continue;
+                const data: ChatStreamEvent = JSON.parse(line.slice('data:'.length));
+                if (data.delta) onDelta(data.delta);
+                if (data.session_id) nextSessionId = data.session_id;
+            }
+        }
+        return nextSessionId;
+    },
 };
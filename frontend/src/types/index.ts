@@ -40,7 +40,7 @@ export interface NewsArticle {
     slug: string;
     category: 'press' | 'event' | 'in_the_news' | 'update';
     excerpt: string;
-    content: string;
+    content?: string;  // detail only; list responses omit it
     image: string;
     published_date: string;
     is_featured: boolean;
@@ -140,3 +140,35 @@ export interface SiteSettings {
     show_certificate_modal: boolean;
     updated_at: string;
 }
+
+export interface HomeBundle {
+    company: CompanyInfo;
+    settings: SiteSettings;
+    projects: Project[];
+    directors: Director[];
+    news: NewsArticle[];
+    featured_news: NewsArticle[];
+    notices: Notice[];
+    featured_notices: Notice[];
+    featured_gallery: GalleryImage[];
+    csr: CSRInitiative[];
+    open_tenders: Tender[];
+}
+
+export type SearchResultType = 'notice' | 'news' | 'tender' | 'career';
+
+export interface SearchResult {
+    type: SearchResultType;
+    id: number;
+    url: string;
+    title: string;   // HTML-escaped, matches wrapped in <mark>
+    snippet: string; // HTML-escaped, matches wrapped in <mark>
+    score: number;
+}
+
+export interface SearchResponse {
+    query: string;
+    count: number;
+    facets: Record<SearchResultType, number>;
+    results: SearchResult[];
+}